@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.utils.html import format_html
 from .models import CustomUser
+from .principal import invalidate_principals
 from core.admin_filters import ActiveStatusFilter, StaffStatusFilter
 
 @admin.register(CustomUser)
@@ -89,13 +90,19 @@ class CustomUserAdmin(UserAdmin):
     
     def activate_users(self, request, queryset):
         """Activate selected users"""
+        # update() sinyal göndermez; id'ler önceden alınır (filtreli queryset update sonrası boş kalabilir)
+        user_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(is_active=True)
+        invalidate_principals(user_ids)
         self.message_user(request, f'{updated} kullanıcı aktif hale getirildi.')
     activate_users.short_description = '✅ Seçili kullanıcıları aktif et'
     
     def deactivate_users(self, request, queryset):
         """Deactivate selected users (soft delete)"""
+        # update() sinyal göndermez; id'ler önceden alınır (filtreli queryset update sonrası boş kalabilir)
+        user_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(is_active=False)
+        invalidate_principals(user_ids)
         self.message_user(request, f'{updated} kullanıcı pasif hale getirildi.')
     deactivate_users.short_description = '🚫 Seçili kullanıcıları pasif et'
     
@@ -8,6 +8,7 @@ from django.urls import reverse
 from core.utils import generate_secure_password, log_activity
 from core.models import ProvisionedCredential
 from .models import CustomUser
+from .principal import invalidate_principals
 from core.admin_filters import ActiveStatusFilter, SuperuserFilter
 
 User = get_user_model()
@@ -270,13 +271,19 @@ class AdminUserManagementAdmin(admin.ModelAdmin):
     
     def activate_admins(self, request, queryset):
         """Toplu aktifleştirme"""
+        # update() sinyal göndermez; id'ler önceden alınır (filtreli queryset update sonrası boş kalabilir)
+        user_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(is_active=True)
+        invalidate_principals(user_ids)
         self.message_user(request, f'{updated} yönetici aktifleştirildi.')
     activate_admins.short_description = '✅ Seçili yöneticileri aktifleştir'
     
     def deactivate_admins(self, request, queryset):
         """Toplu pasifleştirme"""
+        # update() sinyal göndermez; id'ler önceden alınır (filtreli queryset update sonrası boş kalabilir)
+        user_ids = list(queryset.values_list('pk', flat=True))
         updated = queryset.update(is_active=False)
+        invalidate_principals(user_ids)
         self.message_user(request, f'{updated} yönetici pasifleştirildi.')
     deactivate_admins.short_description = '❌ Seçili yöneticileri pasifleştir'
 
@@ -8,4 +8,5 @@ class AccountsConfig(AppConfig):
     def ready(self):
         # Import admin modules to ensure they are registered
         import accounts.admin
-        import accounts.admin_management
\ No newline at end of file
+        import accounts.admin_management
+        import accounts.signals  # noqa: F401 - cached principal invalidation
\ No newline at end of file
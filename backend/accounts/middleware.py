@@ -1,5 +1,20 @@
 from django.shortcuts import redirect
 from django.contrib import messages
+from django.utils.functional import SimpleLazyObject
+
+from .principal import principal_for
+
+
+class PrincipalMiddleware:
+    """Sets request.principal (accounts.principal) after AuthenticationMiddleware"""
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        request.principal = SimpleLazyObject(lambda: principal_for(request.user))
+        return self.get_response(request)
+
 
 class UserTypeMiddleware:
     """Redirects users to appropriate dashboard based on user_type"""
@@ -11,17 +26,22 @@ class UserTypeMiddleware:
     
     def __init__(self, get_response):
         self.get_response = get_response
+        # Kullanıcı sadece korunan yollarda yüklenir
+        self.prefixes = tuple(self.ROUTE_MAPPINGS)
     
     def __call__(self, request):
         return self.get_response(request)
     
     def process_view(self, request, view_func, view_args, view_kwargs):
-        if not request.user.is_authenticated:
+        if not request.path.startswith(self.prefixes):
+            return None
+        principal = request.principal
+        if not principal.is_authenticated:
             return None
             
         for path, (required_type, redirect_to) in self.ROUTE_MAPPINGS.items():
-            if request.path.startswith(path) and request.user.user_type != required_type:
+            if request.path.startswith(path) and principal.user_type != required_type:
                 messages.error(request, 'Bu sayfaya erişim yetkiniz yok.')
                 return redirect(redirect_to)
         
-        return None
\ No newline at end of file
+        return None
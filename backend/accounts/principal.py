@@ -0,0 +1,116 @@
+"""
+Request-scoped principal: who is asking, loaded once
+
+Authorization (UserTypeMiddleware, FirmStatusMiddleware, firm views) needs
+the user type and, for firm users, the firm and its status. PrincipalBackend
+loads the user together with its firm (``select_related('firm')``) and keeps
+the pair in the cache under a per-user version tag (core.invalidation), so an
+authenticated request resolves ``request.user`` and ``request.user.firm``
+without a query.
+
+The cached copy is dropped after any change to the user or the firm: model
+signals (accounts.signals), and ``invalidate_principals`` for admin bulk
+actions that use ``queryset.update()`` (FirmAdmin.set_inactive...).
+
+``request.principal`` (PrincipalMiddleware) is a small read-only view of
+that user for checks that do not need the model instance.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+
+from core.invalidation import get_with_versions, invalidate_tags
+
+
+USER_TIMEOUT = 60 * 15
+
+
+def _tag(user_id):
+    return f'principal:{user_id}'
+
+
+class Principal:
+    """User type and firm of the requesting user"""
+
+    __slots__ = ('user_id', 'user_type', 'is_staff', 'is_superuser', 'firm_id', 'firm_status')
+
+    def __init__(self, user_id=None, user_type='', is_staff=False, is_superuser=False, firm_id=None, firm_status=None):
+        self.user_id = user_id
+        self.user_type = user_type
+        self.is_staff = is_staff
+        self.is_superuser = is_superuser
+        self.firm_id = firm_id
+        self.firm_status = firm_status
+
+    @property
+    def is_authenticated(self):
+        return self.user_id is not None
+
+    @property
+    def is_admin(self):
+        return self.user_type == 'admin' or self.is_staff or self.is_superuser
+
+    @property
+    def is_firm(self):
+        return self.user_type == 'firma'
+
+    @property
+    def firm_active(self):
+        return self.firm_status == 'active'
+
+
+ANONYMOUS = Principal()
+
+
+def principal_for(user):
+    """Principal of an authenticated user (its firm is already loaded by PrincipalBackend)"""
+    if not user.is_authenticated:
+        return ANONYMOUS
+    firm = getattr(user, 'firm', None)
+    return Principal(
+        user.pk, user.user_type, user.is_staff, user.is_superuser,
+        firm.pk if firm is not None else None,
+        firm.status if firm is not None else None,
+    )
+
+
+def cached_user(user_id):
+    """User with its firm, from the cache or one query"""
+    key = f'principal:user:{user_id}'
+    entry, versions = get_with_versions(key, [_tag(user_id)])
+    if entry is not None and entry['versions'] == versions:
+        return entry['user']
+    user = get_user_model()._default_manager.select_related('firm').filter(pk=user_id).first()
+    if user is not None:
+        cache.set(key, {'versions': versions, 'user': user}, USER_TIMEOUT)
+    return user
+
+
+def invalidate_principals(user_ids):
+    """Drop the cached users after the current transaction commits"""
+    tags = [_tag(user_id) for user_id in user_ids if user_id is not None]
+    if tags:
+        transaction.on_commit(lambda: invalidate_tags(*tags))
+
+
+class PrincipalBackend(ModelBackend):
+    """
+    ModelBackend whose get_user comes from cached_user.
+
+    ModelBackend stays in AUTHENTICATION_BACKENDS for sessions created
+    before this backend; a failed login stops here so the password is not
+    hashed a second time by it.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        user = super().authenticate(request, username=username, password=password, **kwargs)
+        if user is None and username is not None and password is not None:
+            raise PermissionDenied
+        return user
+
+    def get_user(self, user_id):
+        user = cached_user(user_id)
+        return user if user is not None and self.user_can_authenticate(user) else None
@@ -0,0 +1,21 @@
+"""
+Signals dropping cached principals (accounts.principal)
+"""
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .principal import invalidate_principals
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def clear_user_principal(sender, instance, **kwargs):
+    """User changed (password, is_active, user_type...): reload on the next request"""
+    invalidate_principals([instance.pk])
+
+
+@receiver([post_save, post_delete], sender='firms.Firm')
+def clear_firm_principal(sender, instance, **kwargs):
+    """Firm status is part of the principal of its user"""
+    invalidate_principals([instance.user_id])
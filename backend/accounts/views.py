@@ -8,9 +8,8 @@ from django_ratelimit.decorators import ratelimit
 
 from .forms import CustomAuthenticationForm
 from firms.models import Firm
-from services.models import Service, ServiceRequest
 from services.utils import enrich_service_requests_with_status
-from documents.models import Document
+from core.stats import get_admin_dashboard_stats, get_firm_dashboard_stats
 
 # Reusable form for username changes
 class UsernameForm(forms.Form):
@@ -70,26 +69,8 @@ def admin_dashboard(request):
         messages.error(request, 'Bu sayfaya erişim yetkiniz yok.')
         return redirect('firm_dashboard')
     
-    from core.models import ContactMessage
-    
-    # Stat card verileri - 4 adet
-    total_firms = Firm.objects.count()
-    total_services = Service.objects.count()
-    pending_requests = ServiceRequest.objects.filter(status='pending').count()
-    pending_messages = ContactMessage.objects.filter(status='new').count()
-    
-    # Liste verileri
-    recent_services = Service.objects.all().order_by('-request_date')[:5]
-    recent_firms = Firm.objects.all().order_by('-registration_date')[:5]
-    
-    context = {
-        'total_firms': total_firms,
-        'total_services': total_services,
-        'pending_requests': pending_requests,
-        'pending_messages': pending_messages,
-        'recent_services': recent_services,
-        'recent_firms': recent_firms,
-    }
+    # Stat card verileri ve son kayıtlar - önbellekten (core.stats)
+    context = get_admin_dashboard_stats()
     return render(request, 'accounts/admin_dashboard.html', context)
 
 @login_required
@@ -100,36 +81,23 @@ def firm_dashboard(request):
     
     try:
         firm = request.user.firm
-        # Devam eden hizmetler - sadece son 1
-        in_progress_services = firm.services.filter(status='in_progress').order_by('-request_date')[:1]
-        in_progress_count = firm.services.filter(status='in_progress').count()
-        
-        # Tamamlanmış hizmetler - sadece son 1
-        completed_services = firm.services.filter(status='completed').order_by('-completion_date')[:1]
-        completed_count = firm.services.filter(status='completed').count()
-        
-        # Dokümanlar - sadece son 1
-        documents = firm.documents.filter(is_visible_to_firm=True).order_by('-upload_date')[:1]
-        documents_count = firm.documents.filter(is_visible_to_firm=True).count()
-        
-        # Sadece pending, approved ve in_progress durumundaki talepler - sadece son 1
-        service_requests = firm.service_requests.filter(status__in=['pending', 'approved', 'in_progress']).order_by('-request_date')[:1]
-        requests_count = firm.service_requests.filter(status__in=['pending', 'approved', 'in_progress']).count()
+        # Sayaçlar ve her listenin son kaydı - tek sorgu + önbellek (core.stats)
+        stats = get_firm_dashboard_stats(firm)
         
         # ServiceRequest'leri gerçek Service durumları ile zenginleştir
-        requests_with_services = enrich_service_requests_with_status(service_requests)
+        requests_with_services = enrich_service_requests_with_status(stats['recent_requests'])
         
         context = {
             'firm': firm,
-            'recent_services': in_progress_services,
-            'in_progress_count': in_progress_count,
-            'completed_services': completed_services,
-            'completed_count': completed_count,
-            'recent_documents': documents,
-            'documents_count': documents_count,
-            'recent_requests': service_requests,
+            'recent_services': stats['recent_services'],
+            'in_progress_count': stats['in_progress_count'],
+            'completed_services': stats['completed_services'],
+            'completed_count': stats['completed_count'],
+            'recent_documents': stats['recent_documents'],
+            'documents_count': stats['documents_count'],
+            'recent_requests': stats['recent_requests'],
             'requests_with_services': requests_with_services,
-            'requests_count': requests_count,
+            'requests_count': stats['requests_count'],
         }
         return render(request, 'accounts/firm_dashboard.html', context)
     except Firm.DoesNotExist:
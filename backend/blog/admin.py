@@ -1,12 +1,14 @@
 from django.contrib import admin
 from .models import BlogPost
 from core.admin_filters import BlogStatusFilter
+from core.search import FullTextSearchAdminMixin
 
 @admin.register(BlogPost)
-class BlogPostAdmin(admin.ModelAdmin):
+class BlogPostAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
     list_display = ('title', 'author', 'category', 'status', 'published_at', 'views')
     list_filter = (BlogStatusFilter, 'category', 'author')
     search_fields = ('title', 'content', 'excerpt', 'slug')
+    search_exact_fields = ('slug',)
     readonly_fields = ('created_at', 'updated_at', 'views', 'unique_id', 'slug')
     date_hierarchy = 'published_at'  # Date filter at top - removed from list_filter to avoid duplication
     list_per_page = 20
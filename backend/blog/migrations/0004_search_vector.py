@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:50
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Arama vektörü trigger ile güncellenir (database/triggers.sql ile aynı)
+BLOGPOST_SEARCH_TRIGGER = """
+CREATE OR REPLACE FUNCTION blog_blogpost_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector =
+        setweight(to_tsvector('turkish', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.excerpt, '')), 'B') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.content, '')), 'C');
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS blog_blogpost_search_vector ON blog_blogpost;
+CREATE TRIGGER blog_blogpost_search_vector
+    BEFORE INSERT OR UPDATE OF title, excerpt, content ON blog_blogpost
+    FOR EACH ROW EXECUTE FUNCTION blog_blogpost_search_vector_update();
+
+UPDATE blog_blogpost SET search_vector =
+        setweight(to_tsvector('turkish', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(excerpt, '')), 'B') ||
+        setweight(to_tsvector('turkish', coalesce(content, '')), 'C');
+"""
+
+BLOGPOST_SEARCH_TRIGGER_REVERSE = """
+DROP TRIGGER IF EXISTS blog_blogpost_search_vector ON blog_blogpost;
+DROP FUNCTION IF EXISTS blog_blogpost_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_alter_blogpost_table_comment_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='blog_search_idx'),
+        ),
+        migrations.RunSQL(BLOGPOST_SEARCH_TRIGGER, BLOGPOST_SEARCH_TRIGGER_REVERSE),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:19
+
+import core.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='featured_image_format',
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='featured_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='featured_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='blogpost',
+            name='featured_image',
+            field=core.fields.MeasuredImageField(blank=True, format_field='featured_image_format', height_field='featured_image_height', null=True, upload_to='blog/', verbose_name='Kapak Görseli', width_field='featured_image_width'),
+        ),
+    ]
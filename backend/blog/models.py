@@ -1,9 +1,16 @@
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.conf import settings
 from django.utils.text import slugify
 from django.urls import reverse
 import uuid
 
+from core.fields import MeasuredImageField
+
+# blog/urls.py içinde sabit yollar (ör. /blog/ara/) ile çakışan slug'lar
+RESERVED_SLUGS = {'ara'}
+
 class BlogPost(models.Model):
     class Category(models.TextChoices):
         GENERAL = 'general', 'Genel'
@@ -23,12 +30,17 @@ class BlogPost(models.Model):
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, verbose_name='Yazar')
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft', verbose_name='Durum')
     category = models.CharField(max_length=32, choices=Category.choices, default=Category.GENERAL, verbose_name='Kategori')
-    featured_image = models.ImageField(upload_to='blog/', blank=True, null=True, verbose_name='Kapak Görseli')
+    featured_image = MeasuredImageField(upload_to='blog/', blank=True, null=True, verbose_name='Kapak Görseli',
+                                        width_field='featured_image_width', height_field='featured_image_height', format_field='featured_image_format')
+    featured_image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    featured_image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    featured_image_format = models.CharField(max_length=10, blank=True, editable=False)
     views = models.PositiveIntegerField(default=0, verbose_name='Görüntülenme')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(null=True, blank=True, verbose_name='Yayınlanma Tarihi')
     unique_id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    search_vector = SearchVectorField(null=True, editable=False)  # Trigger ile güncellenir (turkish)
     
     class Meta:
         verbose_name = 'Blog Yazısı'
@@ -40,6 +52,7 @@ class BlogPost(models.Model):
             models.Index(fields=['-views'], name='blog_views_idx'),
             models.Index(fields=['category', '-published_at'], name='blog_cat_pub_idx'),
             models.Index(fields=['author', '-published_at'], name='blog_author_pub_idx'),
+            GinIndex(fields=['search_vector'], name='blog_search_idx'),
         ]
         db_table_comment = 'Blog yazıları - SEO optimized content'
     
@@ -51,7 +64,7 @@ class BlogPost(models.Model):
             base_slug = slugify(self.title)
             slug = base_slug
             num = 1
-            while BlogPost.objects.filter(slug=slug).exclude(pk=self.pk).exists():
+            while slug in RESERVED_SLUGS or BlogPost.objects.filter(slug=slug).exclude(pk=self.pk).exists():
                 slug = f"{base_slug}-{num}"
                 num += 1
             self.slug = slug
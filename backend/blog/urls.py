@@ -3,5 +3,6 @@ from . import views
 
 urlpatterns = [
     path('', views.blog_list, name='blog_list'),
+    path('ara/', views.blog_search, name='blog_search'),
     path('<slug:slug>/', views.blog_detail, name='blog_detail'),
 ]
\ No newline at end of file
@@ -1,33 +1,70 @@
-from django.shortcuts import render, get_object_or_404
-from django.db.models import F
+from django.shortcuts import render, get_object_or_404, redirect
 from .models import BlogPost
+from core.counters import BLOG_VIEWS
+from core.renditions import prefetch_renditions
+from core.pagecache import cache_public_page
+from core.pagination import paginate_keyset
+from core.search import SEARCH_ORDERING, search_queryset
 
-def blog_list(request):
-    # Optimized queries - only fetch needed fields
-    posts = BlogPost.objects.filter(status='published').select_related('author').only(
+def _published_posts():
+    """Helper: Published posts with only the fields the list template needs"""
+    return BlogPost.objects.filter(status='published').select_related('author').only(
         'title', 'slug', 'excerpt', 'content', 'published_at', 'views', 'featured_image',
+        'featured_image_width', 'featured_image_height',
         'category', 'author__username', 'author__first_name', 'author__last_name'
-    ).order_by('-published_at')
+    )
+
+def _popular_posts():
+    posts = BLOG_VIEWS.apply(BlogPost.objects.filter(status='published').only(
+        'title', 'slug', 'views', 'featured_image', 'featured_image_width', 'featured_image_height', 'published_at'
+    ).order_by('-views')[:5])
+    prefetch_renditions((post.featured_image for post in posts), 'responsive')
+    return posts
+
+@cache_public_page('blog_posts')
+def blog_list(request):
+    posts = paginate_keyset(request, _published_posts(), ordering=('-published_at',), per_page=10)
+    BLOG_VIEWS.apply(posts)
+    prefetch_renditions((post.featured_image for post in posts), 'responsive')
     
-    popular_posts = BlogPost.objects.filter(status='published').only(
-        'title', 'slug', 'views', 'featured_image', 'published_at'
-    ).order_by('-views')[:5]
+    return render(request, 'blog/blog_list.html', {
+        'posts': posts,
+        'page': posts,
+        'popular_posts': _popular_posts(),
+    })
+
+def blog_search(request):
+    """Blog araması - full-text search, en alakalı yazılar önce"""
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return redirect('blog_list')
+    
+    posts = search_queryset(_published_posts(), query)
+    posts = paginate_keyset(request, posts, ordering=SEARCH_ORDERING + ('-published_at',), per_page=10)
+    BLOG_VIEWS.apply(posts)
+    prefetch_renditions((post.featured_image for post in posts), 'responsive')
     
     return render(request, 'blog/blog_list.html', {
         'posts': posts,
-        'popular_posts': popular_posts,
+        'page': posts,
+        'popular_posts': _popular_posts(),
+        'search_query': query,
     })
 
+def _count_cached_view(request, meta):
+    """Page served from the page cache: the view is still counted"""
+    BLOG_VIEWS.incr(meta['post_id'])
+
+@cache_public_page('blog_posts', on_hit=_count_cached_view)
 def blog_detail(request, slug):
     post = get_object_or_404(
-        BlogPost.objects.select_related('author', 'author__profile'),
+        BlogPost.objects.select_related('author'),
         slug=slug, 
         status='published'
     )
     
-    # Atomic view count increment (prevents race conditions)
-    BlogPost.objects.filter(pk=post.pk).update(views=F('views') + 1)
-    post.refresh_from_db()
+    # Buffered view count; no UPDATE on every page view (core.counters)
+    BLOG_VIEWS.incr(post.pk)
     
     # Get related and similar posts
     related_posts = BlogPost.objects.filter(
@@ -39,8 +76,14 @@ def blog_detail(request, slug):
         status='published'
     ).exclude(pk=post.pk).order_by('-views')[:3]
     
-    return render(request, 'blog/blog_detail.html', {
+    # Pending hits are added to the displayed counts
+    related_posts, similar_posts = list(related_posts), list(similar_posts)
+    BLOG_VIEWS.apply([post, *related_posts, *similar_posts])
+    
+    response = render(request, 'blog/blog_detail.html', {
         'post': post,
         'related_posts': related_posts,
         'similar_posts': similar_posts,
-    })
\ No newline at end of file
+    })
+    response.page_cache_meta = {'post_id': post.pk}
+    return response
\ No newline at end of file
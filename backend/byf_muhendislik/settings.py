@@ -28,6 +28,7 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'django.contrib.humanize',
     'django.contrib.sitemaps',
+    'django.contrib.postgres',
     
     # Third party apps
     'rest_framework',
@@ -49,11 +50,13 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
-    'django.middleware.gzip.GZipMiddleware',  # Compress responses
+    'core.middleware.GZipMiddleware',  # Compress responses (not file downloads with byte ranges)
+    'core.middleware.SessionStatsMiddleware',  # Session loads/saves per request (performance_report)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'accounts.middleware.PrincipalMiddleware',  # request.principal (accounts.principal)
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'accounts.middleware.UserTypeMiddleware',
@@ -133,6 +136,11 @@ WHITENOISE_MAX_AGE = 31536000
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Protected downloads (core.downloads): 'django' streams, 'nginx' uses X-Accel-Redirect,
+# 'sendfile' uses X-Sendfile
+FILE_DOWNLOAD_BACKEND = os.getenv('FILE_DOWNLOAD_BACKEND', 'django')
+FILE_DOWNLOAD_INTERNAL_URL = os.getenv('FILE_DOWNLOAD_INTERNAL_URL', '/protected-media/')
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Güvenlik Ayarları
@@ -180,15 +188,28 @@ CAPTCHA_FOREGROUND_COLOR = '#0056b3'
 CAPTCHA_LETTER_ROTATION = (-30, 30)
 CAPTCHA_NOISE_FUNCTIONS = ('captcha.helpers.noise_dots',)
 
+# User and firm loaded together and cached (accounts.principal); ModelBackend
+# keeps sessions created before PrincipalBackend valid
+AUTHENTICATION_BACKENDS = [
+    'accounts.principal.PrincipalBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
 # Login/Logout URLs
 LOGIN_URL = '/hesap/giris/'
 LOGIN_REDIRECT_URL = '/hesap/dashboard/'
 LOGOUT_REDIRECT_URL = '/'
+# Redis read-through, database persistence, lazy writes (core.sessions);
+# expired rows are removed by `manage.py purge_sessions`
+SESSION_ENGINE = 'core.sessions'
 SESSION_COOKIE_AGE = int(os.getenv('SESSION_COOKIE_AGE', str(60 * 60 * 24 * 14)))  # 14 days default
 
 # File Upload Settings
-FILE_UPLOAD_MAX_MEMORY_SIZE = 52428800
+# Uploads above 2.5 MB are spooled to a temp file instead of worker memory
+FILE_UPLOAD_MAX_MEMORY_SIZE = 2621440
 DATA_UPLOAD_MAX_MEMORY_SIZE = 52428800
+# Chunked/resumable uploads (documents.uploads): temp files, not served by the web server
+CHUNKED_UPLOAD_DIR = os.getenv('CHUNKED_UPLOAD_DIR', str(BASE_DIR / 'tmp_uploads'))
 
 # Email Configuration
 EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
@@ -222,7 +243,6 @@ if REDIS_URL:
             'TIMEOUT': 3600,
         }
     }
-    SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
     SESSION_CACHE_ALIAS = 'default'
 else:
     # Use local memory cache for development
@@ -234,8 +254,28 @@ else:
                 'MAX_ENTRIES': 1000,
             },
             'TIMEOUT': 3600,  # 1 hour default
-        }
+        },
+        # locmem is per process: sessions are read from the database instead
+        'sessions': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        },
     }
+    SESSION_CACHE_ALIAS = 'sessions'
+
+# HTTP cache policies (core.middleware.CacheControlMiddleware), compiled at startup.
+# First match wins: 'path' (exact), 'prefix', 'regex' or 'url_name' (a name or a list).
+# Public rules apply to anonymous visitors; 'private' rules to everyone.
+CACHE_CONTROL_RULES = [
+    # İletişim formu ziyaretçiye özel CSRF token içerir: paylaşılan cache'e girmez
+    {'url_name': 'contact', 'private': True, 'max_age': 0},
+    {'url_name': ['home', 'about', 'services_list'], 'max_age': 3600, 's_maxage': 3600,
+     'stale_while_revalidate': 60, 'stale_if_error': 86400, 'surrogate_keys': ['pages']},
+    {'prefix': '/blog/', 'max_age': 3600, 's_maxage': 3600,
+     'stale_while_revalidate': 60, 'stale_if_error': 86400, 'surrogate_keys': ['blog']},
+]
+
+# nginx microcache refresh on content changes (core.purge), e.g. http://nginx; empty = off
+CACHE_PURGE_URL = os.getenv('CACHE_PURGE_URL', '')
 
 # S3/Storage (optional)
 USE_S3 = os.getenv('USE_S3', 'False') == 'True'
@@ -246,4 +286,6 @@ if USE_S3:
     AWS_S3_CUSTOM_DOMAIN = os.getenv('AWS_S3_CUSTOM_DOMAIN', '')
     AWS_S3_FILE_OVERWRITE = False
     AWS_DEFAULT_ACL = None
+    AWS_QUERYSTRING_EXPIRE = int(os.getenv('AWS_QUERYSTRING_EXPIRE', '60'))  # Presigned download lifetime
+    DIRECT_UPLOAD_EXPIRE = int(os.getenv('DIRECT_UPLOAD_EXPIRE', '600'))  # Presigned upload lifetime
     DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
\ No newline at end of file
@@ -1,34 +1,47 @@
 from django.shortcuts import render
 from django.contrib import messages
-from django.core.mail import send_mail
-from django.conf import settings
 from django_ratelimit.decorators import ratelimit
 
 from blog.models import BlogPost
 from core.models import ContactMessage, ServiceCategory, TeamMember, SiteSettings
+from core.mail import admin_recipients, queue_mail
+from core.pagecache import cache_public_page
+from core.renditions import prefetch_renditions
 
+@cache_public_page('blog_posts')
 def home(request):
     # Optimized queries with only() to fetch only needed fields
     recent_posts = BlogPost.objects.filter(status='published').select_related('author').only(
-        'title', 'slug', 'excerpt', 'published_at', 'featured_image', 'author__username', 'author__first_name', 'author__last_name'
+        'title', 'slug', 'excerpt', 'published_at', 'featured_image', 'featured_image_width', 'featured_image_height',
+        'author__username', 'author__first_name', 'author__last_name'
     )[:3]
     
     # Service categories - full object to support both old (icon-only) and new (image) designs
-    service_categories = ServiceCategory.objects.filter(is_active=True).order_by('order', 'title')
+    service_categories = list(ServiceCategory.objects.filter(is_active=True).order_by('order', 'title'))
     
     # Site settings for hero content
     site_settings = SiteSettings.objects.first()
     
+    # Görsel türevleri tek seferde (core.renditions); kart başına sorgu yok
+    prefetch_renditions(
+        [category.image for category in service_categories]
+        + ([site_settings.hero_image] if site_settings else []),
+        'responsive',
+    )
+    
     return render(request, 'home.html', {
         'recent_posts': recent_posts,
         'service_categories': service_categories,
         'site_settings': site_settings,
     })
 
+@cache_public_page('team_members')
 def about(request):
-    team_members = TeamMember.objects.filter(is_active=True).order_by('order', 'name')
+    team_members = list(TeamMember.objects.filter(is_active=True).order_by('order', 'name'))
+    prefetch_renditions((member.image for member in team_members), 'responsive')
     return render(request, 'about.html', {'team_members': team_members})
 
+@cache_public_page()
 def services_list(request):
     """Hizmetlerimiz sayfası - dinamik - Optimized with caching"""
     from django.core.cache import cache
@@ -40,6 +53,7 @@ def services_list(request):
             ServiceCategory.objects.filter(is_active=True).order_by('order', 'title')
         )
         cache.set('services_page_categories', service_categories, 3600)  # 1 hour
+    prefetch_renditions((category.image for category in service_categories), 'responsive')
     
     return render(request, 'services.html', {'service_categories': service_categories})
 
@@ -69,7 +83,7 @@ def contact(request):
                 status='new'
             )
 
-            # E-posta gönder
+            # E-posta kuyruğa alınır (send_queued_mail gönderir)
             full_subject = f"İletişim Formu: {subject} - {name} {surname}"
             full_message = (
                 f"Ad Soyad: {name} {surname}\n"
@@ -79,13 +93,7 @@ def contact(request):
                 f"Mesaj:\n{message}"
             )
 
-            send_mail(
-                full_subject,
-                full_message,
-                settings.DEFAULT_FROM_EMAIL,
-                [settings.EMAIL_HOST_USER or settings.DEFAULT_FROM_EMAIL],
-                fail_silently=True,
-            )
+            queue_mail(full_subject, full_message, admin_recipients())
             
             messages.success(request, 'Mesajınız başarıyla gönderildi! En kısa sürede size geri dönüş yapacağız.')
         except Exception as e:
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import SiteSettings, ActivityLog, ProvisionedCredential, ContactMessage, ServiceCategory, TeamMember
+from .models import SiteSettings, ActivityLog, ProvisionedCredential, ContactMessage, ServiceCategory, TeamMember, OutgoingEmail, BackgroundTask
 from django.utils.html import format_html
 from django.utils import timezone
 from .admin_filters import AdminTypeFilter, ActiveStatusFilter, ContactMessageStatusFilter
@@ -201,3 +201,53 @@ class TeamMemberAdmin(admin.ModelAdmin):
             )
         return '-'
     image_preview.short_description = 'Önizleme'
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'recipient_list', 'status', 'attempts', 'created_at', 'sent_at')
+    list_filter = ('status',)
+    search_fields = ('subject',)
+    date_hierarchy = 'created_at'
+    readonly_fields = ('subject', 'body', 'from_email', 'recipients', 'status', 'attempts',
+                       'last_error', 'next_attempt_at', 'created_at', 'sent_at')
+    actions = ['requeue']
+
+    def recipient_list(self, obj):
+        return ', '.join(obj.recipients)
+    recipient_list.short_description = 'Alıcılar'
+
+    def requeue(self, request, queryset):
+        """Başarısız e-postaları yeniden kuyruğa al"""
+        updated = queryset.filter(status='failed').update(
+            status='pending', attempts=0, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f'{updated} e-posta yeniden kuyruğa alındı.')
+    requeue.short_description = '🔁 Başarısız e-postaları yeniden kuyruğa al'
+
+    def has_add_permission(self, request):
+        """E-postalar sadece uygulama tarafından kuyruğa alınır"""
+        return False
+
+
+@admin.register(BackgroundTask)
+class BackgroundTaskAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'attempts', 'run_after', 'started_at', 'finished_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'idempotency_key')
+    date_hierarchy = 'created_at'
+    readonly_fields = ('name', 'args', 'kwargs', 'idempotency_key', 'status', 'attempts', 'max_attempts',
+                       'last_error', 'run_after', 'created_at', 'started_at', 'finished_at')
+    actions = ['requeue']
+
+    def requeue(self, request, queryset):
+        """Başarısız görevleri yeniden kuyruğa al"""
+        updated = queryset.filter(status='failed').update(
+            status='pending', attempts=0, run_after=timezone.now()
+        )
+        self.message_user(request, f'{updated} görev yeniden kuyruğa alındı.')
+    requeue.short_description = '🔁 Başarısız görevleri yeniden kuyruğa al'
+
+    def has_add_permission(self, request):
+        """Görevler sadece uygulama tarafından kuyruğa alınır"""
+        return False
@@ -0,0 +1,41 @@
+"""
+Conditional GET validators for public pages
+
+A page's ETag and Last-Modified come from the version stamps of its
+invalidation tags (core.invalidation). The page cache fetches those stamps
+anyway, in the same round trip as the page, so validators cost no
+``max(updated_at)`` query. The ETag changes whenever a tag the page depends
+on is invalidated; Last-Modified is the newest stamp, the time of the last
+invalidation (set after commit, so never earlier than the real change).
+
+A client revalidating with If-None-Match / If-Modified-Since gets a 304
+before the view runs (core.pagecache), and CacheControlMiddleware lets
+browsers revalidate validated pages instead of keeping them for an hour.
+"""
+
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def page_validators(key, versions):
+    """
+    Validators of the page cached under ``key``, built from ``versions``.
+
+    Returns:
+        tuple: (quoted ETag, Last-Modified as a Unix timestamp)
+    """
+    raw = '|'.join([key, *(str(version) for version in versions)])
+    return quote_etag(hashlib.md5(raw.encode('utf-8')).hexdigest()), max(versions) // 1_000_000_000
+
+
+def not_modified(request, etag, last_modified):
+    """304 (or 412) response when the client's copy is current, otherwise None"""
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def set_validators(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
@@ -1,27 +1,30 @@
 from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
 from .models import SiteSettings, ServiceCategory
 
 
-def site_settings(request):
-    """
-    Cached context processor for site settings
-    Reduces database queries significantly
-    """
-    # Cache site settings for 1 hour
-    settings = cache.get('site_settings')
-    if settings is None:
-        try:
-            settings = SiteSettings.objects.only(
-                'site_name', 'site_description', 'contact_email', 'contact_phone',
-                'logo', 'facebook_url', 'twitter_url', 'linkedin_url', 'instagram_url',
-                'google_analytics_id', 'hotjar_id', 'google_search_console', 'hero_image',
-                'about_image'
-            ).first()
-            cache.set('site_settings', settings, 3600)  # 1 hour cache
-        except SiteSettings.DoesNotExist:
-            settings = None
-            cache.set('site_settings', None, 300)  # Cache "not found" for 5 mins
-    
+_MISSING = object()
+
+
+def _load_site_settings():
+    # Kayıt yoksa None da cache'lenir; get() varsayılanı ayırt eder
+    settings = cache.get('site_settings', _MISSING)
+    if settings is _MISSING:
+        settings = SiteSettings.objects.only(
+            'site_name', 'site_description', 'contact_email', 'contact_phone',
+            'logo', 'address', 'whatsapp_number', 'facebook_url', 'twitter_url', 'linkedin_url', 'instagram_url',
+            'google_analytics_id', 'hotjar_id', 'google_search_console', 'hero_image',
+            'about_image',
+            # Saklanan boyutlar (core.fields.MeasuredImageField): şablonlar dosya açmaz
+            'logo_width', 'logo_height', 'hero_image_width', 'hero_image_height',
+            'about_image_width', 'about_image_height'
+        ).first()
+        # 1 hour cache; "not found" for 5 mins
+        cache.set('site_settings', settings, 3600 if settings is not None else 300)
+    return settings
+
+
+def _load_footer_service_categories():
     # Cache service categories for footer (changes rarely)
     service_categories = cache.get('footer_service_categories')
     if service_categories is None:
@@ -31,8 +34,18 @@ def site_settings(request):
             .order_by('order', 'title')
         )
         cache.set('footer_service_categories', service_categories, 7200)  # 2 hours cache
-    
+    return service_categories
+
+
+def site_settings(request):
+    """
+    Cached context processor for site settings
+    Reduces database queries significantly
+
+    Values are lazy: a footer served from the fragment cache
+    (core.templatetags.fragment_tags) never loads them.
+    """
     return {
-        'site_settings': settings,
-        'footer_service_categories': service_categories
+        'site_settings': SimpleLazyObject(_load_site_settings),
+        'footer_service_categories': SimpleLazyObject(_load_footer_service_categories),
     }
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Buffered hit counters (document downloads, blog post views)
+
+A page view no longer runs ``UPDATE ... SET views = views + 1``. Hits are
+counted in Redis (INCR on one key per object plus a set of dirty ids) and the
+``flush_counters`` command adds the accumulated deltas to the database in one
+UPDATE per model. Without Redis (locmem cache, development) a process-local
+buffer stands in and flushes itself every FLUSH_INTERVAL seconds.
+
+Reads merge pending deltas, so displayed numbers stay exact:
+    BLOG_VIEWS.incr(post.pk)
+    BLOG_VIEWS.apply([post, *similar_posts])  # post.views += pending hits
+"""
+
+import logging
+import threading
+import time
+from collections import Counter as _Tally
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 30  # seconds; local buffer flush period
+FLUSH_BATCH_SIZE = 500
+
+
+def _redis_client():
+    """Raw client of a django-redis cache, or None for other cache backends"""
+    client = getattr(cache, 'client', None)
+    if client is not None and hasattr(client, 'get_client'):
+        return client.get_client(write=True)
+    return None
+
+
+class BufferedCounter:
+    """
+    An integer model field incremented through a buffer.
+
+    Args:
+        name: Counter name used in cache keys
+        model_label: ``'app_label.ModelName'``
+        field: Name of the integer field the deltas are added to
+    """
+
+    def __init__(self, name, model_label, field):
+        self.name = name
+        self.model_label = model_label
+        self.field = field
+        self._local = _Tally()
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    def _key(self, pk):
+        return f'counter:{self.name}:{pk}'
+
+    @property
+    def _dirty_key(self):
+        return cache.make_key(f'counter:{self.name}:dirty')
+
+    # Write API
+
+    def incr(self, pk, amount=1):
+        """
+        Count a hit. With Redis this never touches the database; the local
+        buffer writes itself inline every FLUSH_INTERVAL seconds, and a failed
+        write is logged and kept for the next flush instead of failing the view.
+        """
+        client = _redis_client()
+        if client is not None:
+            pipe = client.pipeline(transaction=False)
+            pipe.incrby(cache.make_key(self._key(pk)), amount)
+            pipe.sadd(self._dirty_key, pk)
+            pipe.execute()
+            return
+        with self._lock:
+            self._local[pk] += amount
+            due = time.monotonic() - self._last_flush >= FLUSH_INTERVAL
+        if due:
+            try:
+                self.flush()
+            except Exception:
+                pass  # _write kaydı loglayıp farkları tampona geri koydu
+
+    # Read API
+
+    def pending_many(self, pks):
+        """Hits not yet written to the database, as ``{pk: delta}``"""
+        pks = list(pks)
+        if not pks:
+            return {}
+        if _redis_client() is not None:
+            values = cache.get_many([self._key(pk) for pk in pks])
+            return {pk: int(values.get(self._key(pk)) or 0) for pk in pks}
+        with self._lock:
+            return {pk: self._local.get(pk, 0) for pk in pks}
+
+    def pending(self, pk):
+        return self.pending_many([pk])[pk]
+
+    def apply(self, objects):
+        """Add pending hits to the counter field of loaded objects (one cache round trip)"""
+        objects = [obj for obj in objects if obj is not None]
+        deltas = self.pending_many({obj.pk for obj in objects})
+        for obj in objects:
+            if deltas.get(obj.pk):
+                setattr(obj, self.field, getattr(obj, self.field) + deltas[obj.pk])
+        return objects
+
+    # Flush
+
+    def _batches(self):
+        """
+        Pending deltas as (deltas, commit callback) batches.
+
+        The dirty set is read once: ids hit again while a batch is written are
+        marked dirty for the next flush, not picked up again by this one.
+        """
+        client = _redis_client()
+        if client is None:
+            with self._lock:
+                deltas = dict(self._local)
+                self._local.clear()
+                self._last_flush = time.monotonic()
+            if deltas:
+                yield deltas, lambda: None
+            return
+
+        dirty = sorted(int(pk) for pk in client.smembers(self._dirty_key) or ())
+        for start in range(0, len(dirty), FLUSH_BATCH_SIZE):
+            pks = dirty[start:start + FLUSH_BATCH_SIZE]
+            keys = [cache.make_key(self._key(pk)) for pk in pks]
+            values = client.mget(keys)
+            deltas = {pk: int(value) for pk, value in zip(pks, values) if value and int(value)}
+            yield deltas, self._commit_callback(client, pks, keys, deltas)
+
+    def _commit_callback(self, client, pks, keys, deltas):
+        def commit():
+            # DECRBY instead of DEL keeps hits counted while the flush ran
+            pipe = client.pipeline(transaction=False)
+            for pk, key in zip(pks, keys):
+                if pk in deltas:
+                    pipe.decrby(key, deltas[pk])
+                pipe.srem(self._dirty_key, pk)
+            pipe.execute()
+            # Keys hit again during the flush are still non-zero: mark dirty again
+            for pk, value in zip(pks, client.mget(keys)):
+                if value and int(value):
+                    client.sadd(self._dirty_key, pk)
+        return commit
+
+    def flush(self):
+        """
+        Add the deltas pending at call time to the database, one UPDATE per batch.
+
+        Returns:
+            int: Number of rows updated
+        """
+        return sum(self._write(*batch) for batch in self._batches())
+
+    def _write(self, deltas, commit):
+        if not deltas:
+            commit()  # Sadece sıfırlanmış anahtarlar
+            return 0
+        increment = Case(
+            *[When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()],
+            default=Value(0), output_field=IntegerField(),
+        )
+        try:
+            with transaction.atomic():
+                updated = self.model.objects.filter(pk__in=deltas).update(
+                    **{self.field: F(self.field) + increment}
+                )
+        except Exception:
+            if _redis_client() is None:
+                with self._lock:
+                    self._local.update(deltas)  # Bir sonraki flush'ta tekrar denenir
+            logger.exception('%s sayacı veritabanına yazılamadı', self.name)
+            raise
+        commit()
+        return updated
+
+
+DOCUMENT_DOWNLOADS = BufferedCounter('document_downloads', 'documents.Document', 'download_count')
+BLOG_VIEWS = BufferedCounter('blog_views', 'blog.BlogPost', 'views')
+
+COUNTERS = (DOCUMENT_DOWNLOADS, BLOG_VIEWS)
+
+
+def flush_all():
+    """Flush every counter; returns ``{name: rows updated}``"""
+    return {counter.name: counter.flush() for counter in COUNTERS}
@@ -0,0 +1,274 @@
+"""
+File delivery for protected downloads
+
+After the access check the view hands the file to ``file_response``. Depending
+on ``settings.FILE_DOWNLOAD_BACKEND`` the body is sent by:
+
+    'nginx'     X-Accel-Redirect to an ``internal`` nginx location
+                (FILE_DOWNLOAD_INTERNAL_URL, aliased to MEDIA_ROOT)
+    'sendfile'  X-Sendfile with the absolute path (Apache mod_xsendfile, lighttpd)
+    'django'    Streaming through Python (development, default)
+
+With the first two the worker returns an empty response in microseconds and
+the web server copies the file with sendfile(2). S3 files are answered with a
+redirect to a short-lived presigned URL (core.storage); other remote storages
+are streamed.
+
+Every response carries a strong ETag, Last-Modified and ``Accept-Ranges``;
+``If-None-Match`` / ``If-Modified-Since`` are answered with 304 here. When
+Django streams, ``Range`` / ``If-Range`` requests get 206 partial content
+(multipart/byteranges for several ranges); S3 objects are read with ranged
+GETs. The nginx/sendfile backends leave Range handling to the web server.
+"""
+
+import mimetypes
+import os
+import re
+import secrets
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+from .storage import presigned_download_url, supports_presigned_urls
+
+
+CHUNK_SIZE = 64 * 1024
+MAX_RANGES = 16  # More parts than this: the whole file is sent
+
+_RANGE_SPEC = re.compile(r'^\s*(\d*)\s*-\s*(\d*)\s*$')
+
+
+def _content_disposition(filename, as_attachment):
+    disposition = 'attachment' if as_attachment else 'inline'
+    # ASCII fallback + RFC 5987 UTF-8 name (Türkçe karakterler)
+    fallback = filename.encode('ascii', 'ignore').decode() or 'download'
+    return f'{disposition}; filename="{fallback}"; filename*=UTF-8\'\'{quote(filename)}'
+
+
+def _local_path(fieldfile):
+    """Absolute path of a stored file, or None for remote storages"""
+    try:
+        return fieldfile.path
+    except NotImplementedError:
+        return None
+
+
+class _StoredFile:
+    """Size, modification time and byte access of a FieldFile (local or S3)"""
+
+    def __init__(self, fieldfile):
+        self.fieldfile = fieldfile
+        self.path = _local_path(fieldfile)
+        self.obj = None
+        if self.path is not None:
+            stat = os.stat(self.path)  # FileNotFoundError if missing
+            self.size, mtime = stat.st_size, stat.st_mtime
+        else:
+            storage = fieldfile.storage
+            # django-storages S3File exposes the boto3 Object: one HEAD gives size and date
+            self.obj = getattr(storage.open(fieldfile.name, 'rb'), 'obj', None)
+            if self.obj is not None:
+                self.size, mtime = self.obj.content_length, self.obj.last_modified.timestamp()
+            else:
+                self.size = storage.size(fieldfile.name)
+                mtime = storage.get_modified_time(fieldfile.name).timestamp()
+        self.mtime = int(mtime)
+
+    def iter_range(self, start, end):
+        """Yield bytes ``start``..``end`` (inclusive)"""
+        if end < start:
+            return
+        if self.obj is not None:
+            body = self.obj.get(Range=f'bytes={start}-{end}')['Body']
+            yield from body.iter_chunks(CHUNK_SIZE)
+            return
+        with self.fieldfile.storage.open(self.fieldfile.name, 'rb') as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+def parse_range_header(header, size):
+    """
+    Parse a ``Range: bytes=...`` header against a file of ``size`` bytes.
+
+    Returns:
+        None: No usable Range header, send the whole file
+        list[tuple[int, int]]: Sorted, coalesced inclusive ranges;
+            empty when none is satisfiable (416)
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes':
+        return None
+    ranges = []
+    for part in spec.split(','):
+        match = _RANGE_SPEC.match(part)
+        if not match or match.groups() == ('', ''):
+            return None
+        first, last = match.groups()
+        if first == '':
+            # Suffix range: last N bytes
+            if int(last) > 0:
+                ranges.append((max(size - int(last), 0), size - 1))
+            continue
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        if start < size:
+            ranges.append((start, min(int(last), size - 1) if last else size - 1))
+    if len(ranges) > MAX_RANGES:
+        return None
+
+    # Overlapping or adjacent ranges are merged (RFC 7233 §4.1)
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _if_range_matches(request, etag, last_modified):
+    value = request.META.get('HTTP_IF_RANGE')
+    if not value:
+        return True
+    if value.startswith(('"', 'W/')):
+        return value == etag  # Strong comparison; weak tags never match
+    return parse_http_date_safe(value) == last_modified
+
+
+def _stream(request, stored, content_type, etag):
+    """Full (200) or partial (206/416) response streamed through Django"""
+    ranges = None
+    if _if_range_matches(request, etag, stored.mtime):
+        ranges = parse_range_header(request.META.get('HTTP_RANGE'), stored.size)
+
+    if ranges is None:
+        if stored.obj is None:
+            response = FileResponse(stored.fieldfile.open('rb'))  # wsgi.file_wrapper
+        else:
+            response = StreamingHttpResponse(stored.iter_range(0, stored.size - 1))
+            response['Content-Length'] = str(stored.size)
+        response['Content-Type'] = content_type
+        return response
+
+    if not ranges:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{stored.size}'
+        return response
+
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        response = StreamingHttpResponse(stored.iter_range(start, end), status=206)
+        response['Content-Range'] = f'bytes {start}-{end}/{stored.size}'
+        response['Content-Length'] = str(end - start + 1)
+        response['Content-Type'] = content_type
+        return response
+
+    boundary = secrets.token_hex(16)
+    parts = [
+        (
+            f'\r\n--{boundary}\r\nContent-Type: {content_type}\r\n'
+            f'Content-Range: bytes {start}-{end}/{stored.size}\r\n\r\n'
+        ).encode()
+        for start, end in ranges
+    ]
+    closing = f'\r\n--{boundary}--\r\n'.encode()
+
+    def body():
+        for head, (start, end) in zip(parts, ranges):
+            yield head
+            yield from stored.iter_range(start, end)
+        yield closing
+
+    response = StreamingHttpResponse(body(), status=206)
+    response['Content-Length'] = str(
+        sum(len(head) + end - start + 1 for head, (start, end) in zip(parts, ranges)) + len(closing)
+    )
+    response['Content-Type'] = f'multipart/byteranges; boundary={boundary}'
+    return response
+
+
+def _nginx(request, stored, content_type, etag):
+    response = HttpResponse(content_type=content_type)
+    internal_url = settings.FILE_DOWNLOAD_INTERNAL_URL.rstrip('/')
+    response['X-Accel-Redirect'] = quote(f'{internal_url}/{stored.fieldfile.name}')
+    return response
+
+
+def _sendfile(request, stored, content_type, etag):
+    response = HttpResponse(content_type=content_type)
+    # Raw UTF-8 bytes on the wire (WSGI headers are latin-1 strings)
+    response['X-Sendfile'] = stored.path.encode('utf-8').decode('latin-1')
+    return response
+
+
+BACKENDS = {
+    'django': _stream,
+    'nginx': _nginx,
+    'sendfile': _sendfile,
+}
+
+
+def file_response(request, fieldfile, filename=None, as_attachment=True, version=None):
+    """
+    Build the download response for a FileField value.
+
+    Args:
+        request: Current request (conditional and Range headers)
+        fieldfile: FieldFile of a model instance (e.g. ``document.file``)
+        filename: Name offered to the browser (default: stored file name)
+        as_attachment: ``attachment`` or ``inline`` Content-Disposition
+        version: Stable identifier of the stored object, part of the ETag
+                 (e.g. ``document.unique_id``)
+
+    Raises:
+        FileNotFoundError: The file is missing from storage
+    """
+    filename = filename or os.path.basename(fieldfile.name)
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    if supports_presigned_urls(fieldfile.storage):
+        # Bytes come straight from S3 (Range/ETag handled there)
+        response = HttpResponseRedirect(presigned_download_url(
+            fieldfile, _content_disposition(filename, as_attachment), content_type,
+        ))
+        response['Cache-Control'] = 'private, no-store'  # İmzalı URL kısa ömürlü
+        return response
+
+    stored = _StoredFile(fieldfile)
+    validator = f'{stored.size:x}-{stored.mtime:x}'
+    etag = f'"{version}-{validator}"' if version else f'"{validator}"'
+
+    response = get_conditional_response(request, etag=etag, last_modified=stored.mtime)
+    if response is None:
+        backend = BACKENDS[getattr(settings, 'FILE_DOWNLOAD_BACKEND', 'django')]
+        if stored.path is None:
+            backend = _stream
+        response = backend(request, stored, content_type, etag)
+        if response.status_code in (200, 206):
+            response['Content-Disposition'] = _content_disposition(filename, as_attachment)
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(stored.mtime)
+    response['Accept-Ranges'] = 'bytes'
+    response['Cache-Control'] = 'private, no-cache'  # Her istekte yetki kontrolü ve doğrulama
+    return response
+
+
+def is_new_download(request, response):
+    """False for 304s and Range requests that continue an earlier transfer"""
+    if response.status_code not in (200, 206, 302):
+        return False
+    requested = request.META.get('HTTP_RANGE', '').replace(' ', '')
+    return not requested or requested.startswith('bytes=0-')
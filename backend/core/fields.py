@@ -0,0 +1,90 @@
+"""
+ImageField storing width, height and format next to the file
+
+ImageFieldFile.width/height open and parse the image (an S3 GET on remote
+storage) every time they are read. MeasuredImageField fills companion model
+fields once, when a file is assigned, so templates read plain columns:
+
+    hero_image = MeasuredImageField(upload_to='site/', width_field='hero_image_width',
+                                    height_field='hero_image_height', format_field='hero_image_format')
+
+Rows saved before the companion fields existed are filled by
+``manage.py backfill_image_metadata``.
+"""
+
+from django.db import models
+from PIL import Image
+
+
+UNREADABLE = 'UNKNOWN'  # Okunamayan dosya: her yüklemede tekrar denenmez
+
+
+def read_image_metadata(fieldfile):
+    """(width, height, format) from the image header; (None, None, UNREADABLE) on failure"""
+    close = fieldfile.closed
+    try:
+        fieldfile.open('rb')
+        position = fieldfile.tell()
+        fieldfile.seek(0)
+        try:
+            with Image.open(fieldfile) as image:
+                return image.width, image.height, image.format or UNREADABLE
+        finally:
+            fieldfile.seek(position)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None, None, UNREADABLE
+    finally:
+        if close and not fieldfile.closed:
+            fieldfile.close()
+
+
+def stored_dimensions(fieldfile):
+    """(width, height) from the companion fields of a MeasuredImageField, without storage I/O"""
+    field = getattr(fieldfile, 'field', None)
+    if not fieldfile or not getattr(field, 'width_field', None) or not field.height_field:
+        return None, None
+    return getattr(fieldfile.instance, field.width_field), getattr(fieldfile.instance, field.height_field)
+
+
+class MeasuredImageField(models.ImageField):
+    """ImageField whose width, height and format are read once and stored on the model"""
+
+    def __init__(self, *args, format_field=None, **kwargs):
+        self.format_field = format_field
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.format_field:
+            kwargs['format_field'] = self.format_field
+        return name, path, args, kwargs
+
+    def update_dimension_fields(self, instance, force=False, *args, **kwargs):
+        """
+        Same contract as ImageField.update_dimension_fields (called on
+        assignment with force=True and on model init), plus the format.
+        A single header read fills all three fields.
+        """
+        fields = [name for name in (self.width_field, self.height_field, self.format_field) if name]
+        if not fields or self.attname not in instance.__dict__:
+            return  # Ertelenmiş (.only/.defer) alan
+        if any(name not in instance.__dict__ for name in fields):
+            return  # Yardımcı alanlar ertelenmiş: sorgu tetiklenmesin
+        file = getattr(instance, self.attname)
+        if not file and not force:
+            return
+        if not force and self._measured(instance):
+            return
+
+        width, height, image_format = read_image_metadata(file) if file else (None, None, '')
+        if self.width_field:
+            setattr(instance, self.width_field, width)
+        if self.height_field:
+            setattr(instance, self.height_field, height)
+        if self.format_field:
+            setattr(instance, self.format_field, image_format)
+
+    def _measured(self, instance):
+        if self.format_field:
+            return bool(getattr(instance, self.format_field))
+        return all(getattr(instance, name) for name in (self.width_field, self.height_field) if name)
@@ -0,0 +1,72 @@
+"""
+Tag-versioned cache invalidation
+
+Cached content (whole pages, template fragments) declares the data it was
+built from as tags: ``blog_posts``, ``service_categories``... Each tag has a
+version stamp in the cache, and the stamps are part of the cache key. A
+signal receiver bumps the stamps of the tags a model feeds
+(``invalidate_tags('blog_posts')``), so every entry built from it misses on
+the next request and old entries simply expire. Nothing has to know which
+keys exist.
+
+Stamps are time based rather than counters: a stamp evicted from the cache
+comes back with a new value, never with one an old entry was stored under.
+
+Every lookup also depends on RELEASE_TAG, bumped by ``manage.py
+invalidate_cache`` after a deploy, so changed templates are not hidden
+behind cached HTML or validators.
+"""
+
+import time
+
+from django.core.cache import cache
+
+
+TAG_PREFIX = 'tagver:'
+RELEASE_TAG = 'release'  # Her girdinin bağımlılığı: deploy sonrası hepsi yenilenir
+
+
+def _stamp():
+    return time.time_ns()
+
+
+def _versions(keys, found):
+    for key in keys:
+        if key not in found:
+            # İlk kullanım ya da cache'ten düşmüş: yeni damga
+            cache.add(key, _stamp(), None)
+            found[key] = cache.get(key)
+    return [found[key] for key in keys]
+
+
+def _tag_keys(tags):
+    return [f'{TAG_PREFIX}{tag}' for tag in (RELEASE_TAG, *tags)]
+
+
+def tag_versions(tags):
+    """
+    Current version stamp of each tag, in one cache round trip.
+
+    Returns:
+        list: stamps of RELEASE_TAG and then of ``tags``, in order
+    """
+    keys = _tag_keys(tags)
+    return _versions(keys, cache.get_many(keys))
+
+
+def get_with_versions(key, tags):
+    """
+    A cached entry and the current stamps of ``tags``, fetched together.
+
+    Returns:
+        tuple: (entry or None, stamps as returned by tag_versions)
+    """
+    keys = _tag_keys(tags)
+    found = cache.get_many([key, *keys])
+    return found.pop(key, None), _versions(keys, found)
+
+
+def invalidate_tags(*tags):
+    """New version stamps for ``tags``: entries built from them are no longer found"""
+    stamp = _stamp()
+    cache.set_many({f'{TAG_PREFIX}{tag}': stamp for tag in tags}, None)
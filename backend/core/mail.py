@@ -0,0 +1,116 @@
+"""
+E-mail outbox
+
+Views and signals call queue_mail(), which only inserts an OutgoingEmail row
+(part of the surrounding transaction, so a rolled back request sends nothing).
+The ``send_queued_mail`` management command delivers queued mails in batches
+over a single SMTP connection, retrying failures with exponential backoff and
+leaving mails that keep failing as ``failed`` for inspection in the admin.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutgoingEmail
+
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 60  # seconds; 1, 2, 4, 8 minutes between attempts
+
+
+def queue_mail(subject, message, recipient_list, from_email=None):
+    """
+    Queue an e-mail for background delivery (same arguments as send_mail).
+
+    Returns:
+        OutgoingEmail or None if there are no recipients
+    """
+    recipients = [address for address in recipient_list if address]
+    if not recipients:
+        return None
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=recipients,
+    )
+
+
+def admin_recipients():
+    """Helper: Notification address for site administrators"""
+    return [settings.EMAIL_HOST_USER or settings.DEFAULT_FROM_EMAIL]
+
+
+def _schedule_retry(email, error, now):
+    email.attempts += 1
+    email.last_error = str(error)[:2000]
+    if email.attempts >= MAX_ATTEMPTS:
+        email.status = 'failed'  # Dead letter - admin'den tekrar kuyruğa alınabilir
+        logger.error('E-posta gönderilemedi, deneme sınırı aşıldı (id=%s): %s', email.pk, error)
+    else:
+        email.next_attempt_at = now + timedelta(seconds=RETRY_BASE_DELAY * 2 ** (email.attempts - 1))
+
+
+def send_queued_mail(batch_size=BATCH_SIZE):
+    """
+    Deliver one batch of due e-mails over a single SMTP connection.
+
+    Rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so several
+    workers can run side by side without sending the same mail twice.
+
+    Returns:
+        tuple: (sent, failed) counts for this batch
+    """
+    now = timezone.now()
+    sent = failed = 0
+    with transaction.atomic():
+        batch = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(status='pending', next_attempt_at__lte=now)
+            .order_by('next_attempt_at')[:batch_size]
+        )
+        if not batch:
+            return 0, 0
+
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as exc:
+            # SMTP unreachable: the whole batch waits for the next attempt
+            for email in batch:
+                _schedule_retry(email, exc, now)
+            OutgoingEmail.objects.bulk_update(batch, ['attempts', 'last_error', 'status', 'next_attempt_at'])
+            return 0, len(batch)
+
+        try:
+            for email in batch:
+                message = EmailMessage(
+                    email.subject, email.body, email.from_email, email.recipients,
+                    connection=connection,
+                )
+                try:
+                    message.send()
+                except Exception as exc:
+                    _schedule_retry(email, exc, now)
+                    failed += 1
+                else:
+                    email.status = 'sent'
+                    email.sent_at = timezone.now()
+                    email.attempts += 1
+                    email.last_error = ''
+                    sent += 1
+        finally:
+            connection.close()
+
+        OutgoingEmail.objects.bulk_update(
+            batch, ['status', 'sent_at', 'attempts', 'last_error', 'next_attempt_at']
+        )
+    return sent, failed
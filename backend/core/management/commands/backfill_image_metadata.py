@@ -0,0 +1,46 @@
+"""
+Management command filling stored image width/height/format (core.fields)
+for rows saved before MeasuredImageField, so templates never open files.
+
+Usage:
+    python manage.py backfill_image_metadata           # eksik olanlar
+    python manage.py backfill_image_metadata --force   # hepsini yeniden ölç
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from core.fields import UNREADABLE, MeasuredImageField
+
+
+class Command(BaseCommand):
+    help = 'Görsellerin genişlik/yükseklik/format bilgisini veritabanına yazar (şablonlar dosya okumaz).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Kayıtlı değerleri de yeniden ölç')
+
+    def handle(self, *args, **options):
+        measured = unreadable = 0
+        for model in apps.get_models():
+            for field in model._meta.get_fields():
+                if not isinstance(field, MeasuredImageField):
+                    continue
+                companions = [name for name in (field.width_field, field.height_field, field.format_field) if name]
+                queryset = model._default_manager.exclude(Q(**{field.name: ''}) | Q(**{f'{field.name}__isnull': True}))
+                if not options['force']:
+                    queryset = queryset.filter(**{field.format_field: ''})
+
+                for obj in queryset.only('pk', field.name, *companions).iterator():
+                    # Eksikse model yüklenirken zaten ölçülür; --force ile yeniden
+                    field.update_dimension_fields(obj, force=options['force'])
+                    values = {name: getattr(obj, name) for name in companions}
+                    model._default_manager.filter(pk=obj.pk).update(**values)
+                    measured += 1
+                    if values.get(field.format_field) == UNREADABLE:
+                        unreadable += 1
+                        self.stderr.write(self.style.WARNING(
+                            f'Okunamadı: {model._meta.label} #{obj.pk} {field.name}={getattr(obj, field.name).name}'
+                        ))
+
+        self.stdout.write(self.style.SUCCESS(f'{measured} görsel ölçüldü, {unreadable} okunamadı.'))
@@ -0,0 +1,35 @@
+"""
+Management command moving existing document files into the content-addressed
+blob store (documents.blobs). Identical files uploaded to several firms end up
+as one stored copy.
+
+Usage:
+    python manage.py dedupe_documents
+"""
+
+from django.core.management.base import BaseCommand
+
+from documents.blobs import adopt_stored_file
+from documents.models import Document
+
+
+class Command(BaseCommand):
+    help = 'Mevcut doküman dosyalarını SHA-256 ile içerik adresli depoya taşır, kopyaları siler.'
+
+    def handle(self, *args, **options):
+        adopted = duplicates = saved = missing = 0
+        for document in Document.objects.filter(blob__isnull=True).exclude(file='').iterator():
+            try:
+                size = document.file.size
+                if adopt_stored_file(document):
+                    duplicates += 1
+                    saved += size
+                adopted += 1
+            except FileNotFoundError:
+                missing += 1
+                self.stderr.write(self.style.WARNING(f'Dosya bulunamadı: {document.file.name} (#{document.pk})'))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{adopted} doküman taşındı, {duplicates} kopya silindi '
+            f'({saved / 1024 / 1024:.1f} MB kazanıldı), {missing} dosya eksik.'
+        ))
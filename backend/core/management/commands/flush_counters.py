@@ -0,0 +1,48 @@
+"""
+Management command to write buffered hit counters (core.counters) to the database
+
+Usage:
+    python manage.py flush_counters               # tek sefer
+    python manage.py flush_counters --interval 30 # 30 sn'de bir
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+
+from core.counters import COUNTERS, _redis_client
+
+
+class Command(BaseCommand):
+    help = 'Önbellekte biriken indirme/görüntülenme sayaçlarını veritabanına toplu yazar.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval', type=int, default=0,
+            help='Saniye cinsinden tekrar aralığı (0: tek sefer çalıştır)',
+        )
+
+    def handle(self, *args, **options):
+        if _redis_client() is None:
+            # locmem: sayaçlar her web sürecinin kendi belleğinde, süreç kendisi yazar
+            self.stdout.write(self.style.WARNING('Redis yok; sayaçlar web süreçleri tarafından yazılıyor.'))
+            return
+
+        interval = options['interval']
+        while True:
+            close_old_connections()
+            self._flush()
+            if interval <= 0:
+                break
+            time.sleep(interval)
+
+    def _flush(self):
+        for counter in COUNTERS:
+            try:
+                updated = counter.flush()
+            except DatabaseError as exc:
+                self.stderr.write(self.style.ERROR(f'{counter.name} yazılamadı: {exc}'))
+                continue
+            if updated:
+                self.stdout.write(f'{counter.name}: {updated} kayıt güncellendi')
@@ -0,0 +1,23 @@
+"""
+Management command bumping cache invalidation tags (core.invalidation).
+
+Usage:
+    python manage.py invalidate_cache                 # tüm sayfa/parça cache'i (deploy sonrası)
+    python manage.py invalidate_cache blog_posts      # sadece blog sayfaları
+"""
+
+from django.core.management.base import BaseCommand
+
+from core.invalidation import RELEASE_TAG, invalidate_tags
+
+
+class Command(BaseCommand):
+    help = 'Sayfa ve şablon parçası cache girdilerini geçersiz kılar (ETag\'ler de yenilenir).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tags', nargs='*', help=f'Etiketler; verilmezse hepsi ({RELEASE_TAG})')
+
+    def handle(self, *args, **options):
+        tags = options['tags'] or [RELEASE_TAG]
+        invalidate_tags(*tags)
+        self.stdout.write(self.style.SUCCESS(f'Geçersiz kılındı: {", ".join(tags)}'))
@@ -9,6 +9,8 @@ from django.core.cache import cache
 from django.conf import settings
 import time
 
+from core.sessions import reset_session_metrics, session_metrics
+
 
 class Command(BaseCommand):
     help = 'Generate performance report for the website'
@@ -19,6 +21,11 @@ class Command(BaseCommand):
             action='store_true',
             help='Show detailed query analysis',
         )
+        parser.add_argument(
+            '--reset-session-stats',
+            action='store_true',
+            help='Reset session load/save counters after the report',
+        )
 
     def handle(self, *args, **options):
         self.stdout.write('=' * 80)
@@ -32,6 +39,11 @@ class Command(BaseCommand):
         # Cache Performance
         self.check_cache_performance()
         
+        # Session Performance
+        self.check_session_performance()
+        if options['reset_session_stats']:
+            reset_session_metrics()
+        
         # Middleware Performance
         self.check_middleware_config()
         
@@ -114,6 +126,8 @@ class Command(BaseCommand):
             'site_settings',
             'footer_service_categories',
             'services_page_categories',
+            'dashboard_stats:services',
+            'dashboard_stats:admin',
         ]
         
         cached_count = sum(1 for item in cached_items if cache.get(item) is not None)
@@ -121,12 +135,38 @@ class Command(BaseCommand):
         
         self.stdout.write('')
 
+    def check_session_performance(self):
+        self.stdout.write('[SESSION PERFORMANCE]')
+        self.stdout.write('-' * 80)
+        
+        self.stdout.write(f'  Engine: {settings.SESSION_ENGINE}')
+        self.stdout.write(f"  Cache: {settings.CACHES[settings.SESSION_CACHE_ALIAS]['BACKEND']}")
+        
+        metrics = session_metrics()
+        requests = metrics['requests']
+        if metrics['since']:
+            self.stdout.write(f"  Since: {metrics['since']:%Y-%m-%d %H:%M} UTC")
+        elif requests == 0:
+            self.stdout.write('  No session activity recorded (counters need Redis across processes)')
+        self.stdout.write(f'  Requests using the session: {requests}')
+        if requests:
+            loads = metrics['cache_hits'] + metrics['db_loads']
+            hit_ratio = metrics['cache_hits'] * 100 / loads if loads else 0
+            writes = metrics['saves'] + metrics['skipped_saves']
+            self.stdout.write(f'  Loads per request: {loads / requests:.2f} (cache hit ratio: {hit_ratio:.1f}%)')
+            self.stdout.write(f"  DB loads per request: {metrics['db_loads'] / requests:.2f}")
+            self.stdout.write(f"  Saves per request: {metrics['saves'] / requests:.2f}")
+            if writes:
+                self.stdout.write(f"  Unchanged saves skipped: {metrics['skipped_saves']}/{writes}")
+        
+        self.stdout.write('')
+
     def check_middleware_config(self):
         self.stdout.write('[MIDDLEWARE CONFIGURATION]')
         self.stdout.write('-' * 80)
         
         middleware_checks = [
-            ('GZip Compression', 'django.middleware.gzip.GZipMiddleware'),
+            ('GZip Compression', 'core.middleware.GZipMiddleware'),
             ('WhiteNoise Static', 'whitenoise.middleware.WhiteNoiseMiddleware'),
             ('Cache Control', 'core.middleware.CacheControlMiddleware'),
             ('Security Headers', 'core.middleware.SecurityHeadersMiddleware'),
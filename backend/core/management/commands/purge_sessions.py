@@ -0,0 +1,43 @@
+"""
+Management command to delete expired sessions in batches (core.sessions)
+
+Usage:
+    python manage.py purge_sessions                 # tek sefer
+    python manage.py purge_sessions --interval 3600 # saatte bir
+"""
+
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+
+
+class Command(BaseCommand):
+    help = 'Süresi dolmuş oturumları veritabanından toplu olarak siler.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval', type=int, default=0,
+            help='Saniye cinsinden tekrar aralığı (0: tek sefer çalıştır)',
+        )
+
+    def handle(self, *args, **options):
+        engine = import_module(settings.SESSION_ENGINE)
+        interval = options['interval']
+        while True:
+            close_old_connections()
+            try:
+                deleted = engine.SessionStore.clear_expired()
+            except DatabaseError as exc:
+                self.stderr.write(self.style.ERROR(f'Oturumlar silinemedi: {exc}'))
+            except NotImplementedError:
+                self.stdout.write(self.style.WARNING(f'{settings.SESSION_ENGINE} süresi dolan oturumları kendisi siler.'))
+                return
+            else:
+                if deleted:
+                    self.stdout.write(f'{deleted} süresi dolmuş oturum silindi')
+            if interval <= 0:
+                break
+            time.sleep(interval)
@@ -0,0 +1,56 @@
+"""
+Management command to refresh the dashboard materialized views
+(dashboard_stats, firm_dashboard_data). Skips the refresh when no dashboard
+data changed since the previous one.
+
+Usage:
+    python manage.py refresh_dashboard_views
+    python manage.py refresh_dashboard_views --interval 60
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+
+from core.stats import refresh_dashboard_views
+
+
+class Command(BaseCommand):
+    help = 'Dashboard materialized view\'larını yeniler (sadece veri değiştiyse).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval', type=int, default=0,
+            help='Saniye cinsinden tekrar aralığı (0: tek sefer çalıştır)',
+        )
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Değişiklik olmasa da yenile',
+        )
+        parser.add_argument(
+            '--no-concurrently', action='store_true',
+            help='CONCURRENTLY kullanmadan yenile (ilk doldurma için daha hızlı, okumayı bloklar)',
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        while True:
+            close_old_connections()
+            self._refresh(options['force'], not options['no_concurrently'])
+            if interval <= 0:
+                break
+            time.sleep(interval)
+
+    def _refresh(self, force, concurrently):
+        started = time.monotonic()
+        try:
+            refreshed = refresh_dashboard_views(force=force, concurrently=concurrently)
+        except DatabaseError as exc:
+            self.stderr.write(self.style.ERROR(f'Yenileme başarısız: {exc}'))
+            return
+        if refreshed:
+            elapsed = (time.monotonic() - started) * 1000
+            self.stdout.write(self.style.SUCCESS(f'Dashboard view\'ları yenilendi ({elapsed:.0f} ms)'))
+        else:
+            self.stdout.write('Değişiklik yok, yenileme atlandı.')
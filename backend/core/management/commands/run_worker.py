@@ -0,0 +1,97 @@
+"""
+Management command running background tasks (core.tasks)
+
+Usage:
+    python manage.py run_worker                   # tek thread, sürekli
+    python manage.py run_worker --concurrency 4   # 4 thread
+    python manage.py run_worker --burst           # kuyruğu boşalt ve çık
+    python manage.py run_worker --stats           # görev metriklerini göster
+"""
+
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections, connection
+
+from core.tasks import autodiscover_tasks, claim_task, requeue_stale_tasks, run_task, task_metrics
+
+
+class Command(BaseCommand):
+    help = 'Arka plan görevlerini çalıştırır (PostgreSQL SKIP LOCKED kuyruğu).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=1, help='Paralel çalışan thread sayısı')
+        parser.add_argument('--interval', type=float, default=2, help='Kuyruk boşken bekleme süresi (saniye)')
+        parser.add_argument('--burst', action='store_true', help='Kuyruk boşalınca çık')
+        parser.add_argument('--stats', action='store_true', help='Görev metriklerini yazdır ve çık')
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self._print_stats()
+            return
+
+        autodiscover_tasks()
+        self.stop = threading.Event()
+        self.lock = threading.Lock()
+        self.processed = self.failed = 0
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: self.stop.set())
+
+        requeued = requeue_stale_tasks()
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'{requeued} yarım kalmış görev tekrar kuyruğa alındı'))
+
+        concurrency = max(1, options['concurrency'])
+        threads = [
+            threading.Thread(target=self._loop, args=(options['interval'], options['burst']), daemon=True)
+            for _ in range(concurrency)
+        ]
+        self.stdout.write(f'Worker başladı ({concurrency} thread)')
+        for thread in threads:
+            thread.start()
+        try:
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(timeout=1)
+        except KeyboardInterrupt:
+            self.stop.set()
+            for thread in threads:
+                thread.join()
+        self.stdout.write(self.style.SUCCESS(f'Worker durdu: {self.processed} görev, {self.failed} hata'))
+
+    def _loop(self, interval, burst):
+        """Worker thread: claim and run tasks until stopped"""
+        try:
+            while not self.stop.is_set():
+                close_old_connections()
+                try:
+                    claimed = claim_task()
+                except DatabaseError as exc:
+                    self.stderr.write(self.style.ERROR(f'Kuyruk okunamadı: {exc}'))
+                    claimed = None
+                if claimed is None:
+                    if burst:
+                        return
+                    self.stop.wait(interval)
+                    continue
+                succeeded = run_task(claimed)
+                with self.lock:
+                    self.processed += 1
+                    self.failed += 0 if succeeded else 1
+        finally:
+            connection.close()  # Her thread kendi veritabanı bağlantısını kapatır
+
+    def _print_stats(self):
+        rows = task_metrics()
+        if not rows:
+            self.stdout.write('Kuyrukta görev yok.')
+            return
+        for row in rows:
+            avg = row['avg_duration'].total_seconds() * 1000 if row['avg_duration'] else 0
+            lag = row['oldest_pending'].total_seconds() if row['oldest_pending'] else 0
+            self.stdout.write(
+                f"{row['name']}: bekleyen={row['pending']} çalışan={row['running']} "
+                f"tamamlanan={row['done']} başarısız={row['failed']} "
+                f"ort. süre={avg:.0f} ms, en eski bekleyen={lag:.0f} sn"
+            )
@@ -0,0 +1,51 @@
+"""
+Management command to deliver queued e-mails (core.OutgoingEmail)
+
+Usage:
+    python manage.py send_queued_mail               # kuyruk boşalana kadar
+    python manage.py send_queued_mail --interval 10 # sürekli çalışan worker
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+
+from core.mail import BATCH_SIZE, send_queued_mail
+
+
+class Command(BaseCommand):
+    help = 'Kuyruktaki e-postaları tek SMTP bağlantısı ile toplu gönderir.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval', type=int, default=0,
+            help='Kuyruk boşaldığında kaç saniye beklenip tekrar bakılacağı (0: bir kez boşalt ve çık)',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=BATCH_SIZE,
+            help='Bir SMTP bağlantısında gönderilecek en fazla e-posta',
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        batch_size = options['batch_size']
+        while True:
+            close_old_connections()
+            self._drain(batch_size)
+            if interval <= 0:
+                break
+            time.sleep(interval)
+
+    def _drain(self, batch_size):
+        """Send batches until no due e-mail is left"""
+        while True:
+            try:
+                sent, failed = send_queued_mail(batch_size=batch_size)
+            except DatabaseError as exc:
+                self.stderr.write(self.style.ERROR(f'Kuyruk okunamadı: {exc}'))
+                return
+            if sent or failed:
+                self.stdout.write(f'Gönderildi: {sent}, başarısız: {failed}')
+            if sent + failed < batch_size:
+                return
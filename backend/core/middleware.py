@@ -2,42 +2,97 @@
 Core middleware for performance and SEO optimization
 """
 
-from django.utils.cache import patch_cache_control
+import re
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.middleware.gzip import GZipMiddleware as DjangoGZipMiddleware
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+from .pagecache import is_anonymous
+from .sessions import record_request
+
+
+MATCH_KEYS = ('path', 'prefix', 'regex', 'url_name')
+POLICY_KEYS = ('private', 'max_age', 's_maxage', 'stale_while_revalidate', 'stale_if_error', 'vary', 'surrogate_keys')
+
+
+def _matcher(rule):
+    """Compile the match part of a CACHE_CONTROL_RULES entry into ``match(request)``"""
+    keys = [key for key in MATCH_KEYS if key in rule]
+    if len(keys) != 1:
+        raise ImproperlyConfigured(f'CACHE_CONTROL_RULES: tek bir eşleşme anahtarı gerekli ({", ".join(MATCH_KEYS)}): {rule}')
+    key, value = keys[0], rule[keys[0]]
+    if key == 'path':
+        return lambda request: request.path == value
+    if key == 'prefix':
+        return lambda request: request.path.startswith(value)
+    if key == 'regex':
+        pattern = re.compile(value)
+        return lambda request: pattern.match(request.path) is not None
+    names = frozenset([value] if isinstance(value, str) else value)
+    return lambda request: request.resolver_match is not None and request.resolver_match.url_name in names
+
+
+def compile_rules(rules):
+    """[(match, policy)] for CACHE_CONTROL_RULES; unknown keys fail at startup"""
+    compiled = []
+    for rule in rules:
+        unknown = set(rule) - set(MATCH_KEYS) - set(POLICY_KEYS)
+        if unknown:
+            raise ImproperlyConfigured(f'CACHE_CONTROL_RULES: bilinmeyen anahtar {sorted(unknown)}: {rule}')
+        policy = {key: rule[key] for key in POLICY_KEYS if key in rule}
+        compiled.append((_matcher(rule), policy))
+    return compiled
 
 
 class CacheControlMiddleware:
     """
     Add cache control headers for better performance
+
+    Policies come from settings.CACHE_CONTROL_RULES, compiled once when the
+    middleware is created; the first matching rule wins. Public rules apply
+    to anonymous visitors (decided from the session cookie, the session is
+    not loaded for visitors without one) and send s-maxage,
+    stale-while-revalidate, Vary and a Surrogate-Key header (rule keys plus
+    the page's invalidation tags) for CDN/nginx purging. Private rules apply
+    to everyone. Other logged-in responses are not stored.
     """
     
-    # Pages that should have cache headers
-    CACHEABLE_PATHS = [
-        '/',
-        '/hakkimizda/',
-        '/hizmetlerimiz/',
-        '/iletisim/',
-        '/blog/',
-    ]
+    # Pages with validators (ETag from core.conditional) are revalidated by
+    # browsers after VALIDATED_MAX_AGE; a revalidation is a cheap 304
+    VALIDATED_MAX_AGE = 60
+    DEFAULT_MAX_AGE = 3600  # 1 hour
+    # Removed pages: a proxy's copy is replaced by the 404 (core.purge), briefly
+    NOT_FOUND_MAX_AGE = 60
     
     def __init__(self, get_response):
         self.get_response = get_response
+        self.rules = compile_rules(getattr(settings, 'CACHE_CONTROL_RULES', ()))
+    
+    def _policy(self, request):
+        for match, policy in self.rules:
+            if match(request):
+                return policy
+        return None
     
     def __call__(self, request):
         response = self.get_response(request)
+        policy = self._policy(request)
+        
+        if policy is not None and policy.get('private'):
+            if not response.has_header('Cache-Control'):
+                patch_cache_control(response, private=True, max_age=policy.get('max_age', 0))
+        
+        # Public pages, anonymous visitors; 304 carries the same policy, so the revalidated copy is fresh again
+        elif policy is not None and response.status_code in (200, 304) and is_anonymous(request):
+            self._apply_public(response, policy)
         
-        # Add cache headers for public pages
-        if request.path in self.CACHEABLE_PATHS or request.path.startswith('/blog/'):
-            # Cache for 1 hour for public pages
-            if response.status_code == 200 and not request.user.is_authenticated:
-                patch_cache_control(
-                    response,
-                    public=True,
-                    max_age=3600,  # 1 hour
-                    s_maxage=3600,
-                )
+        elif policy is not None and response.status_code == 404 and is_anonymous(request):
+            patch_cache_control(response, public=True, max_age=self.NOT_FOUND_MAX_AGE, s_maxage=self.NOT_FOUND_MAX_AGE)
         
-        # No cache for authenticated pages
-        elif request.user.is_authenticated:
+        # No cache for authenticated pages (unless the view set its own policy, e.g. downloads)
+        elif not response.has_header('Cache-Control') and not is_anonymous(request):
             patch_cache_control(
                 response,
                 private=True,
@@ -47,6 +102,33 @@ class CacheControlMiddleware:
             )
         
         return response
+    
+    def _apply_public(self, response, policy):
+        max_age = policy.get('max_age', self.DEFAULT_MAX_AGE)
+        if response.has_header('ETag'):
+            max_age = min(max_age, self.VALIDATED_MAX_AGE)
+        directives = {'public': True, 'max_age': max_age, 's_maxage': policy.get('s_maxage', max_age)}
+        for name in ('stale_while_revalidate', 'stale_if_error'):
+            if name in policy:
+                directives[name] = policy[name]
+        patch_cache_control(response, **directives)
+        if policy.get('vary'):
+            patch_vary_headers(response, policy['vary'])
+        surrogate_keys = [*policy.get('surrogate_keys', ()), *getattr(response, 'cache_tags', ())]
+        if surrogate_keys:
+            response['Surrogate-Key'] = ' '.join(dict.fromkeys(surrogate_keys))
+
+
+class GZipMiddleware(DjangoGZipMiddleware):
+    """
+    GZipMiddleware that leaves file downloads (core.downloads) alone:
+    compressing them would break Content-Length and byte ranges.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Range') or response.get('Accept-Ranges') == 'bytes':
+            return response
+        return super().process_response(request, response)
 
 
 class SecurityHeadersMiddleware:
@@ -70,3 +152,20 @@ class SecurityHeadersMiddleware:
         
         return response
 
+
+
+class SessionStatsMiddleware:
+    """
+    Count session loads and saves per request (core.sessions).
+    Placed before SessionMiddleware so it runs after the session is saved.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        response = self.get_response(request)
+        stats = getattr(getattr(request, 'session', None), 'stats', None)
+        if stats:
+            record_request(stats)
+        return response
@@ -0,0 +1,143 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# database/views.sql ile aynı tanımlar; eski düz view varsa önce kaldırılır
+CREATE_DASHBOARD_VIEWS = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_views WHERE viewname = 'dashboard_stats') THEN
+        DROP VIEW dashboard_stats;
+    END IF;
+    IF EXISTS (SELECT 1 FROM pg_views WHERE viewname = 'firm_dashboard_data') THEN
+        DROP VIEW firm_dashboard_data;
+    END IF;
+END $$;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS dashboard_stats AS
+SELECT
+    1 as id,
+    (SELECT COUNT(*) FROM firms_firm) as total_firms,
+    (SELECT COUNT(*) FROM firms_firm WHERE status = 'active') as active_firms,
+    (SELECT COUNT(*) FROM services_service) as total_services,
+    (SELECT COUNT(*) FROM services_service WHERE status = 'in_progress') as active_services,
+    (SELECT COUNT(*) FROM services_servicerequest WHERE status = 'pending') as pending_requests,
+    (SELECT COUNT(*) FROM core_contactmessage WHERE status = 'new') as pending_messages,
+    (SELECT COUNT(*) FROM services_service WHERE status = 'completed'
+     AND completion_date >= CURRENT_DATE - INTERVAL '30 days') as completed_this_month,
+    (SELECT COUNT(*) FROM documents_document
+     WHERE upload_date >= CURRENT_DATE - INTERVAL '7 days') as documents_this_week,
+    (SELECT COUNT(*) FROM blog_blogpost WHERE status = 'published') as published_posts,
+    now() as refreshed_at;
+
+CREATE UNIQUE INDEX IF NOT EXISTS dashboard_stats_id_idx ON dashboard_stats(id);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS firm_dashboard_data AS
+SELECT
+    f.id as firm_id,
+    f.name as firm_name,
+    f.contact_person,
+    COALESCE(s.total_services, 0) as total_services,
+    COALESCE(sr.total_requests, 0) as total_requests,
+    COALESCE(sr.active_requests, 0) as active_requests,
+    COALESCE(d.total_documents, 0) as total_documents,
+    COALESCE(s.completed_services, 0) as completed_services,
+    COALESCE(s.in_progress_services, 0) as in_progress_services,
+    s.last_service_date,
+    f.registration_date,
+    now() as refreshed_at
+FROM firms_firm f
+LEFT JOIN (
+    SELECT
+        firm_id,
+        COUNT(*) as total_services,
+        COUNT(*) FILTER (WHERE status = 'completed') as completed_services,
+        COUNT(*) FILTER (WHERE status = 'in_progress') as in_progress_services,
+        MAX(completion_date) as last_service_date
+    FROM services_service
+    GROUP BY firm_id
+) s ON s.firm_id = f.id
+LEFT JOIN (
+    SELECT
+        firm_id,
+        COUNT(*) as total_requests,
+        COUNT(*) FILTER (WHERE status IN ('pending', 'approved', 'in_progress')) as active_requests
+    FROM services_servicerequest
+    GROUP BY firm_id
+) sr ON sr.firm_id = f.id
+LEFT JOIN (
+    SELECT firm_id, COUNT(*) as total_documents
+    FROM documents_document
+    WHERE is_visible_to_firm = true
+    GROUP BY firm_id
+) d ON d.firm_id = f.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS firm_dashboard_data_firm_idx ON firm_dashboard_data(firm_id);
+"""
+
+DROP_DASHBOARD_VIEWS = """
+DROP MATERIALIZED VIEW IF EXISTS firm_dashboard_data;
+DROP MATERIALIZED VIEW IF EXISTS dashboard_stats;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_sitesettings_hero_subtitle_sitesettings_hero_title'),
+        ('firms', '0006_alter_firm_status'),
+        ('services', '0007_backfill_servicerequest_service'),
+        ('documents', '0004_alter_document_table_comment_and_more'),
+        ('blog', '0003_alter_blogpost_table_comment_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardStats',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(primary_key=True, serialize=False)),
+                ('total_firms', models.IntegerField()),
+                ('active_firms', models.IntegerField()),
+                ('total_services', models.IntegerField()),
+                ('active_services', models.IntegerField()),
+                ('pending_requests', models.IntegerField()),
+                ('pending_messages', models.IntegerField()),
+                ('completed_this_month', models.IntegerField()),
+                ('documents_this_week', models.IntegerField()),
+                ('published_posts', models.IntegerField()),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Panel İstatistiği',
+                'verbose_name_plural': 'Panel İstatistikleri',
+                'db_table': 'dashboard_stats',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='FirmDashboardData',
+            fields=[
+                ('firm', models.OneToOneField(db_column='firm_id', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='dashboard_data', serialize=False, to='firms.firm')),
+                ('firm_name', models.CharField(max_length=255)),
+                ('contact_person', models.CharField(max_length=255)),
+                ('total_services', models.IntegerField()),
+                ('total_requests', models.IntegerField()),
+                ('active_requests', models.IntegerField()),
+                ('total_documents', models.IntegerField()),
+                ('completed_services', models.IntegerField()),
+                ('in_progress_services', models.IntegerField()),
+                ('last_service_date', models.DateField(null=True)),
+                ('registration_date', models.DateTimeField()),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Firma Panel Verisi',
+                'verbose_name_plural': 'Firma Panel Verileri',
+                'db_table': 'firm_dashboard_data',
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(CREATE_DASHBOARD_VIEWS, DROP_DASHBOARD_VIEWS),
+    ]
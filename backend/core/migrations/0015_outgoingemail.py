@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:53
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_dashboard_materialized_views'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255, verbose_name='Konu')),
+                ('body', models.TextField(verbose_name='İçerik')),
+                ('from_email', models.CharField(max_length=254, verbose_name='Gönderen')),
+                ('recipients', models.JSONField(default=list, verbose_name='Alıcılar')),
+                ('status', models.CharField(choices=[('pending', 'Bekliyor'), ('sent', 'Gönderildi'), ('failed', 'Başarısız')], default='pending', max_length=10, verbose_name='Durum')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Deneme Sayısı')),
+                ('last_error', models.TextField(blank=True, verbose_name='Son Hata')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Sonraki Deneme')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='Gönderim Tarihi')),
+            ],
+            options={
+                'verbose_name': 'Giden E-posta',
+                'verbose_name_plural': 'Giden E-postalar',
+                'db_table_comment': 'E-posta kuyruğu - arka planda gönderilir',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outbox_status_next_idx'), models.Index(fields=['-created_at'], name='outbox_created_idx')],
+            },
+        ),
+    ]
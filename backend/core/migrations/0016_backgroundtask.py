@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:55
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_outgoingemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackgroundTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, verbose_name='Görev')),
+                ('args', models.JSONField(blank=True, default=list, verbose_name='Argümanlar')),
+                ('kwargs', models.JSONField(blank=True, default=dict, verbose_name='Anahtar Argümanlar')),
+                ('idempotency_key', models.CharField(blank=True, help_text='Aynı anahtarla ikinci kez kuyruğa alınan görev çalıştırılmaz', max_length=255, null=True, unique=True, verbose_name='Tekillik Anahtarı')),
+                ('status', models.CharField(choices=[('pending', 'Bekliyor'), ('running', 'Çalışıyor'), ('done', 'Tamamlandı'), ('failed', 'Başarısız')], default='pending', max_length=10, verbose_name='Durum')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Deneme Sayısı')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3, verbose_name='En Fazla Deneme')),
+                ('last_error', models.TextField(blank=True, verbose_name='Son Hata')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Çalışma Zamanı')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Başlama Zamanı')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Bitiş Zamanı')),
+            ],
+            options={
+                'verbose_name': 'Arka Plan Görevi',
+                'verbose_name_plural': 'Arka Plan Görevleri',
+                'db_table_comment': 'Arka plan görev kuyruğu',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='task_status_run_idx'), models.Index(fields=['name', 'status'], name='task_name_status_idx')],
+            },
+        ),
+    ]
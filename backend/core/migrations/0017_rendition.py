@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_backgroundtask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Rendition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=255, verbose_name='Kaynak Dosya')),
+                ('sha256', models.CharField(max_length=64, verbose_name='Kaynak SHA-256')),
+                ('spec', models.CharField(max_length=20, verbose_name='Boyut')),
+                ('name', models.CharField(max_length=255, verbose_name='Dosya')),
+                ('width', models.PositiveIntegerField(verbose_name='Genişlik')),
+                ('height', models.PositiveIntegerField(verbose_name='Yükseklik')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Görsel Türevi',
+                'verbose_name_plural': 'Görsel Türevleri',
+                'indexes': [models.Index(fields=['sha256', 'spec'], name='rendition_sha_spec_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='rendition',
+            constraint=models.UniqueConstraint(fields=('source', 'spec'), name='rendition_source_spec_uniq'),
+        ),
+    ]
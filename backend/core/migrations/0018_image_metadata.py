@@ -0,0 +1,135 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:19
+
+import core.fields
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_rendition'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servicecategory',
+            name='image_format',
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='servicecategory',
+            name='image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='servicecategory',
+            name='image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='about_image_format',
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='about_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='about_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='favicon_format',
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='favicon_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='favicon_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='hero_image_format',
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='hero_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='hero_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='logo_format',
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='logo_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='logo_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='teammember',
+            name='image_format',
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='teammember',
+            name='image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='teammember',
+            name='image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='servicecategory',
+            name='image',
+            field=core.fields.MeasuredImageField(blank=True, format_field='image_format', height_field='image_height', help_text='Önerilen boyut: 800x450px (16:9 oran) - Kartlarda gösterilir', null=True, upload_to='services/', verbose_name='Hizmet Görseli', width_field='image_width'),
+        ),
+        migrations.AlterField(
+            model_name='sitesettings',
+            name='about_image',
+            field=core.fields.MeasuredImageField(blank=True, format_field='about_image_format', height_field='about_image_height', help_text='Önerilen boyut: 800x600px veya 4:3 oran', null=True, upload_to='site/', verbose_name='Hakkımızda Sayfası Görseli', width_field='about_image_width'),
+        ),
+        migrations.AlterField(
+            model_name='sitesettings',
+            name='favicon',
+            field=core.fields.MeasuredImageField(blank=True, format_field='favicon_format', height_field='favicon_height', null=True, upload_to='site/', verbose_name='Favicon', width_field='favicon_width'),
+        ),
+        migrations.AlterField(
+            model_name='sitesettings',
+            name='hero_image',
+            field=core.fields.MeasuredImageField(blank=True, format_field='hero_image_format', height_field='hero_image_height', help_text='Önerilen boyut: 1920x1080px veya 16:9 oran', null=True, upload_to='site/', verbose_name='Ana Sayfa Hero Görseli', width_field='hero_image_width'),
+        ),
+        migrations.AlterField(
+            model_name='sitesettings',
+            name='logo',
+            field=core.fields.MeasuredImageField(blank=True, format_field='logo_format', height_field='logo_height', null=True, upload_to='site/', verbose_name='Logo', width_field='logo_width'),
+        ),
+        migrations.AlterField(
+            model_name='teammember',
+            name='image',
+            field=core.fields.MeasuredImageField(format_field='image_format', height_field='image_height', help_text='Tercihen kare (1:1) oran ve minimum 400x400px boyutunda', upload_to=core.models.team_member_image_path, verbose_name='Fotoğraf', width_field='image_width'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_image_metadata'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outgoingemail',
+            name='subject',
+            field=models.TextField(verbose_name='Konu'),
+        ),
+    ]
@@ -1,5 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+
+from .fields import MeasuredImageField
 
 class SiteSettings(models.Model):
     site_name = models.CharField(max_length=255, default='BYF Mühendislik', verbose_name='Site Adı')
@@ -7,15 +10,27 @@ class SiteSettings(models.Model):
     contact_email = models.EmailField(verbose_name='İletişim E-postası')
     contact_phone = models.CharField(max_length=15, verbose_name='İletişim Telefonu')
     address = models.TextField(verbose_name='Adres')
-    logo = models.ImageField(upload_to='site/', blank=True, null=True, verbose_name='Logo')
-    favicon = models.ImageField(upload_to='site/', blank=True, null=True, verbose_name='Favicon')
-    hero_image = models.ImageField(
+    logo = MeasuredImageField(upload_to='site/', blank=True, null=True, verbose_name='Logo',
+                              width_field='logo_width', height_field='logo_height', format_field='logo_format')
+    logo_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    logo_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    logo_format = models.CharField(max_length=10, blank=True, editable=False)
+    favicon = MeasuredImageField(upload_to='site/', blank=True, null=True, verbose_name='Favicon',
+                                 width_field='favicon_width', height_field='favicon_height', format_field='favicon_format')
+    favicon_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    favicon_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    favicon_format = models.CharField(max_length=10, blank=True, editable=False)
+    hero_image = MeasuredImageField(
         upload_to='site/', 
         blank=True, 
         null=True, 
         verbose_name='Ana Sayfa Hero Görseli',
-        help_text='Önerilen boyut: 1920x1080px veya 16:9 oran'
+        help_text='Önerilen boyut: 1920x1080px veya 16:9 oran',
+        width_field='hero_image_width', height_field='hero_image_height', format_field='hero_image_format',
     )
+    hero_image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    hero_image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    hero_image_format = models.CharField(max_length=10, blank=True, editable=False)
     hero_title = models.CharField(
         max_length=200, 
         default='Profesyonel Mühendislik Çözümleri',
@@ -27,13 +42,17 @@ class SiteSettings(models.Model):
         verbose_name='Ana Sayfa Hero Alt Başlığı',
         help_text='Ana sayfa hero bölümündeki açıklama metni'
     )
-    about_image = models.ImageField(
+    about_image = MeasuredImageField(
         upload_to='site/', 
         blank=True, 
         null=True, 
         verbose_name='Hakkımızda Sayfası Görseli',
-        help_text='Önerilen boyut: 800x600px veya 4:3 oran'
+        help_text='Önerilen boyut: 800x600px veya 4:3 oran',
+        width_field='about_image_width', height_field='about_image_height', format_field='about_image_format',
     )
+    about_image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    about_image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    about_image_format = models.CharField(max_length=10, blank=True, editable=False)
     facebook_url = models.URLField(blank=True, verbose_name='Facebook')
     twitter_url = models.URLField(blank=True, verbose_name='Twitter')
     linkedin_url = models.URLField(blank=True, verbose_name='LinkedIn')
@@ -162,13 +181,17 @@ class ServiceCategory(models.Model):
     icon = models.CharField(max_length=50, choices=ICON_CHOICES, default='fa-cogs', verbose_name='İkon')
     subtitle = models.CharField(max_length=300, verbose_name='Alt Başlık')
     description = models.TextField(verbose_name='Açıklama')
-    image = models.ImageField(
+    image = MeasuredImageField(
         upload_to='services/',
         blank=True,
         null=True,
         verbose_name='Hizmet Görseli',
-        help_text='Önerilen boyut: 800x450px (16:9 oran) - Kartlarda gösterilir'
+        help_text='Önerilen boyut: 800x450px (16:9 oran) - Kartlarda gösterilir',
+        width_field='image_width', height_field='image_height', format_field='image_format',
     )
+    image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_format = models.CharField(max_length=10, blank=True, editable=False)
     
     # Hizmet Kapsamı
     scope_items = models.TextField(
@@ -267,11 +290,15 @@ class TeamMember(models.Model):
     slug = models.SlugField(max_length=200, unique=True, verbose_name='URL Slug')
     title = models.CharField(max_length=200, verbose_name='Ünvan/Pozisyon')
     bio = models.TextField(verbose_name='Biyografi/Açıklama')
-    image = models.ImageField(
+    image = MeasuredImageField(
         upload_to=team_member_image_path,
         verbose_name='Fotoğraf',
-        help_text='Tercihen kare (1:1) oran ve minimum 400x400px boyutunda'
+        help_text='Tercihen kare (1:1) oran ve minimum 400x400px boyutunda',
+        width_field='image_width', height_field='image_height', format_field='image_format',
     )
+    image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_format = models.CharField(max_length=10, blank=True, editable=False)
     email = models.EmailField(blank=True, verbose_name='E-posta')
     phone = models.CharField(max_length=20, blank=True, verbose_name='Telefon')
     linkedin_url = models.URLField(blank=True, verbose_name='LinkedIn URL')
@@ -292,4 +319,168 @@ class TeamMember(models.Model):
         db_table_comment = 'Ekip üyeleri - hakkımızda sayfası için'
     
     def __str__(self):
-        return f"{self.name} - {self.title}"
\ No newline at end of file
+        return f"{self.name} - {self.title}"
+
+class DashboardStats(models.Model):
+    """
+    Yönetici paneli özeti - `dashboard_stats` materialized view (tek satır).
+    `refresh_dashboard_views` komutu ile yenilenir, Django tarafından yönetilmez.
+    """
+    id = models.PositiveSmallIntegerField(primary_key=True)
+    total_firms = models.IntegerField()
+    active_firms = models.IntegerField()
+    total_services = models.IntegerField()
+    active_services = models.IntegerField()
+    pending_requests = models.IntegerField()
+    pending_messages = models.IntegerField()
+    completed_this_month = models.IntegerField()
+    documents_this_week = models.IntegerField()
+    published_posts = models.IntegerField()
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'dashboard_stats'
+        verbose_name = 'Panel İstatistiği'
+        verbose_name_plural = 'Panel İstatistikleri'
+
+    def __str__(self):
+        return f"Panel istatistikleri ({self.refreshed_at})"
+
+
+class FirmDashboardData(models.Model):
+    """
+    Firma paneli sayaçları - `firm_dashboard_data` materialized view (firma başına bir satır).
+    `refresh_dashboard_views` komutu ile yenilenir, Django tarafından yönetilmez.
+    """
+    firm = models.OneToOneField(
+        'firms.Firm', on_delete=models.DO_NOTHING, primary_key=True,
+        db_column='firm_id', related_name='dashboard_data'
+    )
+    firm_name = models.CharField(max_length=255)
+    contact_person = models.CharField(max_length=255)
+    total_services = models.IntegerField()
+    total_requests = models.IntegerField()
+    active_requests = models.IntegerField()
+    total_documents = models.IntegerField()
+    completed_services = models.IntegerField()
+    in_progress_services = models.IntegerField()
+    last_service_date = models.DateField(null=True)
+    registration_date = models.DateTimeField()
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'firm_dashboard_data'
+        verbose_name = 'Firma Panel Verisi'
+        verbose_name_plural = 'Firma Panel Verileri'
+
+    def __str__(self):
+        return self.firm_name
+
+
+class OutgoingEmail(models.Model):
+    """
+    E-posta kuyruğu (outbox). İstek içinde sadece kayıt oluşturulur;
+    `send_queued_mail` komutu tek SMTP bağlantısı ile toplu gönderir.
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Bekliyor'),
+        ('sent', 'Gönderildi'),
+        ('failed', 'Başarısız'),
+    )
+
+    subject = models.TextField(verbose_name='Konu')  # Form alanlarından oluşur, 255'i aşabilir
+    body = models.TextField(verbose_name='İçerik')
+    from_email = models.CharField(max_length=254, verbose_name='Gönderen')
+    recipients = models.JSONField(default=list, verbose_name='Alıcılar')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending', verbose_name='Durum')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='Deneme Sayısı')
+    last_error = models.TextField(blank=True, verbose_name='Son Hata')
+    next_attempt_at = models.DateTimeField(default=timezone.now, verbose_name='Sonraki Deneme')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name='Gönderim Tarihi')
+
+    class Meta:
+        verbose_name = 'Giden E-posta'
+        verbose_name_plural = 'Giden E-postalar'
+        ordering = ['-created_at']
+        indexes = [
+            # Worker sorgusu: status='pending' AND next_attempt_at <= now()
+            models.Index(fields=['status', 'next_attempt_at'], name='outbox_status_next_idx'),
+            models.Index(fields=['-created_at'], name='outbox_created_idx'),
+        ]
+        db_table_comment = 'E-posta kuyruğu - arka planda gönderilir'
+
+    def __str__(self):
+        return f"{self.subject} → {', '.join(self.recipients)}"
+
+
+class BackgroundTask(models.Model):
+    """
+    Arka plan görevi (core.tasks). `run_worker` komutu SELECT ... FOR UPDATE
+    SKIP LOCKED ile görevleri alır; harici bir kuyruk sunucusu gerekmez.
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Bekliyor'),
+        ('running', 'Çalışıyor'),
+        ('done', 'Tamamlandı'),
+        ('failed', 'Başarısız'),
+    )
+
+    name = models.CharField(max_length=255, verbose_name='Görev')
+    args = models.JSONField(default=list, blank=True, verbose_name='Argümanlar')
+    kwargs = models.JSONField(default=dict, blank=True, verbose_name='Anahtar Argümanlar')
+    idempotency_key = models.CharField(max_length=255, null=True, blank=True, unique=True,
+                                       verbose_name='Tekillik Anahtarı',
+                                       help_text='Aynı anahtarla ikinci kez kuyruğa alınan görev çalıştırılmaz')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending', verbose_name='Durum')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='Deneme Sayısı')
+    max_attempts = models.PositiveSmallIntegerField(default=3, verbose_name='En Fazla Deneme')
+    last_error = models.TextField(blank=True, verbose_name='Son Hata')
+    run_after = models.DateTimeField(default=timezone.now, verbose_name='Çalışma Zamanı')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name='Başlama Zamanı')
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name='Bitiş Zamanı')
+
+    class Meta:
+        verbose_name = 'Arka Plan Görevi'
+        verbose_name_plural = 'Arka Plan Görevleri'
+        ordering = ['-created_at']
+        indexes = [
+            # Worker sorgusu: status='pending' AND run_after <= now()
+            models.Index(fields=['status', 'run_after'], name='task_status_run_idx'),
+            models.Index(fields=['name', 'status'], name='task_name_status_idx'),
+        ]
+        db_table_comment = 'Arka plan görev kuyruğu'
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
+
+
+class Rendition(models.Model):
+    """
+    Küçük resim / önizleme (core.renditions). Dosyalar içerik özetine göre
+    saklanır (renditions/ab/<sha256>/<spec>.jpg); aynı dosya farklı adlarla
+    yüklense de bir kez üretilir. ``source`` orijinal dosyanın depolama yoludur.
+    """
+    source = models.CharField(max_length=255, verbose_name='Kaynak Dosya')
+    sha256 = models.CharField(max_length=64, verbose_name='Kaynak SHA-256')
+    spec = models.CharField(max_length=20, verbose_name='Boyut')
+    name = models.CharField(max_length=255, verbose_name='Dosya')
+    width = models.PositiveIntegerField(verbose_name='Genişlik')
+    height = models.PositiveIntegerField(verbose_name='Yükseklik')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Görsel Türevi'
+        verbose_name_plural = 'Görsel Türevleri'
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'spec'], name='rendition_source_spec_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['sha256', 'spec'], name='rendition_sha_spec_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.source} ({self.spec})"
@@ -0,0 +1,174 @@
+"""
+Full-page cache for anonymous visitors
+
+Public pages (home, about, services, blog) are the same for every visitor
+without a login. ``cache_public_page`` stores the rendered HTML in the cache
+(Redis in production) and answers the next anonymous request from there:
+no view code, no template rendering, no PostgreSQL query.
+
+    @cache_public_page('blog_posts')
+    def blog_list(request): ...
+
+Entries are keyed by host, path, sorted query string and language, and carry
+the version stamps of their tags (core.invalidation). The base template's
+data (site settings, footer service categories) is a dependency of every
+page (BASE_TAGS). core.signals bumps the tags of the model that changed, so
+a blog post edit refreshes the blog pages and the home page, nothing else.
+
+Stampede protection: one request re-renders an outdated page (lock taken
+with ``cache.add``); meanwhile others get the previous copy, or, for a page
+that was never cached, wait briefly for the first render.
+
+Conditional GET: every page served or stored here carries an ETag and
+Last-Modified derived from the same stamps (core.conditional); a matching
+If-None-Match / If-Modified-Since is answered with 304 before the view runs.
+
+Requests that are not cached: other methods than GET/HEAD, logged-in users,
+pending flash messages. Responses that are not stored: non-200, ones that
+set cookies, used a CSRF token or added messages.
+"""
+
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.http import urlencode
+from django.utils.translation import get_language
+
+from .conditional import not_modified, page_validators, set_validators
+from .invalidation import get_with_versions
+
+
+PAGE_TIMEOUT = 60 * 10
+LOCK_TIMEOUT = 30  # render süresinden uzun olmalı
+LOCK_WAIT = 2.0  # never-cached page: seconds to wait for the first render
+POLL_INTERVAL = 0.05
+BASE_TAGS = ('site_settings', 'service_categories')  # base.html, footer
+MESSAGES_COOKIE = 'messages'  # django.contrib.messages CookieStorage
+
+
+def is_anonymous(request):
+    """True for visitors without a login; no session lookup when there is no session cookie"""
+    if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+        return True
+    return not request.user.is_authenticated
+
+
+def _cacheable_request(request):
+    return (
+        request.method in ('GET', 'HEAD')
+        and MESSAGES_COOKIE not in request.COOKIES
+        and is_anonymous(request)
+    )
+
+
+def _storable_response(request, response):
+    messages = getattr(request, '_messages', None)
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')  # Sayfa ziyaretçiye özel token içeriyor
+        and not getattr(messages, 'added_new', False)
+    )
+
+
+def page_cache_key(request):
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    raw = f'{request.scheme}://{request.get_host()}{request.path}?{query}|{get_language()}'
+    return f"page:{hashlib.md5(raw.encode('utf-8')).hexdigest()}"
+
+
+def _response(key, entry, state):
+    response = HttpResponse(entry['content'], content_type=entry['content_type'])
+    response['X-Page-Cache'] = state
+    return set_validators(response, *page_validators(key, entry['versions']))
+
+
+def _store(key, versions, response, timeout):
+    cache.set(key, {
+        'versions': versions,
+        'content': response.content,
+        'content_type': response['Content-Type'],
+        'meta': getattr(response, 'page_cache_meta', None),
+    }, timeout)
+
+
+def _wait_for_render(key, versions):
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None and entry['versions'] == versions:
+            return entry
+    return None
+
+
+def cache_public_page(*tags, timeout=PAGE_TIMEOUT, on_hit=None):
+    """
+    Cache a public view's HTML for anonymous visitors.
+
+    Args:
+        tags: Invalidation tags of the data the page shows (besides BASE_TAGS)
+        timeout: Seconds an entry is kept
+        on_hit: ``on_hit(request, meta)`` for work that must happen on every
+                view even when the page comes from the cache (view counts).
+                ``meta`` is what the view put on ``response.page_cache_meta``.
+    """
+    dependencies = BASE_TAGS + tuple(tag for tag in tags if tag not in BASE_TAGS)
+
+    def decorator(view):
+        def serve(request, *args, **kwargs):
+            if not _cacheable_request(request):
+                return view(request, *args, **kwargs)
+
+            key = page_cache_key(request)
+            entry, versions = get_with_versions(key, dependencies)
+            current = entry is not None and entry['versions'] == versions
+            validators = page_validators(key, versions)
+            response = not_modified(request, *validators)
+            if response is not None:
+                # İstemcinin kopyası güncel: görünüm çalışmaz
+                if current and on_hit is not None:
+                    on_hit(request, entry['meta'])
+                if response.status_code == 304:
+                    set_validators(response, *validators)
+                return response
+
+            if current:
+                state = 'HIT'
+            else:
+                lock = f'{key}:lock'
+                if cache.add(lock, True, LOCK_TIMEOUT):
+                    try:
+                        response = view(request, *args, **kwargs)
+                        if _storable_response(request, response):
+                            _store(key, versions, response, timeout)
+                            set_validators(response, *validators)
+                    finally:
+                        cache.delete(lock)
+                    response['X-Page-Cache'] = 'MISS'
+                    return response
+                # Başka bir istek sayfayı yeniden oluşturuyor
+                if entry is not None:
+                    state = 'STALE'
+                else:
+                    entry = _wait_for_render(key, versions)
+                    if entry is None:
+                        return view(request, *args, **kwargs)
+                    state = 'HIT'
+
+            if on_hit is not None:
+                on_hit(request, entry['meta'])
+            return _response(key, entry, state)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = serve(request, *args, **kwargs)
+            response.cache_tags = dependencies  # Surrogate-Key (core.middleware.CacheControlMiddleware)
+            return response
+        return wrapper
+    return decorator
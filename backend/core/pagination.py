@@ -0,0 +1,301 @@
+"""
+Keyset (cursor) pagination shared by list views and the REST API
+
+Unlike OFFSET/LIMIT pagination, each page is fetched with a WHERE condition on
+the ordering columns of the last row seen, so the database walks the matching
+composite index (e.g. ``(firm, -upload_date)``) straight to the next page.
+Deep pages cost the same as the first one and no ``COUNT(*)`` is ever issued.
+
+Usage in function views:
+    page = paginate_keyset(request, documents, ordering=('-upload_date',))
+    return render(request, 'documents/document_list.html', {'documents': page, 'page': page})
+
+Usage in DRF viewsets:
+    pagination_class = KeysetCursorPagination
+    ordering = ('-upload_date',)
+"""
+
+import base64
+import binascii
+import copy
+import json
+from functools import cached_property
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded for the given ordering"""
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by ordering columns instead of offsets.
+
+    ``ordering`` lists model fields like ``order_by()`` (``'-upload_date'``),
+    or annotations of the queryset such as a search rank. The primary key is
+    appended as a tie-breaker so every row has a unique position. NULLs
+    follow PostgreSQL defaults (greater than any value), which keeps nullable
+    columns such as ``completion_date`` on their plain index.
+    """
+
+    def __init__(self, queryset, ordering, per_page=DEFAULT_PAGE_SIZE):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.keys = self._build_keys(queryset, ordering)
+
+    @staticmethod
+    def _annotation_field(queryset, name):
+        """Helper: A copy of the annotation's output field, addressable by name"""
+        field = copy.copy(queryset.query.annotations[name].output_field)
+        field.name = field.attname = name
+        return field
+
+    @classmethod
+    def _build_keys(cls, queryset, ordering):
+        model = queryset.model
+        keys = []
+        for item in ordering:
+            descending = item.startswith('-')
+            name = item.lstrip('-')
+            if name in queryset.query.annotations:
+                field = cls._annotation_field(queryset, name)
+            else:
+                field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+            keys.append((field, descending))
+            if field.primary_key:
+                break
+        else:
+            # Tie-breaker follows the direction of the last ordering column
+            keys.append((model._meta.pk, keys[-1][1] if keys else True))
+        return keys
+
+    def order_by(self, backwards=False):
+        """Order expressions for a forward (or reversed) scan"""
+        return [
+            f"{'-' if descending != backwards else ''}{field.attname}"
+            for field, descending in self.keys
+        ]
+
+    def encode_cursor(self, obj, backwards=False):
+        """Serialize the ordering values of ``obj`` into an opaque cursor"""
+        values = []
+        for field, _ in self.keys:
+            value = getattr(obj, field.attname)
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        payload = json.dumps({'v': values, 'b': backwards}, separators=(',', ':'), default=str)
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """Return ``(values, backwards)`` for a cursor produced by encode_cursor"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            raw_values, backwards = payload['v'], bool(payload['b'])
+            if len(raw_values) != len(self.keys):
+                raise InvalidCursor('Cursor does not match ordering')
+            values = [
+                None if raw is None else field.to_python(raw)
+                for (field, _), raw in zip(self.keys, raw_values)
+            ]
+        except (binascii.Error, ValueError, TypeError, KeyError, ValidationError) as exc:
+            raise InvalidCursor(str(exc)) from exc
+        return values, backwards
+
+    def _seek(self, keys, values, backwards):
+        """
+        Build the WHERE condition selecting rows after ``values``.
+
+        For ``a DESC, id DESC`` this produces
+        ``a <= x AND (a < x OR (a = x AND id < y))``; the redundant first bound
+        lets PostgreSQL start an index range scan at the cursor position.
+        """
+        (field, descending), rest = keys[0], keys[1:]
+        value = values[0]
+        name = field.attname
+        lookup = 'lt' if descending != backwards else 'gt'
+        towards_nulls = lookup == 'gt'  # NULLs sort as the largest values
+
+        if not rest:
+            return Q(**{f'{name}__{lookup}': value})
+
+        tail = self._seek(rest, values[1:], backwards)
+        if value is None:
+            condition = Q(**{f'{name}__isnull': True}) & tail
+            if not towards_nulls:
+                condition |= Q(**{f'{name}__isnull': False})
+            return condition
+
+        condition = Q(**{f'{name}__{lookup}': value}) | (Q(**{name: value}) & tail)
+        if field.null:
+            if towards_nulls:
+                condition |= Q(**{f'{name}__isnull': True})
+            return condition
+        return Q(**{f'{name}__{lookup}e': value}) & condition
+
+    def page(self, cursor=None):
+        """Return the page following (or preceding) ``cursor``"""
+        values, backwards = (None, False)
+        if cursor:
+            try:
+                values, backwards = self.decode_cursor(cursor)
+            except InvalidCursor:
+                values, backwards = (None, False)  # Fall back to the first page
+        return KeysetPage(self, values, backwards)
+
+
+class KeysetPage:
+    """
+    A single page of a KeysetPaginator.
+
+    The query runs lazily on first access, so a page that is never rendered
+    costs nothing. Iterating the page yields its objects.
+    """
+
+    cursor_param = 'cursor'
+    request_params = None
+
+    def __init__(self, paginator, values=None, backwards=False):
+        self.paginator = paginator
+        self.values = values
+        self.backwards = backwards
+        self._has_more = False
+
+    @cached_property
+    def object_list(self):
+        paginator = self.paginator
+        queryset = paginator.queryset.order_by(*paginator.order_by(self.backwards))
+        if self.values is not None:
+            queryset = queryset.filter(paginator._seek(paginator.keys, self.values, self.backwards))
+        rows = list(queryset[:paginator.per_page + 1])
+        self._has_more = len(rows) > paginator.per_page
+        rows = rows[:paginator.per_page]
+        if self.backwards:
+            rows.reverse()
+        return rows
+
+    @property
+    def has_next(self):
+        self.object_list
+        return self._has_more if not self.backwards else True
+
+    @property
+    def has_previous(self):
+        self.object_list
+        return self._has_more if self.backwards else self.values is not None
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+    @property
+    def next_cursor(self):
+        if not self.has_next or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        if not self.has_previous or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(self.object_list[0], backwards=True)
+
+    def _url(self, cursor):
+        if cursor is None or self.request_params is None:
+            return None
+        params = self.request_params.copy()
+        params[self.cursor_param] = cursor
+        return f'?{params.urlencode()}'
+
+    @property
+    def next_url(self):
+        return self._url(self.next_cursor)
+
+    @property
+    def previous_url(self):
+        return self._url(self.previous_cursor)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+
+def _get_page_size(request, default):
+    """Helper: Read an optional ?page_size= capped at MAX_PAGE_SIZE"""
+    try:
+        size = int(request.GET.get('page_size', default))
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def paginate_keyset(request, queryset, ordering, per_page=DEFAULT_PAGE_SIZE, cursor_param='cursor'):
+    """
+    Paginate a queryset for a template view.
+
+    The returned page also carries ``next_url``/``previous_url`` query strings
+    that keep the current filters, ready for ``includes/keyset_pagination.html``.
+    """
+    paginator = KeysetPaginator(queryset, ordering, per_page=_get_page_size(request, per_page))
+    page = paginator.page(request.GET.get(cursor_param))
+    page.cursor_param = cursor_param
+    page.request_params = request.GET
+    return page
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    DRF pagination class backed by KeysetPaginator.
+
+    Views declare ``ordering`` (defaults to ``('-pk',)``); responses contain
+    ``next``/``previous`` links and ``results``, without a ``count`` field.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size = DEFAULT_PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        ordering = getattr(view, 'ordering', None) or ('-pk',)
+        paginator = KeysetPaginator(queryset, ordering, per_page=_get_page_size(request, self.page_size))
+        self.page = paginator.page(request.query_params.get(self.cursor_query_param))
+        return list(self.page)
+
+    def _link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self._link(self.page.next_cursor),
+            'previous': self._link(self.page.previous_cursor),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,97 @@
+"""
+Refresh of the nginx microcache (deployment/nginx/nginx.conf)
+
+nginx keeps anonymous HTML for the s-maxage CacheControlMiddleware sends.
+When a model behind those pages changes, core.signals calls
+``purge_tags`` with the same invalidation tags the Django page cache uses;
+a worker (core.tasks) then requests each affected page from nginx with
+``X-Cache-Refresh: 1``. nginx accepts that header only from the
+docker-compose network, bypasses its copy and stores the fresh response in
+its place (stock nginx has no PURGE). Both gzip and plain variants are refreshed.
+
+Disabled unless settings.CACHE_PURGE_URL points at nginx (``http://nginx``
+in docker-compose).
+"""
+
+import logging
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.urls import reverse
+
+from .tasks import enqueue, task
+
+
+logger = logging.getLogger(__name__)
+
+REFRESH_HEADER = 'X-Cache-Refresh'
+ENCODINGS = ('gzip', 'identity')  # nginx cache key: gzip or not
+REQUEST_TIMEOUT = 10
+ALL_PAGES = None  # Header/footer data: every cached page
+
+# Invalidation tag -> URL names of the pages built from it (core.pagecache)
+TAG_PAGES = {
+    'site_settings': ALL_PAGES,
+    'service_categories': ALL_PAGES,
+    'blog_posts': ('home', 'blog_list'),
+    'team_members': ('about',),
+}
+PUBLIC_PAGES = ('home', 'about', 'services_list', 'blog_list')
+
+
+def _all_paths():
+    from blog.models import BlogPost
+
+    slugs = BlogPost.objects.filter(status='published').values_list('slug', flat=True)
+    return [reverse(name) for name in PUBLIC_PAGES] + [reverse('blog_detail', args=[slug]) for slug in slugs]
+
+
+def paths_for_tags(tags):
+    """Paths of the public pages built from any of ``tags``"""
+    paths = set()
+    for tag in tags:
+        names = TAG_PAGES.get(tag, ())
+        if names is ALL_PAGES:
+            return set(_all_paths())
+        paths.update(reverse(name) for name in names)
+    return paths
+
+
+def purge_tags(tags, paths=()):
+    """
+    Queue a refresh of the pages built from ``tags``, plus ``paths``
+    (e.g. the changed post's own page). No-op without CACHE_PURGE_URL.
+    """
+    if not getattr(settings, 'CACHE_PURGE_URL', ''):
+        return
+    enqueue(refresh_pages, sorted(paths_for_tags(tags) | set(paths)))
+
+
+@task
+def refresh_pages(paths):
+    """Re-fetch ``paths`` through nginx so its microcache holds the current version"""
+    base = settings.CACHE_PURGE_URL.rstrip('/')
+    host = urlsplit(settings.SITE_URL).netloc
+    failed = []
+    for path in paths:
+        for encoding in ENCODINGS:
+            request = urllib.request.Request(f'{base}{path}', headers={
+                'Host': host,
+                REFRESH_HEADER: '1',
+                'Accept-Encoding': encoding,
+            })
+            try:
+                with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+                    response.read()
+            except urllib.error.HTTPError as error:
+                error.close()  # 404: yayından kalkmış sayfa, nginx'teki kopyanın yerine geçer
+                if error.code >= 500:
+                    failed.append(path)
+            except OSError as error:
+                logger.warning('nginx önbelleği yenilenemedi: %s (%s)', path, error)
+                failed.append(path)
+    if failed:
+        # Görev yeniden denenir (core.tasks)
+        raise RuntimeError(f'Yenilenemeyen sayfalar: {", ".join(sorted(set(failed)))}')
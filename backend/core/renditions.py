@@ -0,0 +1,340 @@
+"""
+Thumbnails and previews generated in the background
+
+Templates ask for a rendition of a stored file (``{% rendition document.file
+'thumb' as thumb %}``) or for a srcset (``responsive_image``). A ready
+rendition comes from the source's manifest (cache, then the Rendition
+table); a missing one is queued once for a worker (core.tasks) and the
+template falls back to an icon or the original, so a request never decodes
+an image itself.
+
+Spec groups:
+    basic       thumb (320px) and preview (1200px) JPEGs - documents, lists
+    responsive  width steps (RESPONSIVE_WIDTHS) as WebP plus a JPEG fallback
+                for public page images (hero, service, team, blog)
+
+The worker hashes the original and writes renditions under
+``renditions/ab/<sha256>/<spec>.<ext>``. The same content uploaded under
+another name (another firm, another post) reuses the files already there.
+Images are resized with Pillow; the first page of a PDF is rasterized by
+``pdftoppm`` (poppler-utils) in a subprocess. Pillow releases the GIL while
+decoding and resampling, so ``run_worker --concurrency N`` renders in
+parallel.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from PIL import Image, ImageOps
+
+from .models import Rendition
+from .tasks import enqueue, task
+
+
+logger = logging.getLogger(__name__)
+
+# name -> (max width, max height, format); aspect ratio is kept
+SPECS = {
+    'thumb': (320, 320, 'JPEG'),      # Listeler
+    'preview': (1200, 1200, 'JPEG'),  # Detay sayfaları
+}
+EXTENSIONS = {'JPEG': 'jpg', 'WEBP': 'webp'}
+RESPONSIVE_WIDTHS = (320, 640, 960, 1280, 1920)
+RESPONSIVE_FORMATS = ('WEBP', 'JPEG')  # <picture>: WebP, JPEG fallback
+FALLBACK_WIDTH = 960  # <img src> for browsers without srcset
+MAX_HEIGHT = 4000  # width steps only limit the width
+SPECS.update({
+    f'w{width}-{EXTENSIONS[image_format]}': (width, MAX_HEIGHT, image_format)
+    for width in RESPONSIVE_WIDTHS for image_format in RESPONSIVE_FORMATS
+})
+GROUPS = {
+    'basic': ('thumb', 'preview'),
+    'responsive': tuple(spec for spec in SPECS if spec.startswith('w')),
+}
+SAVE_OPTIONS = {
+    'JPEG': {'quality': 82, 'optimize': True, 'progressive': True},
+    'WEBP': {'quality': 80, 'method': 4},
+}
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+PDF_EXTENSIONS = {'.pdf'}
+PDF_TIMEOUT = 60  # seconds for pdftoppm
+CACHE_TIMEOUT = 60 * 60 * 24
+PENDING_TIMEOUT = 60 * 10  # a failed rendition is queued again after this
+CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=1)
+def _pdftoppm():
+    return shutil.which('pdftoppm')
+
+
+def can_render(name):
+    """True if renditions can be made for a stored file of this type"""
+    extension = os.path.splitext(name or '')[1].lower()
+    return extension in IMAGE_EXTENSIONS or (extension in PDF_EXTENSIONS and _pdftoppm() is not None)
+
+
+def _cache_key(source):
+    return f"rendition:{hashlib.md5(source.encode('utf-8')).hexdigest()}"
+
+
+def rendition_path(sha256, spec):
+    return f'renditions/{sha256[:2]}/{sha256}/{spec}.{EXTENSIONS[SPECS[spec][2]]}'
+
+
+def _load_manifests(sources):
+    manifests = {source: {} for source in sources}
+    for rendition in Rendition.objects.filter(source__in=sources):
+        manifests[rendition.source][rendition.spec] = (rendition.name, rendition.width, rendition.height)
+    return manifests
+
+
+def _load_manifest(source):
+    return _load_manifests([source])[source]
+
+
+def get_manifests(sources, group='basic', queue=True):
+    """
+    Ready renditions of several stored files: {source: {spec: (name, width, height)}}.
+
+    One cache round trip, and one query for the sources the cache misses.
+    With ``queue`` a source missing a spec of ``group`` is queued once (the
+    first caller wins); an empty manifest is cached only briefly, until the
+    worker fills it in.
+    """
+    keys = {source: _cache_key(source) for source in dict.fromkeys(sources)}
+    cached = cache.get_many(list(keys.values()))
+    manifests = {source: cached[key] for source, key in keys.items() if key in cached}
+    missing = [source for source in keys if source not in manifests]
+    if missing:
+        loaded = _load_manifests(missing)
+        cache.set_many({keys[source]: loaded[source] for source in missing if loaded[source]}, CACHE_TIMEOUT)
+        cache.set_many({keys[source]: {} for source in missing if not loaded[source]}, PENDING_TIMEOUT)
+        manifests.update(loaded)
+    if queue:
+        for source, manifest in manifests.items():
+            if any(spec not in manifest for spec in GROUPS[group]) and cache.add(f'{keys[source]}:{group}', True, PENDING_TIMEOUT):
+                enqueue(generate_renditions, source, group)
+    return manifests
+
+
+def get_manifest(source, group='basic'):
+    """Ready renditions of one stored file, queueing missing specs (see get_manifests)"""
+    return get_manifests([source], group)[source]
+
+
+def prefetch_renditions(fieldfiles, group='basic'):
+    """
+    Load the renditions of a page of files in one round trip, for
+    ``{% rendition %}`` (basic) or ``responsive_image`` (responsive) in list
+    templates. Nothing is queued here: uploads queue their renditions
+    (documents.signals, core.signals).
+    """
+    fieldfiles = [fieldfile for fieldfile in fieldfiles if fieldfile and can_render(fieldfile.name)]
+    manifests = get_manifests([fieldfile.name for fieldfile in fieldfiles], group, queue=False)
+    for fieldfile in fieldfiles:
+        fieldfile._rendition_manifest = manifests[fieldfile.name]
+
+
+def _manifest(fieldfile, group):
+    manifest = getattr(fieldfile, '_rendition_manifest', None)  # prefetch_renditions
+    if manifest is None:
+        manifest = get_manifest(fieldfile.name, group)
+    return manifest
+
+
+def _rendition(manifest, spec):
+    entry = manifest.get(spec)
+    if entry is None:
+        return None
+    name, width, height = entry
+    return {'url': default_storage.url(name), 'width': width, 'height': height}
+
+
+def get_rendition(fieldfile, spec='thumb'):
+    """
+    Rendition of a FileField/ImageField value for templates.
+
+    Returns:
+        dict: url, width, height - or None while it is not ready
+    """
+    if not fieldfile or not can_render(fieldfile.name):
+        return None
+    return _rendition(_manifest(fieldfile, 'basic'), spec)
+
+
+def get_picture(fieldfile):
+    """
+    Srcset and preview of a public page image from one manifest lookup.
+
+    Only the responsive group is queued; the preview is used when an earlier
+    upload already has one.
+
+    Returns:
+        tuple: (srcset, preview), either None. srcset: webp and jpeg srcset
+               strings, src (JPEG fallback), width and height of the largest
+               variant; preview: as in get_rendition
+    """
+    if not fieldfile or not can_render(fieldfile.name):
+        return None, None
+    manifest = _manifest(fieldfile, 'responsive')
+    srcset = _picture_srcset(manifest)
+    return srcset, None if srcset else _rendition(manifest, 'preview')
+
+
+def _picture_srcset(manifest):
+    if any(spec not in manifest for spec in GROUPS['responsive']):
+        return None
+    variants = {}
+    for image_format in RESPONSIVE_FORMATS:
+        # Orijinalden geniş adımlar aynı dosyayı gösterir; srcset'te bir kez yer alır
+        by_width = variants[image_format] = {}
+        for width in RESPONSIVE_WIDTHS:
+            name, actual_width, actual_height = manifest[f'w{width}-{EXTENSIONS[image_format]}']
+            by_width.setdefault(actual_width, (name, actual_height))
+    jpeg = variants['JPEG']
+    largest = max(jpeg)
+    fallback = max((width for width in jpeg if width <= FALLBACK_WIDTH), default=min(jpeg))
+    return {
+        'webp': _srcset(variants['WEBP']),
+        'jpeg': _srcset(jpeg),
+        'src': default_storage.url(jpeg[fallback][0]),
+        'width': largest,
+        'height': jpeg[largest][1],
+    }
+
+
+def _srcset(by_width):
+    return ', '.join(f'{default_storage.url(name)} {width}w' for width, (name, _) in sorted(by_width.items()))
+
+
+def request_renditions(source, group='basic'):
+    """Queue renditions for a new upload instead of waiting for the first page view"""
+    if source and can_render(source):
+        get_manifest(source, group)
+
+
+def delete_renditions(source):
+    """Forget the renditions of a deleted file; files go once no source uses their hash"""
+    renditions = list(Rendition.objects.filter(source=source))
+    Rendition.objects.filter(source=source).delete()
+    cache.delete(_cache_key(source))
+    for rendition in renditions:
+        if not Rendition.objects.filter(sha256=rendition.sha256, name=rendition.name).exists():
+            try:
+                default_storage.delete(rendition.name)
+            except Exception:
+                logger.exception('Görsel türevi silinemedi: %s', rendition.name)
+
+
+@contextmanager
+def _local_path(name):
+    """Filesystem path of a stored file; remote storage (S3) is copied to a temp file"""
+    try:
+        path = default_storage.path(name)
+    except NotImplementedError:
+        path = None
+    if path is not None:
+        yield path
+        return
+    with tempfile.NamedTemporaryFile(suffix=os.path.splitext(name)[1]) as copy:
+        with default_storage.open(name, 'rb') as original:
+            shutil.copyfileobj(original, copy, CHUNK_SIZE)
+        copy.flush()
+        yield copy.name
+
+
+def _hash_file(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as original:
+        for chunk in iter(lambda: original.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _rasterize_pdf(path, size):
+    """First page of a PDF as a Pillow image, scaled to fit ``size``"""
+    with tempfile.TemporaryDirectory() as workdir:
+        output = os.path.join(workdir, 'page')
+        subprocess.run(
+            [_pdftoppm(), '-f', '1', '-l', '1', '-singlefile', '-png', '-scale-to', str(max(size)), path, output],
+            check=True, capture_output=True, timeout=PDF_TIMEOUT,
+        )
+        image = Image.open(f'{output}.png')
+        image.load()
+    return image
+
+
+def _open_image(path, size):
+    """Decode an image at (roughly) the largest size needed, upright and RGB"""
+    image = Image.open(path)
+    image.draft('RGB', size)  # JPEG: decode at a reduced scale directly
+    image = ImageOps.exif_transpose(image)
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        image = image.convert('RGBA')
+        flattened = Image.new('RGB', image.size, 'white')
+        flattened.paste(image, mask=image.getchannel('A'))
+        return flattened
+    return image.convert('RGB')
+
+
+def _render(path, extension, specs):
+    """Yield (spec, image) for each spec, resized from one decode of the original"""
+    largest = max(SPECS[spec][:2] for spec in specs)
+    if extension in PDF_EXTENSIONS:
+        image = _rasterize_pdf(path, largest).convert('RGB')
+    else:
+        image = _open_image(path, largest)
+    for spec in specs:
+        variant = image.copy()
+        variant.thumbnail(SPECS[spec][:2], Image.LANCZOS)  # Büyütmez: küçük orijinal olduğu gibi kalır
+        yield spec, variant
+
+
+@task
+def generate_renditions(source, group='basic'):
+    """Render the specs of ``group`` for a stored file, reusing renditions of identical content"""
+    if not can_render(source):
+        return
+    if not default_storage.exists(source):
+        # Dosya silinmiş ya da worker medya dizinini görmüyor (docker-compose: media_volume)
+        logger.warning('Görsel türevi için kaynak dosya bulunamadı: %s', source)
+        return
+    extension = os.path.splitext(source)[1].lower()
+
+    with _local_path(source) as path:
+        sha256 = _hash_file(path)
+        manifest = {}
+        for rendition in Rendition.objects.filter(sha256=sha256).order_by('spec', '-created_at'):
+            manifest.setdefault(rendition.spec, (rendition.name, rendition.width, rendition.height))
+        missing = [spec for spec in GROUPS[group] if spec not in manifest]
+        written = {}  # (format, size) -> name: adımlar orijinali aşınca aynı dosya
+        for spec, image in (_render(path, extension, missing) if missing else ()):
+            image_format = SPECS[spec][2]
+            name = written.get((image_format, image.size))
+            if name is None:
+                buffer = io.BytesIO()
+                image.save(buffer, image_format, **SAVE_OPTIONS[image_format])
+                name = rendition_path(sha256, spec)
+                if default_storage.exists(name):
+                    default_storage.delete(name)  # Yarım kalmış önceki deneme
+                name = written[(image_format, image.size)] = default_storage.save(name, ContentFile(buffer.getvalue()))
+            manifest[spec] = (name, image.width, image.height)
+
+    for spec, (name, width, height) in manifest.items():
+        Rendition.objects.update_or_create(
+            source=source, spec=spec,
+            defaults={'sha256': sha256, 'name': name, 'width': width, 'height': height},
+        )
+    transaction.on_commit(lambda: cache.set(_cache_key(source), _load_manifest(source), CACHE_TIMEOUT))
@@ -0,0 +1,145 @@
+"""
+PostgreSQL full-text search shared by list views, admin and the blog
+
+Searchable models carry a ``search_vector`` column (SearchVectorField) that a
+BEFORE INSERT/UPDATE trigger keeps up to date with the Turkish text search
+configuration (see database/triggers.sql). Each column has a GIN index, so a
+search is an index lookup instead of the sequential scan ``icontains`` needs.
+
+Short identifiers (firm names, tracking codes) are looked up by substring and
+similarity through pg_trgm GIN indexes on ``UPPER(column)`` instead, see
+trigram_search().
+
+Usage:
+    services = search_queryset(services, request.GET.get('q'))
+    page = paginate_keyset(request, services, ordering=SEARCH_ORDERING + ('-request_date',))
+"""
+
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast, Upper
+
+
+SEARCH_CONFIG = 'turkish'
+SEARCH_VECTOR_FIELD = 'search_vector'
+RANK_ANNOTATION = 'search_rank'
+
+# Ranked ordering for paginate_keyset (most relevant first)
+SEARCH_ORDERING = (f'-{RANK_ANNOTATION}',)
+
+MAX_SEARCH_TERMS = 8
+
+# Trigram lookups
+SIMILARITY_ANNOTATION = 'similarity'
+AUTOCOMPLETE_MIN_LENGTH = 2
+AUTOCOMPLETE_LIMIT = 10
+
+_TERM_RE = re.compile(r'[^\W_]+', re.UNICODE)
+
+
+def build_search_query(text, config=SEARCH_CONFIG):
+    """
+    Build a prefix-matching tsquery from user input.
+
+    Every word must match and the words are matched as prefixes
+    (``trafo`` finds ``trafolar``), so partial input behaves like the old
+    ``icontains`` boxes. Punctuation is dropped, so user input can never
+    produce an invalid tsquery.
+
+    Returns:
+        SearchQuery or None if the text contains no searchable words
+    """
+    terms = _TERM_RE.findall(text or '')[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    raw = ' & '.join(f'{term}:*' for term in terms)
+    return SearchQuery(raw, config=config, search_type='raw')
+
+
+def search_queryset(queryset, text, related_vectors=(), extra=None):
+    """
+    Filter a queryset by full-text search and annotate ``search_rank``.
+
+    Args:
+        queryset: QuerySet of a model with a ``search_vector`` column
+        text: Raw user input
+        related_vectors: Vector paths of related models that may also match
+                         (e.g. ``('firm__search_vector',)``); they widen the
+                         filter but do not affect the rank
+        extra: Optional Q object OR-ed into the filter (exact code lookups)
+
+    Returns:
+        QuerySet: Matching rows annotated with ``search_rank``, or an empty
+                  queryset if the text has no searchable words
+    """
+    query = build_search_query(text)
+    if query is None:
+        return queryset.none()
+
+    condition = Q(**{SEARCH_VECTOR_FIELD: query})
+    for vector in related_vectors:
+        condition |= Q(**{vector: query})
+    if extra is not None:
+        condition |= extra
+
+    # float4 -> float8 so the rank survives a keyset cursor round trip exactly
+    rank = Cast(SearchRank(F(SEARCH_VECTOR_FIELD), query), FloatField())
+    return queryset.filter(condition).annotate(**{RANK_ANNOTATION: rank})
+
+
+def trigram_search(queryset, field, text):
+    """
+    Substring and fuzzy match on ``field``, ranked by trigram similarity.
+
+    Both conditions compare against ``UPPER(field)``, the expression of the
+    ``gin_trgm_ops`` index on the column, so ``'%x%'`` patterns and ``%>``
+    similarity use the index instead of scanning the table. Similarity is
+    case-insensitive, so upper-casing does not change the ranking.
+
+    Returns:
+        QuerySet: Matches annotated with ``similarity``, best first
+    """
+    text = (text or '').strip()
+    if not text:
+        return queryset.none()
+    upper = f'{field}_upper'
+    return (
+        queryset.alias(**{upper: Upper(field)})
+        .filter(Q(**{f'{field}__icontains': text}) | Q(**{f'{upper}__trigram_word_similar': text}))
+        .annotate(**{SIMILARITY_ANNOTATION: TrigramWordSimilarity(text, Upper(field))})
+        .order_by(f'-{SIMILARITY_ANNOTATION}', field)
+    )
+
+
+class FullTextSearchAdminMixin:
+    """
+    ModelAdmin mixin replacing ``search_fields`` icontains lookups with the
+    full-text index. ``search_related_vectors`` lists vectors of related
+    models to search as well, ``search_exact_fields`` fields matched exactly
+    (case-insensitive) and ``search_trigram_fields`` fields matched by
+    substring through their trigram index (partial names, tracking codes).
+    """
+
+    search_related_vectors = ()
+    search_exact_fields = ()
+    search_trigram_fields = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+
+        extra = None
+        lookups = [Q(**{f'{field}__iexact': search_term}) for field in self.search_exact_fields]
+        lookups += [Q(**{f'{field}__icontains': search_term}) for field in self.search_trigram_fields]
+        for lookup in lookups:
+            extra = lookup if extra is None else extra | lookup
+
+        results = search_queryset(queryset, search_term, self.search_related_vectors, extra)
+        if results.query.is_empty() and extra is not None:
+            # Punctuation only, no words for the tsquery; substring lookups still apply
+            results = queryset.filter(extra)
+        # Related vectors are joined through FKs only, no duplicates possible
+        return results, False
@@ -0,0 +1,195 @@
+"""
+Session engine: cache read-through, database persistence, lazy writes
+
+    SESSION_ENGINE = 'core.sessions'
+
+Built on Django's cached_db engine: a session is read from the cache
+(SESSION_CACHE_ALIAS, Redis in production) and from the database only when
+the cache has no copy, so a session evicted from Redis is not a logout.
+Without Redis the alias is a dummy cache and sessions live in the database.
+
+Writes are coalesced:
+- ``cycle_key`` (login) only picks a new key; the session is inserted once,
+  by SessionMiddleware, together with ``set_expiry`` and the auth data,
+  instead of an INSERT followed by an UPDATE.
+- ``save`` skips the write when the data is the same as what was loaded
+  (``set_expiry`` to the current value, re-setting a key to its value).
+- New keys are not checked with ``exists()`` first: the INSERT itself
+  rejects a duplicate and ``save`` retries with another key.
+
+``clear_expired`` deletes in batches (``manage.py purge_sessions``).
+
+Each store counts its loads and saves; SessionStatsMiddleware adds them up
+per request and ``session_metrics`` feeds ``performance_report``.
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+
+from django.contrib.sessions.backends.base import VALID_KEY_CHARS, CreateError
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+from .counters import _redis_client
+
+
+PURGE_BATCH_SIZE = 1000
+STATS_KEY = 'session_stats'
+# requests: requests that touched the session; loads = cache_hits + db_loads
+STAT_FIELDS = ('requests', 'cache_hits', 'db_loads', 'saves', 'skipped_saves')
+
+
+class SessionStore(CachedDBStore):
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self.stats = Counter()
+        self._pending_create = False
+        self._loaded_state = None
+
+    def _get_new_session_key(self):
+        return get_random_string(32, VALID_KEY_CHARS)
+
+    def _state(self, data):
+        return self.serializer().dumps(data)
+
+    # Read
+
+    def load(self):
+        try:
+            data = self._cache.get(self.cache_key)
+        except Exception:
+            data = None  # Önbellek erişilemezse veritabanından okunur
+        if data is not None:
+            self.stats['cache_hits'] += 1
+        else:
+            self.stats['db_loads'] += 1
+            session = self._get_session_from_db()
+            if session:
+                data = self.decode(session.session_data)
+                self._cache.set(self.cache_key, data, self.get_expiry_age(expiry=session.expire_date))
+            else:
+                data = {}
+        self._loaded_state = self._state(data)
+        return data
+
+    # Write
+
+    def cycle_key(self):
+        """New key, kept in memory until the response saves the session"""
+        data = self._session
+        key = self.session_key
+        self._session_key = self._get_new_session_key()
+        self._session_cache = data
+        self._pending_create = True
+        self.modified = True
+        if key:
+            self.delete(key)
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()  # create() bu metodu must_create ile çağırır
+        if self._pending_create:
+            must_create = True
+        elif not must_create:
+            if self._loaded_state is not None and self._state(self._session) == self._loaded_state:
+                self.stats['skipped_saves'] += 1
+                return
+        while True:
+            try:
+                super().save(must_create)
+            except CreateError:
+                if not self._pending_create:
+                    raise  # create() seçer yeni anahtarı
+                self._session_key = self._get_new_session_key()
+                continue
+            break
+        self._pending_create = False
+        self.stats['saves'] += 1
+        self._loaded_state = self._state(self._session)
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        self.model.objects.filter(session_key=session_key).delete()
+        self._cache.delete(self.cache_key_prefix + session_key)
+
+    @classmethod
+    def clear_expired(cls):
+        """
+        Delete expired sessions in batches of PURGE_BATCH_SIZE.
+
+        Returns:
+            int: Number of sessions deleted
+        """
+        model = cls.get_model_class()
+        deleted = 0
+        while True:
+            keys = list(
+                model.objects.filter(expire_date__lt=timezone.now())
+                .values_list('session_key', flat=True)[:PURGE_BATCH_SIZE]
+            )
+            if not keys:
+                return deleted
+            deleted += model.objects.filter(session_key__in=keys).delete()[0]
+
+
+# Per-request statistics
+
+_local_stats = Counter()
+_local_lock = threading.Lock()
+
+
+def record_request(stats):
+    """Add one request's session loads/saves to the running totals"""
+    if not stats:
+        return
+    client = _redis_client()
+    if client is None:
+        with _local_lock:
+            _local_stats.update(stats)
+            _local_stats['requests'] += 1
+        return
+    key = cache.make_key(STATS_KEY)
+    pipe = client.pipeline(transaction=False)
+    pipe.hincrby(key, 'requests', 1)
+    for field, value in stats.items():
+        pipe.hincrby(key, field, value)
+    pipe.hsetnx(key, 'since', int(timezone.now().timestamp()))
+    pipe.execute()
+
+
+def session_metrics():
+    """
+    Running totals since ``since`` (or since process start without Redis).
+
+    Returns:
+        dict: STAT_FIELDS as ints, plus ``since`` (datetime or None)
+    """
+    client = _redis_client()
+    if client is None:
+        with _local_lock:
+            values = dict(_local_stats)
+        since = None
+    else:
+        raw = {key.decode(): int(value) for key, value in client.hgetall(cache.make_key(STATS_KEY)).items()}
+        since = raw.pop('since', None)
+        values = raw
+        if since is not None:
+            since = datetime.fromtimestamp(since, tz=dt_timezone.utc)
+    metrics = {field: values.get(field, 0) for field in STAT_FIELDS}
+    metrics['since'] = since
+    return metrics
+
+
+def reset_session_metrics():
+    client = _redis_client()
+    if client is None:
+        with _local_lock:
+            _local_stats.clear()
+    else:
+        client.delete(cache.make_key(STATS_KEY))
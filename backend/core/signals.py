@@ -5,7 +5,13 @@ Signals for cache invalidation
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.core.cache import cache
-from .models import SiteSettings, ServiceCategory
+from django.db import transaction
+from django_cleanup.signals import cleanup_post_delete
+from .invalidation import invalidate_tags
+from .models import SiteSettings, ServiceCategory, ContactMessage, TeamMember
+from .purge import purge_tags
+from .renditions import delete_renditions, request_renditions
+from .stats import invalidate_dashboard_stats
 
 
 @receiver([post_save, post_delete], sender=SiteSettings)
@@ -20,3 +26,75 @@ def clear_service_category_cache(sender, **kwargs):
     cache.delete('footer_service_categories')
     cache.delete('services_page_categories')
 
+
+
+@receiver([post_save, post_delete], sender='services.Service')
+@receiver([post_save, post_delete], sender='services.ServiceRequest')
+@receiver([post_save, post_delete], sender='documents.Document')
+def clear_firm_dashboard_stats(sender, instance, **kwargs):
+    """Clear global and per-firm dashboard statistics when firm data changes"""
+    invalidate_dashboard_stats(firm_id=instance.firm_id)
+
+
+@receiver([post_save, post_delete], sender='firms.Firm')
+def clear_firm_stats_on_firm_change(sender, instance, **kwargs):
+    """Clear dashboard statistics when a firm is added, updated or removed"""
+    invalidate_dashboard_stats(firm_id=instance.pk)
+
+
+@receiver([post_save, post_delete], sender=ContactMessage)
+def clear_admin_stats_on_message_change(sender, **kwargs):
+    """Clear admin dashboard statistics when contact messages change"""
+    invalidate_dashboard_stats()
+
+
+@receiver(cleanup_post_delete)
+def delete_file_renditions(sender, file_name, success, **kwargs):
+    """Drop thumbnails/previews of image files django_cleanup removed"""
+    if success and file_name:
+        delete_renditions(file_name)
+
+
+# Public page images: srcset variants (core.renditions 'responsive' group)
+RESPONSIVE_IMAGE_FIELDS = {
+    'core.SiteSettings': ('hero_image', 'about_image'),
+    'core.ServiceCategory': ('image',),
+    'core.TeamMember': ('image',),
+    'blog.BlogPost': ('featured_image',),
+}
+
+
+@receiver(post_save, sender=SiteSettings)
+@receiver(post_save, sender=ServiceCategory)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_save, sender='blog.BlogPost')
+def queue_responsive_renditions(sender, instance, **kwargs):
+    """Generate srcset variants on upload instead of on the first visitor"""
+    for field_name in RESPONSIVE_IMAGE_FIELDS[sender._meta.label]:
+        request_renditions(getattr(instance, field_name).name, 'responsive')
+
+
+# Page cache tags fed by each model (core.pagecache, core.invalidation, core.purge)
+CACHE_TAGS = {
+    'core.SiteSettings': ('site_settings',),
+    'core.ServiceCategory': ('service_categories',),
+    'core.TeamMember': ('team_members',),
+    'blog.BlogPost': ('blog_posts',),
+}
+
+
+@receiver([post_save, post_delete], sender=SiteSettings)
+@receiver([post_save, post_delete], sender=ServiceCategory)
+@receiver([post_save, post_delete], sender=TeamMember)
+@receiver([post_save, post_delete], sender='blog.BlogPost')
+def invalidate_cached_pages(sender, instance, **kwargs):
+    """Refresh only the cached pages built from the changed model (Django page cache, nginx)"""
+    tags = CACHE_TAGS[sender._meta.label]
+    paths = [instance.get_absolute_url()] if hasattr(instance, 'get_absolute_url') else []
+
+    def invalidate():
+        invalidate_tags(*tags)
+        purge_tags(tags, paths)
+
+    # Commit'ten önce geçersiz kılınırsa eşzamanlı bir istek eski veriyi yeniden cache'ler
+    transaction.on_commit(invalidate)
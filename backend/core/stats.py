@@ -0,0 +1,252 @@
+"""
+Cached dashboard statistics
+
+Each group of counters is computed with a single conditional-aggregation
+query (``Count(filter=Q(...))``) and cached. Cache entries are dropped by the
+post_save/post_delete receivers in core.signals, so a warm dashboard costs no
+statistics queries at all.
+
+On a cache miss the counters are read from the ``dashboard_stats`` and
+``firm_dashboard_data`` materialized views when they were refreshed after the
+last recorded change; otherwise they are aggregated live.
+"""
+
+from django.core.cache import cache
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+STATS_CACHE_TIMEOUT = 60 * 15  # 15 minutes; signals invalidate earlier on change
+
+SERVICE_STATS_KEY = 'dashboard_stats:services'
+ADMIN_STATS_KEY = 'dashboard_stats:admin'
+FIRM_STATS_KEY = 'dashboard_stats:firm:{}'
+
+# Son veri değişikliği zamanı (materialized view tazeliği için)
+VIEWS_CHANGED_KEY = 'dashboard_views:changed_at'
+VIEWS_REFRESHED_KEY = 'dashboard_views:refreshed_at'
+MATERIALIZED_VIEWS = ('dashboard_stats', 'firm_dashboard_data')
+
+# Talep durumları: firma panelinde "aktif" sayılanlar
+ACTIVE_REQUEST_STATUSES = ('pending', 'approved', 'in_progress')
+
+
+def firm_count_subquery(queryset):
+    """Correlated COUNT subquery for the outer Firm row (usable in annotate())"""
+    counts = (
+        queryset.filter(firm=OuterRef('pk'))
+        .order_by()
+        .values('firm')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def count_queries(**querysets):
+    """
+    Row counts of several querysets in one SELECT of scalar subqueries,
+    for counters over unrelated tables (no row to annotate them onto).
+
+    Returns:
+        dict: {name: count}
+    """
+    columns, params = [], []
+    for name, queryset in querysets.items():
+        sql, query_params = queryset.order_by().values('pk').query.sql_with_params()
+        columns.append(f'(SELECT COUNT(*) FROM ({sql}) AS {name}_rows)')
+        params.extend(query_params)
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT {", ".join(columns)}', params)
+        return dict(zip(querysets, cursor.fetchone()))
+
+
+def _views_changed_at():
+    """
+    Time of the last committed change to dashboard data.
+    Unknown after a cache flush: record "now" so that rows refreshed from here
+    on can be trusted again, and treat the current rows as stale.
+    """
+    changed_at = cache.get(VIEWS_CHANGED_KEY)
+    if changed_at is None:
+        cache.add(VIEWS_CHANGED_KEY, timezone.now(), None)
+    return changed_at
+
+
+def _fresh_view_row(model, **lookup):
+    """
+    Return a materialized view row if it reflects the latest change, else None.
+    A missing view (migration not applied, non-PostgreSQL database) also
+    returns None so callers fall back to live aggregation.
+    """
+    changed_at = _views_changed_at()
+    if changed_at is None or connection.vendor != 'postgresql':
+        return None
+    try:
+        with transaction.atomic():
+            row = model.objects.filter(**lookup).first()
+    except DatabaseError:
+        return None
+    if row is None or row.refreshed_at < changed_at:
+        return None
+    return row
+
+
+def get_service_stats():
+    """
+    Service counts by status, computed in one query.
+
+    Returns:
+        dict: total_services, completed_count, in_progress_count,
+              pending_count, cancelled_count
+    """
+    stats = cache.get(SERVICE_STATS_KEY)
+    if stats is None:
+        from services.models import Service
+
+        stats = Service.objects.aggregate(
+            total_services=Count('pk'),
+            completed_count=Count('pk', filter=Q(status='completed')),
+            in_progress_count=Count('pk', filter=Q(status='in_progress')),
+            pending_count=Count('pk', filter=Q(status='pending')),
+            cancelled_count=Count('pk', filter=Q(status='cancelled')),
+        )
+        cache.set(SERVICE_STATS_KEY, stats, STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def get_admin_dashboard_stats():
+    """
+    Admin dashboard stat cards and recent lists.
+
+    Returns:
+        dict: total_firms, total_services, pending_requests, pending_messages,
+              recent_services, recent_firms
+    """
+    stats = cache.get(ADMIN_STATS_KEY)
+    if stats is None:
+        from core.models import ContactMessage, DashboardStats
+        from firms.models import Firm
+        from services.models import Service, ServiceRequest
+
+        row = _fresh_view_row(DashboardStats, pk=1)
+        if row is not None:
+            stats = {
+                'total_firms': row.total_firms,
+                'total_services': row.total_services,
+                'pending_requests': row.pending_requests,
+                'pending_messages': row.pending_messages,
+            }
+        else:
+            stats = count_queries(
+                total_firms=Firm.objects.all(),
+                total_services=Service.objects.all(),
+                pending_requests=ServiceRequest.objects.filter(status='pending'),
+                pending_messages=ContactMessage.objects.filter(status='new'),
+            )
+        stats.update({
+            'recent_services': list(Service.objects.select_related('firm').order_by('-request_date')[:5]),
+            'recent_firms': list(Firm.objects.order_by('-registration_date')[:5]),
+        })
+        cache.set(ADMIN_STATS_KEY, stats, STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def get_firm_dashboard_stats(firm):
+    """
+    Firm dashboard counters, read from ``firm_dashboard_data`` when fresh,
+    otherwise computed in one query over the firm row.
+
+    Each live counter is a correlated subquery on the (firm, ...) indexes,
+    which avoids the row explosion of joining services, requests and documents.
+    The latest item of each list is cached alongside the counters.
+
+    Returns:
+        dict: in_progress_count, completed_count, documents_count,
+              requests_count, recent_services, completed_services,
+              recent_documents, recent_requests
+    """
+    key = FIRM_STATS_KEY.format(firm.pk)
+    stats = cache.get(key)
+    if stats is None:
+        from core.models import FirmDashboardData
+        from documents.models import Document
+        from firms.models import Firm
+        from services.models import Service, ServiceRequest
+
+        row = _fresh_view_row(FirmDashboardData, firm_id=firm.pk)
+        if row is not None:
+            stats = {
+                'in_progress_count': row.in_progress_services,
+                'completed_count': row.completed_services,
+                'documents_count': row.total_documents,
+                'requests_count': row.active_requests,
+            }
+        else:
+            stats = Firm.objects.filter(pk=firm.pk).annotate(
+                in_progress_count=firm_count_subquery(Service.objects.filter(status='in_progress')),
+                completed_count=firm_count_subquery(Service.objects.filter(status='completed')),
+                documents_count=firm_count_subquery(Document.objects.filter(is_visible_to_firm=True)),
+                requests_count=firm_count_subquery(ServiceRequest.objects.filter(status__in=ACTIVE_REQUEST_STATUSES)),
+            ).values('in_progress_count', 'completed_count', 'documents_count', 'requests_count').first() or {}
+
+        stats.update({
+            'recent_services': list(firm.services.filter(status='in_progress').order_by('-request_date')[:1]),
+            'completed_services': list(firm.services.filter(status='completed').order_by('-completion_date')[:1]),
+            'recent_documents': list(firm.documents.filter(is_visible_to_firm=True).order_by('-upload_date')[:1]),
+            'recent_requests': list(
+                firm.service_requests.filter(status__in=ACTIVE_REQUEST_STATUSES)
+                .select_related('service').order_by('-request_date')[:1]
+            ),
+        })
+        cache.set(key, stats, STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def invalidate_dashboard_stats(firm_id=None):
+    """
+    Drop cached global statistics and, if given, one firm's statistics.
+    Deletion waits for the surrounding transaction to commit so a concurrent
+    request cannot re-cache the old numbers in between. The commit time is
+    recorded so materialized view rows older than it are no longer used.
+    """
+    keys = [SERVICE_STATS_KEY, ADMIN_STATS_KEY]
+    if firm_id is not None:
+        keys.append(FIRM_STATS_KEY.format(firm_id))
+
+    def _invalidate():
+        cache.set(VIEWS_CHANGED_KEY, timezone.now(), None)
+        cache.delete_many(keys)
+
+    transaction.on_commit(_invalidate)
+
+
+def refresh_dashboard_views(force=False, concurrently=True):
+    """
+    Refresh the dashboard materialized views if data changed since the last
+    refresh (or always with ``force``).
+
+    PostgreSQL has no partial refresh, so "incremental" means skipping the
+    refresh entirely while nothing changed. CONCURRENTLY keeps the views
+    readable during the refresh (it relies on their unique indexes).
+
+    Returns:
+        bool: True if the views were refreshed
+    """
+    started_at = timezone.now()
+    changed_at = cache.get(VIEWS_CHANGED_KEY)
+    refreshed_at = cache.get(VIEWS_REFRESHED_KEY)
+    if not force and changed_at is not None and refreshed_at is not None and refreshed_at >= changed_at:
+        return False
+
+    option = ' CONCURRENTLY' if concurrently else ''
+    with connection.cursor() as cursor:
+        for view in MATERIALIZED_VIEWS:
+            cursor.execute(f'REFRESH MATERIALIZED VIEW{option} {view}')
+
+    cache.set(VIEWS_REFRESHED_KEY, started_at, None)
+    # Bu yenilemeden önceki değişiklikler artık view'larda
+    cache.add(VIEWS_CHANGED_KEY, started_at, None)
+    return True
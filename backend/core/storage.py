@@ -0,0 +1,71 @@
+"""
+Presigned S3 URLs (USE_S3 mode)
+
+With S3Boto3Storage file bytes never need to pass through gunicorn:
+downloads redirect to a short-lived signed GET URL after the access check,
+and uploads go from the browser straight to the bucket with a signed POST
+policy. Other storages (local FileSystemStorage) report no support and the
+callers keep their normal path.
+"""
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+
+
+def supports_presigned_urls(storage=None):
+    """True for django-storages S3 storages"""
+    storage = storage or default_storage
+    return hasattr(storage, 'bucket_name') and hasattr(storage, 'connection')
+
+
+def _object_key(storage, name):
+    from storages.utils import clean_name, safe_join
+    return safe_join(storage.location, clean_name(name))
+
+
+def presigned_download_url(fieldfile, content_disposition, content_type=None, expire=None):
+    """
+    Signed GET URL for a stored file; S3 answers Range and conditional
+    requests itself.
+
+    Args:
+        fieldfile: FieldFile on an S3 storage
+        content_disposition: Value S3 sends back as Content-Disposition
+        content_type: Overrides the stored Content-Type
+        expire: Lifetime in seconds (default: AWS_QUERYSTRING_EXPIRE)
+    """
+    parameters = {'ResponseContentDisposition': content_disposition}
+    if content_type:
+        parameters['ResponseContentType'] = content_type
+    return fieldfile.storage.url(
+        fieldfile.name,
+        parameters=parameters,
+        expire=expire or getattr(settings, 'AWS_QUERYSTRING_EXPIRE', 60),
+    )
+
+
+def presigned_upload(name, content_type, max_size, expire=None, storage=None):
+    """
+    Signed POST policy for uploading ``name`` directly to the bucket.
+
+    The policy pins the key and Content-Type and limits the body to
+    ``max_size`` bytes, so the browser cannot upload anything else.
+
+    Returns:
+        dict: ``url`` and ``fields`` for a multipart/form-data POST
+              (the file goes last, as the ``file`` field)
+    """
+    storage = storage or default_storage
+    expire = expire or getattr(settings, 'DIRECT_UPLOAD_EXPIRE', 600)
+    fields = {'Content-Type': content_type}
+    conditions = [{'Content-Type': content_type}, ['content-length-range', 1, max_size]]
+    if storage.default_acl:
+        fields['acl'] = storage.default_acl
+        conditions.append({'acl': storage.default_acl})
+    return storage.connection.meta.client.generate_presigned_post(
+        Bucket=storage.bucket_name,
+        Key=_object_key(storage, name),
+        Fields=fields,
+        Conditions=conditions,
+        ExpiresIn=expire,
+    )
@@ -0,0 +1,169 @@
+"""
+Lightweight background tasks backed by PostgreSQL
+
+Tasks are plain functions registered with ``@task`` in an app's ``tasks.py``.
+enqueue() stores a BackgroundTask row in the surrounding transaction, so the
+task becomes visible to workers only once the request commits. The
+``run_worker`` management command claims rows with
+``SELECT ... FOR UPDATE SKIP LOCKED``; no broker is needed and any number of
+worker threads or processes can run side by side.
+
+Usage:
+    # documents/tasks.py
+    @task
+    def process_uploaded_document(document_id):
+        ...
+
+    enqueue(process_uploaded_document, document.pk,
+            idempotency_key=f'document_uploaded:{document.pk}')
+"""
+
+import logging
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Avg, Count, F, Max, Q
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from .models import BackgroundTask
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 30  # seconds; doubled after every failed attempt
+STALE_TASK_TIMEOUT = 60 * 10  # running longer than this = worker died, run again
+
+_registry = {}
+
+
+class UnknownTask(LookupError):
+    """Raised when a queued task name has no registered function"""
+
+
+def task(func=None, *, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """Register a function as a background task (``@task`` or ``@task(max_attempts=5)``)"""
+    def register(func):
+        func.task_name = f'{func.__module__}.{func.__qualname__}'
+        func.max_attempts = max_attempts
+        _registry[func.task_name] = func
+        return func
+    return register(func) if func is not None else register
+
+
+def autodiscover_tasks():
+    """Import ``tasks`` modules of all installed apps so their tasks register"""
+    autodiscover_modules('tasks')
+
+
+def enqueue(func, *args, idempotency_key=None, delay=0, **kwargs):
+    """
+    Queue ``func(*args, **kwargs)`` for a worker.
+
+    Arguments must be JSON serializable (pass primary keys, not instances).
+    A second enqueue with the same ``idempotency_key`` returns the existing
+    task instead of queuing it again.
+
+    Returns:
+        BackgroundTask
+    """
+    fields = {
+        'name': func.task_name,
+        'args': list(args),
+        'kwargs': kwargs,
+        'max_attempts': func.max_attempts,
+        'run_after': timezone.now() + timedelta(seconds=delay),
+    }
+    if idempotency_key is None:
+        return BackgroundTask.objects.create(**fields)
+    try:
+        with transaction.atomic():
+            return BackgroundTask.objects.create(idempotency_key=idempotency_key, **fields)
+    except IntegrityError:
+        return BackgroundTask.objects.get(idempotency_key=idempotency_key)
+
+
+def claim_task():
+    """
+    Mark the next due task as running and return it (or None).
+    The row lock is held only while claiming, not while the task runs.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        claimed = (
+            BackgroundTask.objects.select_for_update(skip_locked=True)
+            .filter(status='pending', run_after__lte=now)
+            .order_by('run_after')
+            .first()
+        )
+        if claimed is None:
+            return None
+        claimed.status = 'running'
+        claimed.attempts += 1
+        claimed.started_at = now
+        claimed.finished_at = None
+        claimed.save(update_fields=['status', 'attempts', 'started_at', 'finished_at'])
+    return claimed
+
+
+def run_task(claimed):
+    """
+    Execute a claimed task in its own transaction and record the outcome.
+
+    Returns:
+        bool: True if the task succeeded
+    """
+    try:
+        func = _registry.get(claimed.name)
+        if func is None:
+            raise UnknownTask(claimed.name)
+        with transaction.atomic():
+            func(*claimed.args, **claimed.kwargs)
+    except Exception as exc:
+        claimed.last_error = f'{type(exc).__name__}: {exc}'[:2000]
+        claimed.finished_at = timezone.now()
+        if claimed.attempts >= claimed.max_attempts or isinstance(exc, UnknownTask):
+            claimed.status = 'failed'
+            logger.exception('Görev başarısız (id=%s, %s)', claimed.pk, claimed.name)
+        else:
+            claimed.status = 'pending'
+            claimed.run_after = claimed.finished_at + timedelta(
+                seconds=RETRY_BASE_DELAY * 2 ** (claimed.attempts - 1)
+            )
+            logger.warning('Görev tekrar denenecek (id=%s, %s): %s', claimed.pk, claimed.name, exc)
+        claimed.save(update_fields=['status', 'last_error', 'finished_at', 'run_after'])
+        return False
+
+    claimed.status = 'done'
+    claimed.last_error = ''
+    claimed.finished_at = timezone.now()
+    claimed.save(update_fields=['status', 'last_error', 'finished_at'])
+    return True
+
+
+def requeue_stale_tasks(timeout=STALE_TASK_TIMEOUT):
+    """Return tasks left 'running' by a crashed worker to the queue"""
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    return BackgroundTask.objects.filter(status='running', started_at__lt=cutoff).update(status='pending')
+
+
+def task_metrics():
+    """
+    Per task counts by status, run times and queue lag, in one query.
+
+    Returns:
+        list[dict]: name, pending, running, done, failed, avg_duration,
+                    max_duration, oldest_pending
+    """
+    return list(
+        BackgroundTask.objects.order_by().values('name').annotate(
+            pending=Count('pk', filter=Q(status='pending')),
+            running=Count('pk', filter=Q(status='running')),
+            done=Count('pk', filter=Q(status='done')),
+            failed=Count('pk', filter=Q(status='failed')),
+            avg_duration=Avg(F('finished_at') - F('started_at'), filter=Q(status='done')),
+            max_duration=Max(F('finished_at') - F('started_at'), filter=Q(status='done')),
+            oldest_pending=Max(timezone.now() - F('run_after'), filter=Q(status='pending')),
+        ).order_by('name')
+    )
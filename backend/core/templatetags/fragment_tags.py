@@ -0,0 +1,116 @@
+"""
+Fragment cache with invalidation tags
+
+    {% load fragment_tags %}
+    {% cachefragment 'footer' 'site_settings' 'service_categories' %}
+        {% include 'includes/footer.html' %}
+    {% endcachefragment %}
+
+    {% nav_section as nav_section %}
+    {% cachefragment 'header' vary_on nav_section user.pk %}...{% endcachefragment %}
+
+Arguments after the name are invalidation tags (core.invalidation), bumped
+by core.signals when the model behind them changes. Values after
+``vary_on`` become part of the key, for fragments that differ per page or
+per user; vary on the smallest value the fragment depends on (the active
+menu section, not ``request.path``) so pages share one entry. An unchanged
+fragment costs one cache round trip (the fragment and its tag stamps are
+fetched together) and no template evaluation.
+"""
+
+import hashlib
+
+from django import template
+from django.core.cache import cache
+from django.utils.safestring import mark_safe
+
+from core.invalidation import get_with_versions
+
+
+register = template.Library()
+
+FRAGMENT_TIMEOUT = 60 * 60 * 24  # Değişiklikler etiketlerle düşer; süre sadece temizlik için
+
+# Menüde aktif gösterilen bölümler: (bölüm, tam yol)
+NAV_SECTIONS = (
+    ('home', '/'),
+    ('about', '/hakkimizda/'),
+    ('services', '/hizmetlerimiz/'),
+    ('blog', '/blog/'),
+    ('contact', '/iletisim/'),
+)
+
+
+def fragment_cache_key(name, vary_on=()):
+    digest = hashlib.md5('|'.join(str(value) for value in vary_on).encode('utf-8')).hexdigest()
+    return f'fragment:{name}:{digest}'
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(self, nodelist, name, tags, vary_on):
+        self.nodelist = nodelist
+        self.name = name
+        self.tags = tags
+        self.vary_on = vary_on
+
+    def render(self, context):
+        key = fragment_cache_key(
+            self.name.resolve(context),
+            [value.resolve(context) for value in self.vary_on],
+        )
+        entry, versions = get_with_versions(key, [tag.resolve(context) for tag in self.tags])
+        if entry is not None and entry['versions'] == versions:
+            return mark_safe(entry['html'])
+        html = self.nodelist.render(context)
+        cache.set(key, {'versions': versions, 'html': str(html)}, FRAGMENT_TIMEOUT)
+        return html
+
+
+@register.tag
+def cachefragment(parser, token):
+    """
+    Cache the enclosed template output until one of its tags is invalidated.
+
+    Usage:
+        {% cachefragment name [tag ...] [vary_on value ...] %}...{% endcachefragment %}
+    """
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' en az bir parça adı ister.")
+    nodelist = parser.parse(('endcachefragment',))
+    parser.delete_first_token()
+
+    arguments = bits[2:]
+    if 'vary_on' in arguments:
+        split = arguments.index('vary_on')
+        tags, vary_on = arguments[:split], arguments[split + 1:]
+    else:
+        tags, vary_on = arguments, []
+    return FragmentCacheNode(
+        nodelist,
+        parser.compile_filter(bits[1]),
+        [parser.compile_filter(tag) for tag in tags],
+        [parser.compile_filter(value) for value in vary_on],
+    )
+
+
+@register.simple_tag(takes_context=True)
+def nav_section(context):
+    """
+    Active header menu section for the current path ('' when none).
+
+    Usage:
+        {% nav_section as nav_section %}
+    """
+    request = context.get('request')
+    if request is None:
+        return ''
+    path = request.path
+    for section, section_path in NAV_SECTIONS:
+        if path == section_path:
+            return section
+    if 'dashboard' in path:
+        return 'dashboard'
+    if 'firma-paneli' in path:
+        return 'firm_panel'
+    return ''
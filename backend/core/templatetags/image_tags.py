@@ -3,11 +3,32 @@ Custom template tags for image optimization
 """
 
 from django import template
+from django.template.loader import render_to_string
 from django.utils.safestring import mark_safe
 
+from core.fields import stored_dimensions
+from core.renditions import get_picture, get_rendition
+
 register = template.Library()
 
 
+def _image_context(image, alt='', sizes='100vw', css_class='', loading='lazy'):
+    """Helper: srcset variants, else a preview rendition, else the original (core.renditions)"""
+    srcset, preview = get_picture(image)
+    width, height = stored_dimensions(image)
+    return {
+        'image': image,
+        'width': width,
+        'height': height,
+        'srcset': srcset,
+        'preview': preview,
+        'alt': alt,
+        'sizes': sizes,
+        'css_class': css_class,
+        'loading': loading,
+    }
+
+
 @register.filter
 def responsive_image(image_field, alt_text=''):
     """
@@ -16,21 +37,7 @@ def responsive_image(image_field, alt_text=''):
     """
     if not image_field:
         return ''
-    
-    # Get image URL
-    image_url = image_field.url
-    
-    # Generate responsive image HTML
-    # Note: For production, you'd generate multiple sizes server-side
-    # For now, we use CSS and browser native optimization
-    html = f'''<img src="{image_url}" 
-                    alt="{alt_text}" 
-                    loading="lazy" 
-                    decoding="async"
-                    class="responsive-img"
-                    style="max-width: 100%; height: auto;">'''
-    
-    return mark_safe(html)
+    return mark_safe(render_to_string('core/responsive_image.html', _image_context(image_field, alt_text)))
 
 
 @register.simple_tag
@@ -53,29 +60,34 @@ def responsive_bg_image(image_field, css_class=''):
 @register.filter
 def image_dimensions(image_field):
     """
-    Get image dimensions if available
+    Get image dimensions if available (stored on the model, no file is opened)
     Usage: {{ post.featured_image|image_dimensions }}
     Returns: tuple (width, height) or None
     """
     if not image_field:
         return None
     
-    try:
-        return (image_field.width, image_field.height)
-    except:
+    width, height = stored_dimensions(image_field)
+    if width is None or height is None:
         return None
+    return (width, height)
+
+
+@register.simple_tag
+def rendition(image_field, spec='thumb'):
+    """
+    Thumbnail / preview of an image or PDF, generated in the background
+    Usage: {% rendition document.file "thumb" as thumb %}{% if thumb %}<img src="{{ thumb.url }}">{% endif %}
+    Returns: dict (url, width, height) or None while it is being generated
+    """
+    return get_rendition(image_field, spec)
 
 
 @register.inclusion_tag('core/responsive_image.html')
-def render_responsive_image(image, alt='', sizes='100vw', css_class=''):
+def render_responsive_image(image, alt='', sizes='100vw', css_class='', loading='lazy'):
     """
-    Render a fully optimized responsive image
+    Render a fully optimized responsive image: <picture> with WebP and JPEG srcsets
     Usage: {% render_responsive_image post.featured_image "Alt text" sizes="(max-width: 768px) 100vw, 50vw" %}
+    Above-the-fold images (hero) should pass loading="eager".
     """
-    return {
-        'image': image,
-        'alt': alt,
-        'sizes': sizes,
-        'css_class': css_class,
-    }
-
+    return _image_context(image, alt, sizes, css_class, loading)
@@ -1,8 +1,8 @@
 import random
 import string
-from django.core.mail import send_mail
 from django.conf import settings
 from .models import ActivityLog
+from .mail import queue_mail
 
 def generate_secure_password(length=12):
     """Güvenli şifre oluştur"""
@@ -27,13 +27,8 @@ Saygılarımızla,
 BYF Mühendislik
     '''
     
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [email],
-        fail_silently=False,
-    )
+    # Kuyruğa alınır; gönderim send_queued_mail komutu ile yapılır
+    queue_mail(subject, message, [email])
 
 
 def log_activity(user, action, message):
@@ -1,13 +1,18 @@
+from django import forms
 from django.contrib import admin
-from .models import Document
+from django.urls import reverse
+from .models import Document, DocumentBlob
 from core.admin_filters import FirmVisibilityFilter, DocumentTypeFilter
+from core.search import FullTextSearchAdminMixin
+from core.storage import supports_presigned_urls
 
 @admin.register(Document)
-class DocumentAdmin(admin.ModelAdmin):
+class DocumentAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
     list_display = ('name', 'firm', 'service', 'document_type', 'upload_date', 'uploaded_by', 'download_count', 'is_visible_to_firm')
     list_filter = (DocumentTypeFilter, FirmVisibilityFilter, 'firm')
     search_fields = ('name', 'firm__name', 'description', 'service__name')
-    readonly_fields = ('upload_date', 'unique_id', 'download_count')
+    search_related_vectors = ('firm__search_vector', 'service__search_vector')
+    readonly_fields = ('upload_date', 'unique_id', 'download_count', 'original_filename', 'blob')
     date_hierarchy = 'upload_date'  # Date filter at top - removed from list_filter to avoid duplication
     
     def get_queryset(self, request):
@@ -23,11 +28,33 @@ class DocumentAdmin(admin.ModelAdmin):
             'fields': ('is_visible_to_firm',)
         }),
         ('Sistem Bilgileri', {
-            'fields': ('upload_date', 'uploaded_by', 'download_count', 'unique_id'),
+            'fields': ('upload_date', 'uploaded_by', 'download_count', 'unique_id', 'original_filename', 'blob'),
             'classes': ('collapse',)
         }),
     )
 
+    def formfield_for_dbfield(self, db_field, request, **kwargs):
+        formfield = super().formfield_for_dbfield(db_field, request, **kwargs)
+        if db_field.name == 'file' and supports_presigned_urls():
+            # S3 modunda dosya tarayıcıdan doğrudan bucket'a yüklenir (admin/js/direct_upload.js)
+            formfield.widget.attrs.update({
+                'data-direct-upload-start': reverse('direct_upload_start'),
+                'data-direct-upload-complete': reverse('direct_upload_complete'),
+            })
+        elif db_field.name == 'file':
+            # Yerel depolamada parçalı, devam ettirilebilir yükleme (admin/js/chunked_upload.js)
+            formfield.widget.attrs['data-chunked-upload'] = reverse('chunked_upload_create')
+        return formfield
+
+    @property
+    def media(self):
+        media = super().media
+        if supports_presigned_urls():
+            media += forms.Media(js=['admin/js/direct_upload.js'])
+        else:
+            media += forms.Media(js=['admin/js/chunked_upload.js'])
+        return media
+
     def save_model(self, request, obj, form, change):
         if not obj.uploaded_by_id:
             obj.uploaded_by = request.user
@@ -55,4 +82,18 @@ class DocumentAdmin(admin.ModelAdmin):
     
     def has_delete_permission(self, request, obj=None):
         """Allow deletion only for superusers"""
-        return request.user.is_superuser
\ No newline at end of file
+        return request.user.is_superuser
+
+
+@admin.register(DocumentBlob)
+class DocumentBlobAdmin(admin.ModelAdmin):
+    """İçerik adresli dosyalar - salt okunur; referanslar doküman kaydıyla yönetilir"""
+    list_display = ('sha256', 'name', 'size', 'ref_count', 'created_at')
+    search_fields = ('sha256', 'name')
+    readonly_fields = ('sha256', 'name', 'size', 'ref_count', 'created_at')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
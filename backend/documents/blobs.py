@@ -0,0 +1,158 @@
+"""
+Content-addressed document storage
+
+Every document file is stored once per SHA-256 under ``blobs/ab/cd/<sha256><ext>``
+(DocumentBlob). Uploading a certificate that another firm already has only
+takes a reference: no bytes are written. ``ref_count`` follows the Document
+rows pointing at the blob; the file is deleted after the transaction that
+drops the last reference commits. django_cleanup is disabled for Document,
+since its per-row deletes would remove shared files.
+
+Rows from before content addressing (``blob`` is NULL) keep their own file
+until ``manage.py dedupe_documents`` adopts them.
+"""
+
+import hashlib
+import logging
+import os
+
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from core.renditions import delete_renditions
+
+from .models import Document, DocumentBlob, blob_path
+
+
+logger = logging.getLogger(__name__)
+
+
+def hash_file(content):
+    """SHA-256 hex digest of a Django File, read chunk by chunk"""
+    sha256 = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks():
+        sha256.update(chunk)
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    return sha256.hexdigest()
+
+
+def _take_reference(sha256, name, size):
+    """Add a reference to the blob, creating it for ``name`` if new; returns (blob, created)"""
+    while True:
+        try:
+            with transaction.atomic():
+                return DocumentBlob.objects.create(sha256=sha256, name=name, size=size, ref_count=1), True
+        except IntegrityError:
+            pass
+        with transaction.atomic():
+            blob = DocumentBlob.objects.select_for_update().filter(pk=sha256).first()
+            if blob is not None:
+                DocumentBlob.objects.filter(pk=sha256).update(ref_count=F('ref_count') + 1)
+                blob.ref_count += 1
+                return blob, False
+        # Satır bu arada son referansla silindi: ``name`` için yeniden oluşturulur
+
+
+def store_blob(content, filename, sha256=None):
+    """
+    Store ``content`` under its content address and take one reference.
+
+    Args:
+        content: Django File (uploaded file, temp file)
+        filename: Original name; only its extension is used in the address
+        sha256: Digest if the caller already computed it (chunked uploads)
+
+    Returns:
+        DocumentBlob
+    """
+    sha256 = sha256 or hash_file(content)
+    with transaction.atomic():
+        # Satır kilitli: eşzamanlı release_blob son referansı düşürüp dosyayı silemez
+        existing = DocumentBlob.objects.select_for_update().filter(pk=sha256).first()
+        if existing is not None and default_storage.exists(existing.name):
+            # Aynı içerik zaten var: yazma yok, sadece referans
+            DocumentBlob.objects.filter(pk=sha256).update(ref_count=F('ref_count') + 1)
+            existing.ref_count += 1
+            return existing
+
+    # Satır yoksa baytlar her zaman yazılır: adreste duran bir dosya az önce silinen
+    # blob'a ait olabilir ve silenin on_commit'i onu kaldırır (save yeni bir ad seçer)
+    name = default_storage.save(blob_path(sha256, filename), content)
+    blob, created = _take_reference(sha256, name, content.size)
+    if not created and blob.name != name:
+        if default_storage.exists(blob.name):
+            default_storage.delete(name)  # Eşzamanlı yükleme aynı içeriği önce yazdı
+        else:
+            DocumentBlob.objects.filter(pk=sha256).update(name=name)
+            blob.name = name
+    return blob
+
+
+def attach_blob(document, sha256=None):
+    """Point an unsaved upload on ``document.file`` at its blob (called from Document.save)"""
+    original = os.path.basename(document.file.name)
+    blob = store_blob(document.file.file, original, sha256=sha256)
+    document.blob = blob
+    document.file.name = blob.name
+    document.file._committed = True
+    document.original_filename = original
+    return blob
+
+
+def _delete_on_commit(name):
+    def delete():
+        try:
+            default_storage.delete(name)
+        except Exception:
+            logger.exception('Dosya silinemedi: %s', name)
+        delete_renditions(name)
+    transaction.on_commit(delete)
+
+
+def release_blob(sha256):
+    """Drop one reference; the file goes once the last reference is gone"""
+    with transaction.atomic():
+        DocumentBlob.objects.filter(pk=sha256, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+        blob = DocumentBlob.objects.select_for_update().filter(pk=sha256, ref_count=0).first()
+        if blob is None:
+            return
+        # Kilit altında: bu arada yeni referans alındıysa silme
+        if not Document.objects.filter(blob_id=sha256).exists():
+            blob.delete()
+            _delete_on_commit(blob.name)
+
+
+def release_file(blob_id, name):
+    """Release a document's file: its blob, or a pre-blob file no other row uses"""
+    if blob_id:
+        release_blob(blob_id)
+    elif name and not Document.objects.filter(file=name).exists():
+        _delete_on_commit(name)
+
+
+def adopt_stored_file(document):
+    """
+    Move a file that is already in storage (pre-blob row, presigned S3
+    upload) under content addressing. A duplicate copy is deleted.
+
+    Returns:
+        bool: True if the content already existed (bytes saved)
+    """
+    with document.file.open('rb') as content:
+        sha256 = hash_file(content)
+    size = document.file.size
+    with transaction.atomic():
+        blob, created = _take_reference(sha256, document.file.name, size)
+        Document.objects.filter(pk=document.pk).update(
+            blob=blob,
+            file=blob.name,
+            original_filename=document.original_filename or os.path.basename(document.file.name),
+        )
+        duplicate = not created and blob.name != document.file.name
+        if duplicate and not Document.objects.filter(file=document.file.name).exists():
+            _delete_on_commit(document.file.name)
+    return duplicate
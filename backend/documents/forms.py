@@ -0,0 +1,31 @@
+import mimetypes
+import os
+
+from django import forms
+from .models import ALLOWED_EXTENSIONS, MAX_FILE_SIZE, Document
+
+
+class DirectUploadForm(forms.ModelForm):
+    """Document metadata + file description for a presigned S3 upload (file bytes go to S3)"""
+    filename = forms.CharField(max_length=200)
+    size = forms.IntegerField(min_value=1)
+
+    class Meta:
+        model = Document
+        fields = ['name', 'document_type', 'firm', 'service', 'description', 'is_visible_to_firm']
+
+    def clean_filename(self):
+        filename = os.path.basename(self.cleaned_data['filename'].replace('\\', '/'))
+        if os.path.splitext(filename)[1].lower() not in ALLOWED_EXTENSIONS:
+            raise forms.ValidationError('İzin verilmeyen dosya türü.')
+        return filename
+
+    def clean_size(self):
+        size = self.cleaned_data['size']
+        if size > MAX_FILE_SIZE:
+            raise forms.ValidationError('Dosya boyutu en fazla 50MB olmalıdır.')
+        return size
+
+    @property
+    def content_type(self):
+        return mimetypes.guess_type(self.cleaned_data['filename'])[0] or 'application/octet-stream'
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:50
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Arama vektörü trigger ile güncellenir (database/triggers.sql ile aynı)
+DOCUMENT_SEARCH_TRIGGER = """
+CREATE OR REPLACE FUNCTION documents_document_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector =
+        setweight(to_tsvector('turkish', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS documents_document_search_vector ON documents_document;
+CREATE TRIGGER documents_document_search_vector
+    BEFORE INSERT OR UPDATE OF name, description ON documents_document
+    FOR EACH ROW EXECUTE FUNCTION documents_document_search_vector_update();
+
+UPDATE documents_document SET search_vector =
+        setweight(to_tsvector('turkish', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(description, '')), 'B');
+"""
+
+DOCUMENT_SEARCH_TRIGGER_REVERSE = """
+DROP TRIGGER IF EXISTS documents_document_search_vector ON documents_document;
+DROP FUNCTION IF EXISTS documents_document_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0004_alter_document_table_comment_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='doc_search_idx'),
+        ),
+        migrations.RunSQL(DOCUMENT_SEARCH_TRIGGER, DOCUMENT_SEARCH_TRIGGER_REVERSE),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('documents', '0005_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChunkedUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=200, verbose_name='Dosya Adı')),
+                ('length', models.PositiveBigIntegerField(verbose_name='Toplam Boyut')),
+                ('offset', models.PositiveBigIntegerField(default=0, verbose_name='Alınan Bayt')),
+                ('metadata', models.JSONField(default=dict, verbose_name='Doküman Bilgileri')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunked_uploads', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Parçalı Yükleme',
+                'verbose_name_plural': 'Parçalı Yüklemeler',
+                'indexes': [models.Index(fields=['updated_at'], name='chunked_upload_updated_idx')],
+            },
+        ),
+    ]
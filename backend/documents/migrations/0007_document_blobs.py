@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:09
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0006_chunked_upload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentBlob',
+            fields=[
+                ('sha256', models.CharField(max_length=64, primary_key=True, serialize=False, verbose_name='SHA-256')),
+                ('name', models.CharField(max_length=255, verbose_name='Depolama Yolu')),
+                ('size', models.PositiveBigIntegerField(verbose_name='Boyut')),
+                ('ref_count', models.PositiveIntegerField(default=0, verbose_name='Referans Sayısı')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Dosya İçeriği',
+                'verbose_name_plural': 'Dosya İçerikleri',
+            },
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='original_filename',
+            field=models.CharField(blank=True, max_length=255, verbose_name='Orijinal Dosya Adı'),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='documents', to='documents.documentblob'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0007_document_blobs'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['parent', '-version'], name='doc_parent_version_idx'),
+        ),
+        migrations.AlterField(
+            model_name='document',
+            name='parent',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='versions', to='documents.document', verbose_name='Önceki Versiyon'),
+        ),
+    ]
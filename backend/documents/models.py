@@ -1,14 +1,85 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Exists, OuterRef
+from django.db.models.expressions import RawSQL
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django_cleanup import cleanup
 import os
 import uuid
 
+MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+ALLOWED_EXTENSIONS = {'.pdf', '.doc', '.docx', '.xls', '.xlsx', '.png', '.jpg', '.jpeg'}
+
 def document_upload_path(instance, filename):
     if instance.firm:
         return f'documents/firm_{instance.firm.id}/{instance.document_type}/{filename}'
     return f'documents/general/{instance.document_type}/{filename}'
 
+def blob_path(sha256, filename):
+    """Content address of a file: blobs/ab/cd/<sha256><ext>"""
+    return f'blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}{os.path.splitext(filename)[1].lower()}'
+
+class DocumentBlob(models.Model):
+    """
+    İçerik adresli dosya (SHA-256). Aynı sertifika/sözleşme birden fazla firmaya
+    yüklense de depolamada tek kopya tutulur; ref_count, blob'a bağlı doküman
+    sayısıdır ve son referans kalkınca dosya silinir (documents.blobs).
+    """
+    sha256 = models.CharField(max_length=64, primary_key=True, verbose_name='SHA-256')
+    name = models.CharField(max_length=255, verbose_name='Depolama Yolu')
+    size = models.PositiveBigIntegerField(verbose_name='Boyut')
+    ref_count = models.PositiveIntegerField(default=0, verbose_name='Referans Sayısı')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Dosya İçeriği'
+        verbose_name_plural = 'Dosya İçerikleri'
+
+    def __str__(self):
+        return f'{self.sha256[:12]} ({self.ref_count} doküman)'
+
+class DocumentQuerySet(models.QuerySet):
+    """
+    Versiyon zinciri: her yeni versiyonun ``parent`` alanı bir öncekini gösterir
+    (v1 <- v2 <- v3). Zincirin tamamı tek sorguda recursive CTE ile okunur.
+    """
+
+    # Önce köke kadar yukarı, sonra kökten tüm alt versiyonlara aşağı iner.
+    # UNION (ALL değil) bozuk bir döngüde sonsuz özyinelemeyi engeller.
+    VERSION_CHAIN_SQL = """
+        WITH RECURSIVE ancestors(id, parent_id) AS (
+            SELECT id, parent_id FROM {table} WHERE id = %s
+            UNION
+            SELECT d.id, d.parent_id FROM {table} d JOIN ancestors a ON d.id = a.parent_id
+        ),
+        chain(id) AS (
+            SELECT id FROM ancestors WHERE parent_id IS NULL
+            UNION
+            SELECT d.id FROM {table} d JOIN chain c ON d.parent_id = c.id
+        )
+        SELECT id FROM chain
+    """
+
+    def version_chain(self, document):
+        """All versions of ``document``'s chain, oldest first, in a single query"""
+        sql = self.VERSION_CHAIN_SQL.format(table=self.model._meta.db_table)
+        return self.filter(pk__in=RawSQL(sql, [document.pk])).order_by('version', 'upload_date')
+
+    def latest_versions(self, newer=None):
+        """
+        Only documents without a newer version (chain heads).
+
+        Args:
+            newer: Queryset of the newer versions that count, e.g. only the
+                   ones visible to the firm; all documents by default
+        """
+        newer = self.model.objects.all() if newer is None else newer
+        # Anti-join; doc_parent_version_idx answers each probe from the index
+        return self.filter(~Exists(newer.filter(parent=OuterRef('pk'))))
+
+@cleanup.ignore  # Dosyalar paylaşılır; silme işini documents.blobs yapar
 class Document(models.Model):
     DOCUMENT_TYPES = (
         ('service_report', 'Hizmet Raporu'),
@@ -22,6 +93,8 @@ class Document(models.Model):
     name = models.CharField(max_length=255, verbose_name='Dosya Adı')
     document_type = models.CharField(max_length=50, choices=DOCUMENT_TYPES, verbose_name='Dosya Türü')
     file = models.FileField(upload_to=document_upload_path, verbose_name='Dosya')
+    original_filename = models.CharField(max_length=255, blank=True, verbose_name='Orijinal Dosya Adı')
+    blob = models.ForeignKey(DocumentBlob, null=True, blank=True, editable=False, on_delete=models.PROTECT, related_name='documents')
     firm = models.ForeignKey('firms.Firm', on_delete=models.CASCADE, related_name='documents')
     service = models.ForeignKey('services.Service', on_delete=models.CASCADE, related_name='documents', null=True, blank=True)
     uploaded_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='uploaded_documents')
@@ -30,8 +103,11 @@ class Document(models.Model):
     unique_id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
     is_visible_to_firm = models.BooleanField(default=True, verbose_name='Firmaya Görünür')
     version = models.PositiveIntegerField(default=1, verbose_name='Versiyon')
-    parent = models.ForeignKey('self', null=True, blank=True, on_delete=models.SET_NULL, related_name='versions', verbose_name='Önceki Versiyon')
+    parent = models.ForeignKey('self', null=True, blank=True, on_delete=models.SET_NULL, related_name='versions', verbose_name='Önceki Versiyon', db_index=False)  # doc_parent_version_idx
     download_count = models.PositiveIntegerField(default=0, verbose_name='İndirme Sayısı')
+    search_vector = SearchVectorField(null=True, editable=False)  # Trigger ile güncellenir (turkish)
+
+    objects = DocumentQuerySet.as_manager()
     
     class Meta:
         verbose_name = 'Doküman'
@@ -43,6 +119,9 @@ class Document(models.Model):
             models.Index(fields=['service', '-upload_date'], name='doc_service_date_idx'),
             models.Index(fields=['document_type', '-upload_date'], name='doc_type_date_idx'),
             models.Index(fields=['is_visible_to_firm', '-upload_date'], name='doc_visible_date_idx'),
+            GinIndex(fields=['search_vector'], name='doc_search_idx'),
+            # Son versiyon kontrolü (NOT EXISTS parent_id = ?) ve zincirde aşağı iniş
+            models.Index(fields=['parent', '-version'], name='doc_parent_version_idx'),
         ]
         db_table_comment = 'Doküman yönetimi - firmalar için dosya saklama'
     
@@ -50,7 +129,10 @@ class Document(models.Model):
         return self.name
     
     def filename(self):
-        return os.path.basename(self.file.name)
+        return self.original_filename or os.path.basename(self.file.name)
+    
+    def version_history(self):
+        return Document.objects.version_chain(self)
     
     def file_extension(self):
         name, extension = os.path.splitext(self.file.name)
@@ -59,13 +141,47 @@ class Document(models.Model):
     def clean(self):
         super().clean()
         # Basic file validation
-        max_size = 50 * 1024 * 1024  # 50MB
-        allowed_extensions = {
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.png', '.jpg', '.jpeg'
-        }
         if self.file:
             ext = self.file_extension()
-            if ext not in allowed_extensions:
+            if ext not in ALLOWED_EXTENSIONS:
                 raise ValidationError({'file': 'İzin verilmeyen dosya türü.'})
-            if hasattr(self.file, 'size') and self.file.size > max_size:
-                raise ValidationError({'file': 'Dosya boyutu en fazla 50MB olmalıdır.'})
\ No newline at end of file
+            if hasattr(self.file, 'size') and self.file.size > MAX_FILE_SIZE:
+                raise ValidationError({'file': 'Dosya boyutu en fazla 50MB olmalıdır.'})
+
+    def save(self, *args, **kwargs):
+        from .blobs import attach_blob, release_file
+        with transaction.atomic():
+            previous = None
+            if self.file and not self.file._committed:
+                # Yeni dosya: içerik zaten varsa yazılmaz, sadece referans alınır
+                if self.pk:
+                    previous = Document.objects.filter(pk=self.pk).values_list('blob_id', 'file').first()
+                attach_blob(self)
+            super().save(*args, **kwargs)
+            if previous:
+                release_file(*previous)
+
+class ChunkedUpload(models.Model):
+    """
+    Parçalı / devam ettirilebilir yükleme oturumu (tus benzeri).
+    Parçalar CHUNKED_UPLOAD_DIR altındaki geçici dosyaya eklenir; tamamlanınca
+    dosya document_upload_path'e taşınır ve Document oluşturulur.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='chunked_uploads')
+    filename = models.CharField(max_length=200, verbose_name='Dosya Adı')
+    length = models.PositiveBigIntegerField(verbose_name='Toplam Boyut')
+    offset = models.PositiveBigIntegerField(default=0, verbose_name='Alınan Bayt')
+    metadata = models.JSONField(default=dict, verbose_name='Doküman Bilgileri')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Parçalı Yükleme'
+        verbose_name_plural = 'Parçalı Yüklemeler'
+        indexes = [
+            models.Index(fields=['updated_at'], name='chunked_upload_updated_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.filename} ({self.offset}/{self.length})'
@@ -7,5 +7,5 @@ class DocumentSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Document
-        fields = ['id', 'name', 'document_type', 'document_type_display', 'description', 'upload_date', 'service', 'file']
+        fields = ['id', 'name', 'document_type', 'document_type_display', 'description', 'upload_date', 'service', 'file', 'version', 'parent']
 
@@ -1,38 +1,23 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from django.core.mail import send_mail
-from django.conf import settings
-from django.utils import timezone
+from .blobs import release_file
 from .models import Document
+from .tasks import process_uploaded_document
+from core.renditions import request_renditions
+from core.tasks import enqueue
 
 
 @receiver(post_save, sender=Document)
-def notify_firm_on_document_upload(sender, instance: Document, created, **kwargs):
+def process_document_upload(sender, instance: Document, created, **kwargs):
+    """Bildirim ve hizmet tamamlama arka planda yapılır (core.tasks)"""
     if not created:
         return
-    firm_email = instance.firm.email
-    if not firm_email:
-        return
-    subject = f'Yeni Doküman Yüklendi: {instance.name}'
-    message = (
-        f"Sayın {instance.firm.name},\n\n"
-        f"Hesabınıza yeni bir doküman yüklendi.\n"
-        f"Doküman: {instance.name}\n"
-        f"Tür: {instance.get_document_type_display()}\n\n"
-        f"Sisteme giriş yaparak görüntüleyebilirsiniz.\n"
-    )
-    try:
-        send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, [firm_email], fail_silently=True)
-    except Exception:
-        pass
+    enqueue(process_uploaded_document, instance.pk, idempotency_key=f'document_uploaded:{instance.pk}')
+    # Küçük resim ve önizleme listeler açılmadan hazırlanır (core.renditions)
+    request_renditions(instance.file.name)
 
 
-@receiver(post_save, sender=Document)
-def complete_service_on_document_upload(sender, instance, created, **kwargs):
-    """Auto-complete service when document is uploaded"""
-    if created and instance.service and instance.service.status != 'completed':
-        service = instance.service
-        service.status = 'completed'
-        if not service.completion_date:
-            service.completion_date = timezone.now().date()
-        service.save(update_fields=['status', 'completion_date'])
+@receiver(post_delete, sender=Document)
+def release_document_file(sender, instance: Document, **kwargs):
+    """Dosya başka dokümanlarla paylaşılıyor olabilir: sadece referans bırakılır (documents.blobs)"""
+    release_file(instance.blob_id, instance.file.name)
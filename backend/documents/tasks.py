@@ -0,0 +1,42 @@
+from django.utils import timezone
+
+from core.mail import queue_mail
+from core.tasks import task
+from .blobs import adopt_stored_file
+from .models import Document
+
+
+@task
+def process_uploaded_document(document_id):
+    """Yeni doküman: firmaya bildirim e-postası ve ilgili hizmeti tamamlama"""
+    document = Document.objects.select_related('firm', 'service').filter(pk=document_id).first()
+    if document is None:
+        return  # Doküman bu arada silinmiş
+
+    firm = document.firm
+    if firm.email:
+        subject = f'Yeni Doküman Yüklendi: {document.name}'
+        message = (
+            f"Sayın {firm.name},\n\n"
+            f"Hesabınıza yeni bir doküman yüklendi.\n"
+            f"Doküman: {document.name}\n"
+            f"Tür: {document.get_document_type_display()}\n\n"
+            f"Sisteme giriş yaparak görüntüleyebilirsiniz.\n"
+        )
+        queue_mail(subject, message, [firm.email])
+
+    # Auto-complete service when document is uploaded
+    service = document.service
+    if service and service.status != 'completed':
+        service.status = 'completed'
+        if not service.completion_date:
+            service.completion_date = timezone.now().date()
+        service.save(update_fields=['status', 'completion_date'])
+
+
+@task
+def adopt_document_file(document_id):
+    """Doğrudan depolamaya yüklenen dosyayı içerik adresli blob'a bağla (kopyaysa sil)"""
+    document = Document.objects.filter(pk=document_id, blob__isnull=True).first()
+    if document is not None:
+        adopt_stored_file(document)
@@ -0,0 +1,125 @@
+"""
+Presigned S3 uploads and downloads (documents.views, core.storage) against
+moto's in-process S3: the file bytes go between the client and the bucket,
+never through Django.
+
+Skipped unless boto3, django-storages, moto and requests are installed
+(S3 mode is optional).
+"""
+
+import os
+from unittest import skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from documents.models import Document
+from firms.models import Firm
+
+try:
+    import boto3
+    import requests
+    import storages  # noqa: F401
+    from moto import mock_aws
+except ImportError:
+    mock_aws = None
+
+
+BUCKET = 'byf-test'
+S3_SETTINGS = {
+    'STORAGES': {**settings.STORAGES, 'default': {'BACKEND': 'storages.backends.s3boto3.S3Boto3Storage'}},
+    'AWS_STORAGE_BUCKET_NAME': BUCKET,
+    'AWS_S3_REGION_NAME': 'us-east-1',
+    'AWS_S3_CUSTOM_DOMAIN': '',
+    'AWS_S3_FILE_OVERWRITE': False,
+    'AWS_DEFAULT_ACL': None,
+    'AWS_QUERYSTRING_EXPIRE': 60,
+    'DIRECT_UPLOAD_EXPIRE': 600,
+}
+
+
+@skipUnless(mock_aws, 'boto3, django-storages, moto ve requests gerekli')
+@override_settings(**S3_SETTINGS)
+class DirectUploadTests(TestCase):
+    def setUp(self):
+        cache.clear()  # Önbellekteki kullanıcılar (accounts.principal) testler arasında taşınmasın
+        os.environ.setdefault('AWS_ACCESS_KEY_ID', 'test')
+        os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'test')
+        self.mock = mock_aws()
+        self.mock.start()
+        self.addCleanup(self.mock.stop)
+        boto3.client('s3', region_name='us-east-1').create_bucket(Bucket=BUCKET)
+
+        User = get_user_model()
+        self.admin = User.objects.create_superuser('s3admin', 's3admin@example.com', 'x', user_type='admin')
+        firm_user = User.objects.create_user('s3firma', password='x', user_type='firma')
+        self.firm = Firm.objects.create(user=firm_user, name='S3 Firma', tax_number='1234567890', phone='5550000000')
+        self.client.force_login(self.admin)
+
+    def _start(self, filename='plan.pdf', size=12):
+        response = self.client.post(reverse('direct_upload_start'), {
+            'name': 'Çizim', 'document_type': 'technical_drawing', 'firm': self.firm.pk,
+            'description': '', 'is_visible_to_firm': 'on', 'filename': filename, 'size': size,
+        }, secure=True)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def _put_object(self, upload, content):
+        """The browser's part: multipart POST of the signed policy straight to S3"""
+        response = requests.post(upload['url'], data=upload['fields'], files={'file': ('plan.pdf', content)})
+        self.assertLess(response.status_code, 300, response.text)
+
+    def _complete(self, upload):
+        return self.client.post(reverse('direct_upload_complete'), {'token': upload['token']}, secure=True)
+
+    def test_upload_creates_document_once(self):
+        upload = self._start()
+        self._put_object(upload, b'%PDF-1.4 abc')
+
+        response = self._complete(upload)
+        self.assertEqual(response.status_code, 200)
+        document = Document.objects.get(pk=response.json()['id'])
+        self.assertEqual(document.uploaded_by, self.admin)
+        self.assertEqual(document.original_filename, 'plan.pdf')
+        self.assertEqual(document.file.read(), b'%PDF-1.4 abc')
+
+        # Tekrarlanan tamamlama çağrısı aynı kaydı döner
+        self.assertEqual(self._complete(upload).json()['id'], document.pk)
+        self.assertEqual(Document.objects.count(), 1)
+
+    def test_concurrent_starts_with_same_filename_get_separate_keys(self):
+        first, second = self._start(), self._start()
+        self._put_object(first, b'%PDF-1.4 first')
+        self._put_object(second, b'%PDF-1.4 second')
+
+        first_id = self._complete(first).json()['id']
+        second_id = self._complete(second).json()['id']
+        self.assertNotEqual(first_id, second_id)
+        self.assertEqual(Document.objects.get(pk=first_id).file.read(), b'%PDF-1.4 first')
+        self.assertEqual(Document.objects.get(pk=second_id).file.read(), b'%PDF-1.4 second')
+
+    def test_complete_without_object_is_rejected(self):
+        response = self._complete(self._start())
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Document.objects.exists())
+
+    def test_tampered_token_is_rejected(self):
+        upload = self._start()
+        self._put_object(upload, b'%PDF-1.4 abc')
+        upload['token'] += 'x'
+        self.assertEqual(self._complete(upload).status_code, 400)
+
+    def test_download_redirects_to_signed_url(self):
+        upload = self._start()
+        self._put_object(upload, b'%PDF-1.4 abc')
+        document_id = self._complete(upload).json()['id']
+
+        response = self.client.get(reverse('download_document', args=[document_id]), secure=True)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Cache-Control'], 'private, no-store')
+        signed = requests.get(response['Location'])
+        self.assertEqual(signed.content, b'%PDF-1.4 abc')
+        self.assertIn('attachment', signed.headers['Content-Disposition'])
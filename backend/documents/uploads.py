@@ -0,0 +1,237 @@
+"""
+Chunked, resumable document uploads (tus-like protocol)
+
+    POST  /dokumanlar/yukleme/parcali/         Upload-Length + Upload-Metadata -> 201 Location
+    HEAD  /dokumanlar/yukleme/parcali/<id>/    -> Upload-Offset (resume point)
+    PATCH /dokumanlar/yukleme/parcali/<id>/    Upload-Offset + body chunk -> 204 Upload-Offset
+
+Chunks are streamed from the request in CHUNK_SIZE pieces and appended to a
+temp file in CHUNKED_UPLOAD_DIR, so memory per upload is constant. Bytes that
+arrived before a dropped connection are kept and the client resumes from the
+offset HEAD reports. The SHA-256 is updated chunk by chunk (checked against
+an optional ``sha256`` metadata value) and doubles as the content address:
+when the last byte arrives the file is moved into the blob store (a rename on
+local disk, a streamed upload on S3, nothing if the content already exists)
+and the Document row is created.
+"""
+
+import base64
+import hashlib
+import os
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from .blobs import attach_blob
+from .forms import DirectUploadForm
+from .models import ChunkedUpload
+
+
+CHUNK_SIZE = 64 * 1024
+STALE_UPLOAD_AGE = timedelta(hours=24)  # Bu süre işlem görmeyen oturumlar silinir
+
+# upload id -> (offset, sha256) of the last chunk written by this process.
+# Another worker picks up by re-hashing the temp file (constant memory).
+_hashers = {}
+_hashers_lock = threading.Lock()
+
+
+class _PartFile(File):
+    """Temp file exposing its path, so FileSystemStorage renames it instead of copying (see _complete)"""
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+class UploadError(Exception):
+    """Protocol error; ``status`` is the HTTP status to answer with"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_metadata(header):
+    """Decode ``Upload-Metadata: key base64,key2 base64`` into a dict"""
+    metadata = {}
+    for pair in filter(None, (item.strip() for item in (header or '').split(','))):
+        key, _, value = pair.partition(' ')
+        try:
+            metadata[key] = base64.b64decode(value, validate=True).decode() if value else ''
+        except (ValueError, UnicodeDecodeError):
+            raise UploadError(f'Geçersiz Upload-Metadata değeri: {key}')
+    return metadata
+
+
+def _temp_path(upload):
+    return os.path.join(settings.CHUNKED_UPLOAD_DIR, f'{upload.pk}.part')
+
+
+def _link_path(upload):
+    return os.path.join(settings.CHUNKED_UPLOAD_DIR, f'{upload.pk}.link')
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _discard(upload):
+    with _hashers_lock:
+        _hashers.pop(upload.pk, None)
+    paths = [_temp_path(upload), _link_path(upload)]
+    upload.delete()
+    # Dosyalar işlem kaydedilince silinir; geri alınırsa .part kalır ve yükleme sürdürülebilir
+    transaction.on_commit(lambda: [_remove(path) for path in paths])
+
+
+def cancel_upload(upload_id, user):
+    """Drop an unfinished upload (tus termination); False if it does not exist"""
+    upload = ChunkedUpload.objects.filter(pk=upload_id, user=user).first()
+    if upload is None:
+        return False
+    _discard(upload)
+    return True
+
+
+def purge_stale_uploads(limit=20):
+    """Delete abandoned sessions and their temp files"""
+    cutoff = timezone.now() - STALE_UPLOAD_AGE
+    for upload in ChunkedUpload.objects.filter(updated_at__lt=cutoff)[:limit]:
+        _discard(upload)
+
+
+def create_upload(user, length, metadata):
+    """
+    Validate the document metadata up front and open an upload session.
+
+    Extension, declared size and document fields are checked before a
+    single byte is sent (DirectUploadForm).
+    """
+    form = DirectUploadForm({**metadata, 'size': length})
+    if not form.is_valid():
+        raise UploadError('; '.join(
+            f'{field}: {" ".join(errors)}' for field, errors in form.errors.items()
+        ))
+    purge_stale_uploads()
+    os.makedirs(settings.CHUNKED_UPLOAD_DIR, exist_ok=True)
+    upload = ChunkedUpload.objects.create(
+        user=user,
+        filename=form.cleaned_data['filename'],
+        length=form.cleaned_data['size'],
+        metadata={
+            field: metadata.get(field, '')
+            for field in [*form.fields, 'sha256'] if field != 'size'
+        },
+    )
+    open(_temp_path(upload), 'wb').close()
+    return upload
+
+
+def _running_hash(upload, offset):
+    """SHA-256 of the first ``offset`` bytes, from this process's cache or the temp file"""
+    with _hashers_lock:
+        cached = _hashers.get(upload.pk)
+    if cached is not None and cached[0] == offset:
+        return cached[1].copy()
+    sha256 = hashlib.sha256()
+    with open(_temp_path(upload), 'rb') as part:
+        remaining = offset
+        while remaining > 0:
+            chunk = part.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            sha256.update(chunk)
+            remaining -= len(chunk)
+    return sha256
+
+
+def append_chunk(upload_id, user, offset, stream, content_length):
+    """
+    Append a request body to the upload at ``offset``.
+
+    Returns:
+        tuple: (ChunkedUpload, Document or None) - the Document once the last
+               byte has arrived
+    """
+    with transaction.atomic():
+        # Aynı yüklemeye eşzamanlı iki PATCH gelirse ikincisi beklemez (423)
+        try:
+            upload = ChunkedUpload.objects.select_for_update(nowait=True).get(pk=upload_id, user=user)
+        except ChunkedUpload.DoesNotExist:
+            raise UploadError('Yükleme bulunamadı.', status=404)
+        except DatabaseError:
+            raise UploadError('Yükleme başka bir istek tarafından kullanılıyor.', status=423)
+        if offset != upload.offset:
+            raise UploadError(f'Upload-Offset {upload.offset} olmalı.', status=409)
+        remaining = upload.length - upload.offset
+        if content_length is not None and content_length > remaining:
+            raise UploadError('Parça, bildirilen dosya boyutunu aşıyor.', status=413)
+
+        sha256 = _running_hash(upload, upload.offset)
+        with open(_temp_path(upload), 'r+b') as part:
+            part.seek(upload.offset)
+            part.truncate()  # Kaydedilmemiş yarım bayt kalıntıları
+            try:
+                while remaining > 0:
+                    chunk = stream.read(min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    part.write(chunk)
+                    sha256.update(chunk)
+                    remaining -= len(chunk)
+            except OSError:
+                pass  # Bağlantı koptu: gelen baytlar korunur, istemci HEAD ile devam eder
+            part.flush()
+            os.fsync(part.fileno())
+            upload.offset = part.tell()
+
+        upload.save(update_fields=['offset', 'updated_at'])
+        if upload.offset < upload.length:
+            with _hashers_lock:
+                _hashers[upload.pk] = (upload.offset, sha256)
+            return upload, None
+
+        # Son parça: satır kilitliyken tamamlanır ve silinir. Tekrarlanan ya da eşzamanlı
+        # bir PATCH 423 alır, kilit kalkınca da yüklemeyi bulamaz (404); ikinci Document oluşmaz
+        try:
+            return upload, _complete(upload, sha256.hexdigest())
+        except UploadError as exc:
+            error = exc  # _complete yüklemeyi sildi; silme işlemle birlikte kaydedilir
+    raise error
+
+
+def _complete(upload, sha256):
+    """Move the finished temp file into storage and create the Document (called under the row lock)"""
+    form = DirectUploadForm({**upload.metadata, 'size': upload.length})
+    if not form.is_valid():
+        _discard(upload)
+        raise UploadError('Doküman bilgileri artık geçerli değil.')
+    expected = upload.metadata.get('sha256')
+    if expected and expected.lower() != sha256:
+        _discard(upload)
+        raise UploadError('Dosya özeti (SHA-256) uyuşmuyor.', status=460)
+
+    document = form.save(commit=False)
+    document.uploaded_by = upload.user
+    # Depoya .part'ın sabit bağı taşınır (kopya yok): işlem geri alınırsa baytlar .part'ta kalır.
+    # Taşınmış blob dosyası o durumda sahipsiz kalır
+    path, link = _temp_path(upload), _link_path(upload)
+    _remove(link)  # Geri alınmış önceki denemeden
+    try:
+        os.link(path, link)
+    except OSError:
+        link = path  # Sabit bağ desteklenmiyor: .part'ın kendisi taşınır
+    with open(link, 'rb') as part, transaction.atomic():
+        # İçerik adresli depo; özet zaten hesaplandı. S3'e parça parça akar, bellek sabit kalır
+        document.file = _PartFile(part, name=upload.filename)
+        attach_blob(document, sha256=sha256)
+        document.save()
+    _discard(upload)
+    return document
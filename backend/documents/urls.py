@@ -11,4 +11,8 @@ urlpatterns = [
     path('<int:document_id>/', views.document_detail, name='document_detail'),
     path('<int:document_id>/indir/', views.download_document, name='download_document'),
     path('<int:document_id>/sil/', views.delete_document, name='delete_document'),
+    path('yukleme/baslat/', views.direct_upload_start, name='direct_upload_start'),
+    path('yukleme/tamamla/', views.direct_upload_complete, name='direct_upload_complete'),
+    path('yukleme/parcali/', views.chunked_upload_create, name='chunked_upload_create'),
+    path('yukleme/parcali/<uuid:upload_id>/', views.chunked_upload, name='chunked_upload'),
 ] + router.urls
\ No newline at end of file
@@ -1,13 +1,27 @@
+import uuid
+
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
-from django.http import Http404, FileResponse
+from django.http import Http404, HttpResponse, JsonResponse
 from django.contrib import messages
-from django.db.models import F
-from urllib.parse import quote
-import mimetypes
-import os
+from django.conf import settings
+from django.core import signing
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from django.views.decorators.http import require_http_methods, require_POST
+
+from .forms import DirectUploadForm
+from .models import ChunkedUpload, Document, document_upload_path
+from .tasks import adopt_document_file
+from .uploads import UploadError, append_chunk, cancel_upload, create_upload, parse_metadata
+from core.counters import DOCUMENT_DOWNLOADS
+from core.downloads import file_response, is_new_download
+from core.pagination import paginate_keyset
+from core.renditions import prefetch_renditions
+from core.storage import presigned_upload, supports_presigned_urls
+from core.tasks import enqueue
 
-from .models import Document
+DIRECT_UPLOAD_SALT = 'documents.direct_upload'
 
 
 def _check_document_access(user, document):
@@ -20,19 +34,26 @@ def _check_document_access(user, document):
 @login_required
 def document_list(request):
     if request.user.user_type == 'admin':
-        documents = Document.objects.select_related('firm', 'service').all().order_by('-upload_date')
+        documents = Document.objects.select_related('firm', 'service').latest_versions()
     else:
         if not hasattr(request.user, 'firm'):
             messages.error(request, 'Firma bilgileriniz bulunamadı.')
             return redirect('custom_logout')
-        documents = request.user.firm.documents.select_related('service').filter(is_visible_to_firm=True).order_by('-upload_date')
+        # Gizli yeni versiyon, firmanın gördüğü son versiyonu saklamasın
+        documents = request.user.firm.documents.select_related('service').filter(
+            is_visible_to_firm=True,
+        ).latest_versions(newer=Document.objects.filter(is_visible_to_firm=True))
     
     # Filter by service if provided
     service_id = request.GET.get('service')
     if service_id:
         documents = documents.filter(service_id=service_id)
     
-    return render(request, 'documents/document_list.html', {'documents': documents})
+    documents = paginate_keyset(request, documents, ordering=('-upload_date',))
+    # Küçük resimler sayfa için tek seferde (core.renditions); satır başına sorgu yok
+    prefetch_renditions(document.file for document in documents)
+    
+    return render(request, 'documents/document_list.html', {'documents': documents, 'page': documents})
 
 @login_required
 def document_detail(request, document_id):
@@ -41,10 +62,16 @@ def document_detail(request, document_id):
     if not _check_document_access(request.user, document):
         raise Http404("Doküman bulunamadı.")
     
-    # Atomic view count increment
-    Document.objects.filter(id=document.id).update(download_count=F('download_count') + 1)
+    # Buffered count; flushed to the database in batches (core.counters)
+    DOCUMENT_DOWNLOADS.incr(document.pk)
+    DOCUMENT_DOWNLOADS.apply([document])
+    
+    # Versiyon geçmişi: tüm zincir tek sorguda (recursive CTE)
+    versions = document.version_history()
+    if request.user.user_type != 'admin':
+        versions = versions.filter(firm=document.firm, is_visible_to_firm=True)
     
-    return render(request, 'documents/document_detail.html', {'document': document})
+    return render(request, 'documents/document_detail.html', {'document': document, 'versions': versions})
 
 @login_required
 def download_document(request, document_id):
@@ -53,26 +80,17 @@ def download_document(request, document_id):
     if not _check_document_access(request.user, document):
         raise Http404("Doküman bulunamadı.")
     
-    # Atomic download count increment
-    Document.objects.filter(id=document.id).update(download_count=F('download_count') + 1)
-    
-    # Download file
+    # Access checked; the bytes come from nginx or a presigned S3 URL when configured (core.downloads)
     try:
-        original_filename = os.path.basename(document.file.name)
-        response = FileResponse(document.file.open('rb'), as_attachment=True)
-        
-        # Set filename with UTF-8 encoding support
-        encoded_filename = quote(original_filename)
-        response['Content-Disposition'] = f'attachment; filename="{original_filename}"; filename*=UTF-8\'\'{encoded_filename}'
-        
-        # Set MIME type
-        content_type = mimetypes.guess_type(original_filename)[0] or 'application/octet-stream'
-        response['Content-Type'] = content_type
-        
-        return response
+        response = file_response(request, document.file, filename=document.filename(), version=document.unique_id)
     except Exception:
         messages.error(request, 'Dosya indirilemedi.')
         return redirect('document_list')
+    
+    # Buffered download count; 304s and resumed transfers are not new downloads
+    if is_new_download(request, response):
+        DOCUMENT_DOWNLOADS.incr(document.pk)
+    return response
 
 @login_required
 def delete_document(request, document_id):
@@ -98,4 +116,130 @@ def delete_document(request, document_id):
     else:
         messages.error(request, 'Bu dokümanı silme yetkiniz yok.')
     
-    return redirect('document_list')
\ No newline at end of file
+    return redirect('document_list')
+
+def _can_upload(user):
+    """Same rule as DocumentAdmin.has_add_permission"""
+    return user.is_superuser or user.has_perm('documents.add_document')
+
+@login_required
+@require_POST
+def direct_upload_start(request):
+    """Presigned S3 upload, step 1: validate metadata and sign a POST policy for the browser"""
+    if not _can_upload(request.user):
+        return JsonResponse({'error': 'Yetkisiz erişim'}, status=403)
+    if not supports_presigned_urls():
+        return JsonResponse({'error': 'Doğrudan yükleme yalnızca S3 depolamada kullanılabilir.'}, status=400)
+    
+    form = DirectUploadForm(request.POST)
+    if not form.is_valid():
+        return JsonResponse({'errors': form.errors}, status=400)
+    
+    # Final key chosen now; the object is written only by the browser. The random
+    # directory keeps concurrent starts with the same filename on separate keys.
+    name = default_storage.get_available_name(
+        document_upload_path(form.save(commit=False), f"{uuid.uuid4().hex}/{form.cleaned_data['filename']}"),
+        max_length=Document._meta.get_field('file').max_length,
+    )
+    upload = presigned_upload(name, form.content_type, form.cleaned_data['size'])
+    token = signing.dumps({
+        'key': name,
+        'user': request.user.pk,
+        'data': {field: request.POST.get(field, '') for field in form.fields if field != 'size'},
+    }, salt=DIRECT_UPLOAD_SALT)
+    return JsonResponse({'url': upload['url'], 'fields': upload['fields'], 'token': token})
+
+@login_required
+@require_POST
+def direct_upload_complete(request):
+    """Presigned S3 upload, step 2: the object is in the bucket, create the Document row"""
+    max_age = getattr(settings, 'DIRECT_UPLOAD_EXPIRE', 600) + 3600
+    try:
+        payload = signing.loads(request.POST.get('token', ''), salt=DIRECT_UPLOAD_SALT, max_age=max_age)
+    except signing.BadSignature:
+        return JsonResponse({'error': 'Geçersiz veya süresi dolmuş yükleme.'}, status=400)
+    if payload['user'] != request.user.pk or not _can_upload(request.user):
+        return JsonResponse({'error': 'Yetkisiz erişim'}, status=403)
+    
+    document = Document.objects.filter(file=payload['key']).first()  # Tekrarlanan çağrı
+    if document is None:
+        try:
+            size = default_storage.size(payload['key'])  # HEAD: yükleme gerçekten tamamlandı mı?
+        except Exception:
+            return JsonResponse({'error': 'Dosya depolamada bulunamadı.'}, status=400)
+        
+        form = DirectUploadForm({**payload['data'], 'size': size})
+        if not form.is_valid():
+            default_storage.delete(payload['key'])
+            return JsonResponse({'errors': form.errors}, status=400)
+        document = form.save(commit=False)
+        document.file.name = payload['key']
+        document.original_filename = form.cleaned_data['filename']
+        document.uploaded_by = request.user
+        document.save()
+        # Hash needs the bytes: a worker reads the object and deduplicates it
+        enqueue(adopt_document_file, document.pk, idempotency_key=f'document_blob:{document.pk}')
+    
+    return JsonResponse({
+        'id': document.pk,
+        'admin_url': reverse('admin:documents_document_change', args=[document.pk]),
+    })
+
+def _tus_response(status, headers=None):
+    response = HttpResponse(status=status)
+    response['Tus-Resumable'] = '1.0.0'
+    response['Cache-Control'] = 'no-store'
+    for header, value in (headers or {}).items():
+        response[header] = value
+    return response
+
+@login_required
+@require_POST
+def chunked_upload_create(request):
+    """Parçalı yükleme oturumu açar (Upload-Length + Upload-Metadata, tus creation)"""
+    if not _can_upload(request.user):
+        return JsonResponse({'error': 'Yetkisiz erişim'}, status=403)
+    try:
+        length = int(request.headers.get('Upload-Length', ''))
+        upload = create_upload(request.user, length, parse_metadata(request.headers.get('Upload-Metadata')))
+    except ValueError:
+        return JsonResponse({'error': 'Upload-Length başlığı gerekli.'}, status=400)
+    except UploadError as exc:
+        return JsonResponse({'error': str(exc)}, status=exc.status)
+    return _tus_response(201, {
+        'Location': reverse('chunked_upload', args=[upload.pk]),
+        'Upload-Offset': '0',
+    })
+
+@login_required
+@require_http_methods(['HEAD', 'PATCH', 'DELETE'])
+def chunked_upload(request, upload_id):
+    """HEAD: devam noktası, PATCH: sıradaki parça, DELETE: iptal"""
+    if request.method == 'HEAD':
+        upload = ChunkedUpload.objects.filter(pk=upload_id, user=request.user).first()
+        if upload is None:
+            return _tus_response(404)
+        return _tus_response(200, {'Upload-Offset': upload.offset, 'Upload-Length': upload.length})
+    
+    if request.method == 'DELETE':
+        return _tus_response(204 if cancel_upload(upload_id, request.user) else 404)
+    
+    if request.content_type != 'application/offset+octet-stream':
+        return JsonResponse({'error': 'Content-Type application/offset+octet-stream olmalı.'}, status=415)
+    try:
+        offset = int(request.headers['Upload-Offset'])
+    except (KeyError, ValueError):
+        return JsonResponse({'error': 'Upload-Offset başlığı gerekli.'}, status=400)
+    
+    # Body is read from the request stream chunk by chunk, never as request.body
+    content_length = int(request.META.get('CONTENT_LENGTH') or 0) or None
+    try:
+        upload, document = append_chunk(upload_id, request.user, offset, request, content_length)
+    except UploadError as exc:
+        return JsonResponse({'error': str(exc)}, status=exc.status)
+    
+    headers = {'Upload-Offset': upload.offset}
+    if document is not None:
+        headers['X-Document-Id'] = document.pk
+        headers['X-Document-Url'] = reverse('admin:documents_document_change', args=[document.pk])
+    return _tus_response(204, headers)
@@ -1,6 +1,10 @@
 from rest_framework import viewsets, permissions
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from .models import Document
 from .serializers import DocumentSerializer
+from core.pagination import KeysetCursorPagination
+from core.search import SEARCH_ORDERING, search_queryset
 
 
 class IsAdminOrFirmOwner(permissions.BasePermission):
@@ -16,10 +20,28 @@ class IsAdminOrFirmOwner(permissions.BasePermission):
 class DocumentViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = DocumentSerializer
     permission_classes = [IsAdminOrFirmOwner]
+    pagination_class = KeysetCursorPagination
+    ordering = ('-upload_date',)  # Matches doc_firm_date_idx (firm, -upload_date)
 
     def get_queryset(self):
         user = self.request.user
         if getattr(user, 'user_type', '') == 'admin':
-            return Document.objects.all()
-        return Document.objects.filter(firm=user.firm, is_visible_to_firm=True)
+            queryset = Document.objects.all()
+        else:
+            queryset = Document.objects.filter(firm=user.firm, is_visible_to_firm=True)
+        if self.action == 'list' and self.request.query_params.get('all_versions') != '1':
+            queryset = queryset.latest_versions(newer=queryset)
 
+        # ?q= full-text search, most relevant first (read by KeysetCursorPagination)
+        query = self.request.query_params.get('q')
+        if query:
+            queryset = search_queryset(queryset, query)
+            self.ordering = SEARCH_ORDERING + type(self).ordering
+        return queryset
+
+    @action(detail=True, pagination_class=None)
+    def versions(self, request, pk=None):
+        """Full version chain of a document, oldest first"""
+        document = self.get_object()
+        queryset = document.version_history().filter(pk__in=self.get_queryset().values('pk'))
+        return Response(self.get_serializer(queryset, many=True).data)
@@ -4,8 +4,10 @@ from django.utils.html import format_html
 
 from .models import Firm, FirmServiceHistory
 from core.utils import generate_secure_password, log_activity
+from accounts.principal import invalidate_principals
 from core.models import ProvisionedCredential
 from core.admin_filters import FirmStatusFilter
+from core.search import FullTextSearchAdminMixin
 
 
 def generate_username_from_firm_name(firm_name):
@@ -24,10 +26,12 @@ def generate_username_from_firm_name(firm_name):
 
 
 @admin.register(Firm)
-class FirmAdmin(admin.ModelAdmin):
+class FirmAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
     list_display = ('name', 'contact_person', 'phone', 'email', 'city', 'status_display', 'registration_date')
     list_filter = (FirmStatusFilter, 'city')
     search_fields = ('name', 'contact_person', 'email', 'tax_number')
+    search_exact_fields = ('tax_number',)
+    search_trigram_fields = ('name',)
     readonly_fields = ('registration_date', 'updated_at', 'unique_id', 'user')
     actions = ['set_active', 'set_inactive']
     
@@ -159,14 +163,20 @@ class FirmAdmin(admin.ModelAdmin):
     
     def set_active(self, request, queryset):
         """Set selected firms as active"""
+        # update() sinyal göndermez; id'ler önceden alınır (filtreli queryset update sonrası boş kalabilir)
+        user_ids = list(queryset.values_list('user_id', flat=True))
         updated = queryset.update(status='active')
+        invalidate_principals(user_ids)
         self.message_user(request, f'{updated} firma aktif hale getirildi.')
         log_activity(request.user, 'update', f'Toplu aktifleştirme: {updated} firma')
     set_active.short_description = '✓ Seçili firmaları aktif yap'
     
     def set_inactive(self, request, queryset):
         """Set selected firms as inactive (passive)"""
+        # update() sinyal göndermez; id'ler önceden alınır (filtreli queryset update sonrası boş kalabilir)
+        user_ids = list(queryset.values_list('user_id', flat=True))
         updated = queryset.update(status='inactive')
+        invalidate_principals(user_ids)
         self.message_user(request, f'{updated} firma pasif hale getirildi.')
         log_activity(request.user, 'update', f'Toplu pasifleştirme: {updated} firma')
     set_inactive.short_description = '✗ Seçili firmaları pasif yap'
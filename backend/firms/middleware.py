@@ -12,32 +12,33 @@ class FirmStatusMiddleware:
     """
     Middleware to check if a logged-in firm user's firm is still active.
     If the firm is inactive or suspended, log out the user.
+    
+    Firm status comes from request.principal: the user and its firm are
+    loaded together and cached (accounts.principal), so the check costs no
+    query per request.
     """
     
     def __init__(self, get_response):
         self.get_response = get_response
+        # Skip check for logout and login pages to avoid redirect loops
+        self.exempt_paths = frozenset([reverse('custom_logout'), reverse('custom_login')])
     
     def __call__(self, request):
         # Check before processing the request
-        if request.user.is_authenticated and request.user.user_type == 'firma':
-            # Skip check for logout and login pages to avoid redirect loops
-            current_path = request.path
-            if current_path not in [reverse('custom_logout'), reverse('custom_login')]:
-                try:
-                    firm = request.user.firm
-                    if firm.status != 'active':
-                        # Log out the user
-                        logout(request)
-                        messages.warning(request, 'Hesabınız pasif duruma alındı. Giriş yapamazsınız.')
-                        
-                        # Redirect to login page
-                        return redirect('custom_login')
-                except Exception:
-                    # If firm doesn't exist or any error, log out for safety
-                    logout(request)
-                    messages.error(request, 'Firma bilgileriniz bulunamadı.')
-                    return redirect('custom_login')
+        principal = request.principal
+        if principal.is_firm and request.path not in self.exempt_paths:
+            if principal.firm_id is None:
+                # If firm doesn't exist, log out for safety
+                logout(request)
+                messages.error(request, 'Firma bilgileriniz bulunamadı.')
+                return redirect('custom_login')
+            if not principal.firm_active:
+                # Log out the user
+                logout(request)
+                messages.warning(request, 'Hesabınız pasif duruma alındı. Giriş yapamazsınız.')
+                
+                # Redirect to login page
+                return redirect('custom_login')
         
         response = self.get_response(request)
         return response
-
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:50
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Arama vektörü trigger ile güncellenir (database/triggers.sql ile aynı)
+FIRM_SEARCH_TRIGGER = """
+CREATE OR REPLACE FUNCTION firms_firm_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector =
+        setweight(to_tsvector('turkish', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.contact_person, '')), 'B') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.city, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(NEW.email, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(NEW.tax_number, '')), 'C');
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS firms_firm_search_vector ON firms_firm;
+CREATE TRIGGER firms_firm_search_vector
+    BEFORE INSERT OR UPDATE OF name, contact_person, city, email, tax_number ON firms_firm
+    FOR EACH ROW EXECUTE FUNCTION firms_firm_search_vector_update();
+
+UPDATE firms_firm SET search_vector =
+        setweight(to_tsvector('turkish', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(contact_person, '')), 'B') ||
+        setweight(to_tsvector('turkish', coalesce(city, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(email, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(tax_number, '')), 'C');
+"""
+
+FIRM_SEARCH_TRIGGER_REVERSE = """
+DROP TRIGGER IF EXISTS firms_firm_search_vector ON firms_firm;
+DROP FUNCTION IF EXISTS firms_firm_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('firms', '0006_alter_firm_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='firm',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='firm',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='firm_search_idx'),
+        ),
+        migrations.RunSQL(FIRM_SEARCH_TRIGGER, FIRM_SEARCH_TRIGGER_REVERSE),
+    ]
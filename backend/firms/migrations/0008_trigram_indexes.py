@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:52
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('firms', '0007_search_vector'),
+    ]
+
+    operations = [
+        # pg_trgm: database/init.sql de kurar; migration tek başına da çalışabilsin
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='firm',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='firm_name_trgm_idx'),
+        ),
+    ]
@@ -1,4 +1,7 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator, RegexValidator
@@ -43,6 +46,7 @@ class Firm(models.Model):
     registration_date = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     unique_id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    search_vector = SearchVectorField(null=True, editable=False)  # Trigger ile güncellenir (turkish)
     
     class Meta:
         verbose_name = 'Firma'
@@ -52,6 +56,9 @@ class Firm(models.Model):
             models.Index(fields=['-registration_date'], name='firm_reg_date_idx'),
             models.Index(fields=['status', '-registration_date'], name='firm_status_date_idx'),
             models.Index(fields=['city', 'status'], name='firm_city_status_idx'),
+            GinIndex(fields=['search_vector'], name='firm_search_idx'),
+            # Kısmi ad araması (icontains) ve benzerlik için trigram index
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='firm_name_trgm_idx'),
         ]
         db_table_comment = 'Firma bilgileri - müşteri firmaların kayıtları'
     
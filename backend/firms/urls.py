@@ -4,5 +4,6 @@ from . import views
 urlpatterns = [
     path('', views.firm_list, name='firm_list'),
     path('<int:firm_id>/', views.firm_detail, name='firm_detail'),
+    path('otomatik-tamamla/', views.firm_autocomplete, name='firm_autocomplete'),
     path('profilim/', views.firm_profile, name='firm_profile'),
 ]
\ No newline at end of file
@@ -2,9 +2,15 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django import forms
+from django.http import JsonResponse
+from django.urls import reverse
 
 from .models import Firm
 from core.utils import is_admin
+from core.pagination import paginate_keyset
+from core.search import AUTOCOMPLETE_LIMIT, AUTOCOMPLETE_MIN_LENGTH, trigram_search
+from core.stats import firm_count_subquery
+from services.models import Service, ServiceRequest
 
 
 @login_required
@@ -14,8 +20,35 @@ def firm_list(request):
         messages.error(request, 'Bu sayfaya erişim yetkiniz bulunmamaktadır. Sadece yöneticiler firma listesini görüntüleyebilir.')
         return redirect('firm_dashboard')
     
-    firms = Firm.objects.all().order_by('-registration_date')
-    return render(request, 'firms/firm_list.html', {'firms': firms})
+    # Correlated subqueries instead of two JOIN + COUNTs (avoids row explosion)
+    firms = Firm.objects.annotate(
+        services_count=firm_count_subquery(Service.objects.all()),
+        requests_count=firm_count_subquery(ServiceRequest.objects.all()),
+    )
+    firms = paginate_keyset(request, firms, ordering=('-registration_date',))
+    return render(request, 'firms/firm_list.html', {'firms': firms, 'page': firms})
+
+@login_required
+def firm_autocomplete(request):
+    """Firma adı otomatik tamamlama (JSON) - Admin only"""
+    if not is_admin(request.user):
+        return JsonResponse({'error': 'Yetkisiz erişim'}, status=403)
+    
+    query = request.GET.get('q', '').strip()
+    if len(query) < AUTOCOMPLETE_MIN_LENGTH:
+        return JsonResponse({'results': []})
+    
+    firms = trigram_search(Firm.objects.only('id', 'name', 'city'), 'name', query)[:AUTOCOMPLETE_LIMIT]
+    return JsonResponse({'results': [
+        {
+            'id': firm.id,
+            'text': firm.name,
+            'city': firm.city,
+            'similarity': round(firm.similarity, 3),
+            'url': reverse('firm_detail', args=[firm.id]),
+        }
+        for firm in firms
+    ]})
 
 @login_required
 def firm_detail(request, firm_id):
@@ -4,6 +4,11 @@ from django.urls import reverse
 from django.utils import timezone
 
 from .models import Service, ServiceRequest
+from .tasks import create_service_for_request
+from .utils import get_or_create_service_for_request
+from core.search import FullTextSearchAdminMixin
+from core.stats import invalidate_dashboard_stats
+from core.tasks import enqueue
 from core.admin_filters import ServiceStatusFilter, ServiceTypeFilter, PriorityFilter
 
 
@@ -18,10 +23,11 @@ STATUS_COLORS = {
 
 
 @admin.register(Service)
-class ServiceAdmin(admin.ModelAdmin):
+class ServiceAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
     list_display = ('name', 'firm', 'service_type', 'status', 'request_date', 'assigned_admin')
     list_filter = (ServiceTypeFilter, ServiceStatusFilter, 'firm', 'assigned_admin')
     search_fields = ('name', 'firm__name', 'description')
+    search_related_vectors = ('firm__search_vector',)
     readonly_fields = ('request_date', 'unique_id')
     date_hierarchy = 'request_date'  # Date filter at top - request_date not in list_filter
     
@@ -54,18 +60,20 @@ class ServiceAdmin(admin.ModelAdmin):
         return request.user.is_superuser
 
 @admin.register(ServiceRequest)
-class ServiceRequestAdmin(admin.ModelAdmin):
+class ServiceRequestAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
     list_display = ('title', 'firm', 'service_type', 'priority', 'status_badge', 'request_date', 'action_buttons')
     list_filter = (ServiceStatusFilter, ServiceTypeFilter, PriorityFilter, 'firm')
     search_fields = ('title', 'firm__name', 'description', 'tracking_code')
-    readonly_fields = ('request_date', 'updated_at', 'unique_id', 'tracking_code')
+    search_related_vectors = ('firm__search_vector',)
+    search_trigram_fields = ('tracking_code', 'firm__name')
+    readonly_fields = ('request_date', 'updated_at', 'unique_id', 'tracking_code', 'service')
     date_hierarchy = 'request_date'  # Date filter at top - removed from list_filter to avoid duplication
     fieldsets = (
         ('Talep Bilgileri', {
             'fields': ('firm', 'service_type', 'title', 'description', 'priority', 'requested_completion_date', 'tracking_code')
         }),
         ('Durum', {
-            'fields': ('status', 'admin_response', 'responded_by')
+            'fields': ('status', 'admin_response', 'responded_by', 'service')
         }),
         ('Sistem Bilgileri', {
             'fields': ('request_date', 'updated_at', 'unique_id'),
@@ -92,7 +100,7 @@ class ServiceRequestAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         """Show only pending and approved requests"""
-        return super().get_queryset(request).filter(status__in=['pending', 'approved']).select_related('firm', 'responded_by')
+        return super().get_queryset(request).filter(status__in=['pending', 'approved']).select_related('firm', 'responded_by', 'service')
     
     def status_badge(self, obj):
         return format_html(
@@ -113,32 +121,29 @@ class ServiceRequestAdmin(admin.ModelAdmin):
     action_buttons.short_description = 'İşlemler'
     
     def approve_requests(self, request, queryset):
-        updated = 0
-        created_services = 0
-        for service_request in queryset:
-            if service_request.status == 'pending':
-                service_request.status = 'approved'
-                service_request.responded_by = request.user
-                service_request.save()
-                updated += 1
-                
-                # Service oluştur
-                if not Service.objects.filter(firm=service_request.firm, name__icontains=service_request.title).exists():
-                    Service.objects.create(
-                        name=service_request.title,
-                        service_type=service_request.service_type,
-                        description=service_request.description,
-                        firm=service_request.firm,
-                        status='in_progress',
-                        assigned_admin=request.user,
-                    )
-                    created_services += 1
+        pending = list(queryset.filter(status='pending').values_list('pk', 'firm_id'))
+        request_ids = [pk for pk, _ in pending]
+        updated = ServiceRequest.objects.filter(pk__in=request_ids, status='pending').update(
+            status='approved', responded_by=request.user, updated_at=timezone.now()
+        )
+        # queryset.update() does not send post_save signals
+        for firm_id in {firm_id for _, firm_id in pending}:
+            invalidate_dashboard_stats(firm_id=firm_id)
+        
+        # Service kayıtları arka planda oluşturulur ve talebe bağlanır (run_worker)
+        for request_id in request_ids:
+            enqueue(create_service_for_request, request_id, request.user.pk,
+                    idempotency_key=f'service_for_request:{request_id}')
         
-        self.message_user(request, f'✅ {updated} talep onaylandı ve {created_services} hizmet oluşturuldu.')
+        self.message_user(request, f'✅ {updated} talep onaylandı, hizmet kayıtları arka planda oluşturuluyor.')
     approve_requests.short_description = '✅ Seçili talepleri onayla'
     
     def reject_requests(self, request, queryset):
+        firm_ids = set(queryset.values_list('firm_id', flat=True))
         updated = queryset.update(status='rejected', responded_by=request.user)
+        # queryset.update() does not send post_save signals
+        for firm_id in firm_ids:
+            invalidate_dashboard_stats(firm_id=firm_id)
         self.message_user(request, f'{updated} talep reddedildi.')
     reject_requests.short_description = '❌ Seçili talepleri reddet'
     
@@ -155,21 +160,13 @@ class ServiceRequestAdmin(admin.ModelAdmin):
         
         # Auto-update related Service on status change
         if change and old_status and old_status != obj.status:
-            # İlgili Service'i bul veya oluştur
-            service = Service.objects.filter(firm=obj.firm, name__icontains=obj.title).first()
+            # İlgili Service (talebe bağlı kayıt)
+            service = obj.service
             
             # APPROVED veya IN_PROGRESS: Service oluştur/güncelle
             if obj.status in ['approved', 'in_progress']:
-                if not service:
-                    # Yeni Service oluştur
-                    service = Service.objects.create(
-                        name=obj.title,
-                        service_type=obj.service_type,
-                        description=obj.description,
-                        firm=obj.firm,
-                        status='in_progress',
-                        assigned_admin=request.user,
-                    )
+                service, created = get_or_create_service_for_request(obj, request.user)
+                if created:
                     self.message_user(request, f'✅ Hizmet oluşturuldu ve "Devam Ediyor" olarak işaretlendi: {service.name}', level='SUCCESS')
                 else:
                     # Mevcut Service'i güncelle
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0005_alter_servicerequest_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servicerequest',
+            name='service',
+            field=models.ForeignKey(blank=True, help_text='Talep onaylandığında oluşturulan hizmet kaydı', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='requests', to='services.service', verbose_name='İlgili Hizmet'),
+        ),
+    ]
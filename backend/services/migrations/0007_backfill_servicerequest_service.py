@@ -0,0 +1,59 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:45
+
+from collections import defaultdict
+
+from django.db import migrations
+
+
+PROCESSED_STATUSES = ['approved', 'in_progress', 'completed']
+
+
+def link_existing_requests(apps, schema_editor):
+    """
+    Backfill ServiceRequest.service for already processed requests.
+    Uses the same rule as the old title lookup (same firm, service name
+    contains the request title) but loads each firm's services only once.
+    """
+    Service = apps.get_model('services', 'Service')
+    ServiceRequest = apps.get_model('services', 'ServiceRequest')
+
+    pending_links = ServiceRequest.objects.filter(
+        service__isnull=True,
+        status__in=PROCESSED_STATUSES,
+    ).only('id', 'firm_id', 'title')
+
+    firm_ids = set(pending_links.values_list('firm_id', flat=True))
+    if not firm_ids:
+        return
+
+    # Service default ordering is -request_date, same as the old .first() lookup
+    services_by_firm = defaultdict(list)
+    for service in Service.objects.filter(firm_id__in=firm_ids).only('id', 'firm_id', 'name').order_by('-request_date'):
+        services_by_firm[service.firm_id].append(service)
+
+    to_update = []
+    for service_request in pending_links.iterator():
+        title = service_request.title.casefold()
+        for service in services_by_firm.get(service_request.firm_id, []):
+            if title in service.name.casefold():
+                service_request.service_id = service.id
+                to_update.append(service_request)
+                break
+
+    ServiceRequest.objects.bulk_update(to_update, ['service'], batch_size=500)
+
+
+def unlink_requests(apps, schema_editor):
+    """Reverse operation - the column is dropped by the previous migration"""
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0006_servicerequest_service'),
+    ]
+
+    operations = [
+        migrations.RunPython(link_existing_requests, unlink_requests),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:50
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Arama vektörü trigger ile güncellenir (database/triggers.sql ile aynı)
+SERVICE_SEARCH_TRIGGER = """
+CREATE OR REPLACE FUNCTION services_service_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector =
+        setweight(to_tsvector('turkish', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.notes, '')), 'C');
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS services_service_search_vector ON services_service;
+CREATE TRIGGER services_service_search_vector
+    BEFORE INSERT OR UPDATE OF name, description, notes ON services_service
+    FOR EACH ROW EXECUTE FUNCTION services_service_search_vector_update();
+
+UPDATE services_service SET search_vector =
+        setweight(to_tsvector('turkish', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(description, '')), 'B') ||
+        setweight(to_tsvector('turkish', coalesce(notes, '')), 'C');
+"""
+
+SERVICE_SEARCH_TRIGGER_REVERSE = """
+DROP TRIGGER IF EXISTS services_service_search_vector ON services_service;
+DROP FUNCTION IF EXISTS services_service_search_vector_update();
+"""
+
+SERVICEREQUEST_SEARCH_TRIGGER = """
+CREATE OR REPLACE FUNCTION services_servicerequest_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector =
+        setweight(to_tsvector('turkish', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.tracking_code, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS services_servicerequest_search_vector ON services_servicerequest;
+CREATE TRIGGER services_servicerequest_search_vector
+    BEFORE INSERT OR UPDATE OF title, tracking_code, description ON services_servicerequest
+    FOR EACH ROW EXECUTE FUNCTION services_servicerequest_search_vector_update();
+
+UPDATE services_servicerequest SET search_vector =
+        setweight(to_tsvector('turkish', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(tracking_code, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(description, '')), 'B');
+"""
+
+SERVICEREQUEST_SEARCH_TRIGGER_REVERSE = """
+DROP TRIGGER IF EXISTS services_servicerequest_search_vector ON services_servicerequest;
+DROP FUNCTION IF EXISTS services_servicerequest_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0007_backfill_servicerequest_service'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='servicerequest',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='service_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='svcreq_search_idx'),
+        ),
+        migrations.RunSQL(SERVICE_SEARCH_TRIGGER, SERVICE_SEARCH_TRIGGER_REVERSE),
+        migrations.RunSQL(SERVICEREQUEST_SEARCH_TRIGGER, SERVICEREQUEST_SEARCH_TRIGGER_REVERSE),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:52
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0008_search_vector'),
+        ('firms', '0008_trigram_indexes'),  # pg_trgm extension
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('tracking_code'), name='gin_trgm_ops'), name='svcreq_tracking_trgm_idx'),
+        ),
+    ]
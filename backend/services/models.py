@@ -1,4 +1,7 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.conf import settings
 from django.core.exceptions import ValidationError
 import uuid
@@ -29,6 +32,7 @@ class Service(models.Model):
                                      null=True, blank=True, related_name='assigned_services')
     unique_id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
     notes = models.TextField(blank=True, verbose_name='Notlar')
+    search_vector = SearchVectorField(null=True, editable=False)  # Trigger ile güncellenir (turkish)
     
     class Meta:
         verbose_name = 'Hizmet'
@@ -39,6 +43,7 @@ class Service(models.Model):
             models.Index(fields=['firm', 'status'], name='service_firm_status_idx'),
             models.Index(fields=['status', '-request_date'], name='service_status_date_idx'),
             models.Index(fields=['-completion_date'], name='service_completion_idx'),
+            GinIndex(fields=['search_vector'], name='service_search_idx'),
         ]
         db_table_comment = 'Hizmet kayıtları - müşteri hizmetlerinin detayları'
     
@@ -93,6 +98,10 @@ class ServiceRequest(models.Model):
     admin_response = models.TextField(blank=True, verbose_name='Yönetici Yanıtı')
     responded_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, 
                                       null=True, blank=True, related_name='responded_requests')
+    service = models.ForeignKey(Service, on_delete=models.SET_NULL, null=True, blank=True,
+                                related_name='requests', verbose_name='İlgili Hizmet',
+                                help_text='Talep onaylandığında oluşturulan hizmet kaydı')
+    search_vector = SearchVectorField(null=True, editable=False)  # Trigger ile güncellenir (turkish)
     
     class Meta:
         verbose_name = 'Hizmet Talebi'
@@ -103,6 +112,8 @@ class ServiceRequest(models.Model):
             models.Index(fields=['firm', 'status'], name='svcreq_firm_status_idx'),
             models.Index(fields=['status', '-request_date'], name='svcreq_status_date_idx'),
             models.Index(fields=['tracking_code'], name='svcreq_tracking_code_idx'),
+            GinIndex(fields=['search_vector'], name='svcreq_search_idx'),
+            GinIndex(OpClass(Upper('tracking_code'), name='gin_trgm_ops'), name='svcreq_tracking_trgm_idx'),
         ]
         db_table_comment = 'Hizmet talepleri - müşterilerden gelen yeni hizmet istekleri'
     
@@ -0,0 +1,15 @@
+from django.contrib.auth import get_user_model
+
+from core.tasks import task
+from .models import ServiceRequest
+from .utils import get_or_create_service_for_request
+
+
+@task
+def create_service_for_request(request_id, admin_id):
+    """Onaylanan talep için Service oluştur ve talebe bağla"""
+    service_request = ServiceRequest.objects.select_related('firm', 'service').filter(pk=request_id).first()
+    if service_request is None or service_request.status != 'approved':
+        return  # Talep silinmiş veya bu arada başka duruma geçmiş
+    admin_user = get_user_model().objects.filter(pk=admin_id).first()
+    get_or_create_service_for_request(service_request, admin_user)
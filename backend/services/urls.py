@@ -15,6 +15,7 @@ urlpatterns = [
     path('<int:service_id>/', views.service_detail, name='service_detail'),
     path('<int:service_id>/guncelle/', views.update_service, name='update_service'),
     path('talep-olustur/', views.create_service_request, name='create_service_request'),
+    path('talep/otomatik-tamamla/', views.service_request_autocomplete, name='service_request_autocomplete'),
     path('talep/<int:request_id>/', views.service_request_detail, name='service_request_detail'),
     path('talep/<int:request_id>/iptal/', views.cancel_service_request, name='cancel_service_request'),
     path('talep/<int:request_id>/sil/', views.delete_service_request, name='delete_service_request'),
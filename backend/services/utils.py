@@ -1,12 +1,22 @@
 """Service-related utility functions for status resolution and common operations"""
 
+from django.db.models.query import QuerySet
+
 from .models import Service, ServiceRequest
 
 
+# ServiceRequest statuses that have (or may have) a Service tracking the work
+PROCESSED_STATUSES = ('approved', 'in_progress', 'completed')
+
+
 def resolve_service_request_status(service_request):
     """
     Get the real status of a ServiceRequest by checking its related Service.
     
+    The Service is read through the ``ServiceRequest.service`` foreign key, so
+    callers handling many requests should load them with
+    ``select_related('service')`` (see enrich_service_requests_with_status).
+    
     When a ServiceRequest is approved, an admin creates a Service to track the actual work.
     This function ensures we display the real work status (from Service) rather than
     the initial request status (from ServiceRequest).
@@ -31,18 +41,13 @@ def resolve_service_request_status(service_request):
     display_status = service_request.status
     display_status_text = service_request.get_status_display()
     
-    # Only look for Service if the request has been processed
-    if service_request.status in ['approved', 'in_progress', 'completed']:
-        # Find the related Service by matching firm and title
-        related_service = Service.objects.filter(
-            firm=service_request.firm,
-            name__icontains=service_request.title
-        ).first()
+    # Only use the linked Service if the request has been processed
+    if service_request.status in PROCESSED_STATUSES and service_request.service_id:
+        related_service = service_request.service
         
-        # If a Service exists, use its status (the real work status)
-        if related_service:
-            display_status = related_service.status
-            display_status_text = related_service.get_status_display()
+        # The Service status is the real work status
+        display_status = related_service.status
+        display_status_text = related_service.get_status_display()
     
     return {
         'related_service': related_service,
@@ -58,6 +63,10 @@ def enrich_service_requests_with_status(service_requests):
     This function processes multiple ServiceRequests and attaches the real Service
     status to each one, making it easy to display accurate status in templates.
     
+    Related Services are resolved for the whole batch at once: querysets get a
+    ``select_related('service')`` join, and lists load all missing Services with
+    a single ``in_bulk`` query.
+    
     Args:
         service_requests: QuerySet or list of ServiceRequest instances
         
@@ -75,6 +84,12 @@ def enrich_service_requests_with_status(service_requests):
         ...     print(f"{item['request'].title}: {item['display_status_text']}")
         Test Service: Tamamlandı
     """
+    if isinstance(service_requests, QuerySet):
+        service_requests = service_requests.select_related('service')
+    else:
+        service_requests = list(service_requests)
+        _prefetch_services(service_requests)
+    
     enriched = []
     for sr in service_requests:
         status_info = resolve_service_request_status(sr)
@@ -84,3 +99,43 @@ def enrich_service_requests_with_status(service_requests):
         })
     return enriched
 
+
+def _prefetch_services(service_requests):
+    """Helper: Attach linked Services to a list of requests with one query"""
+    missing_ids = {
+        sr.service_id for sr in service_requests
+        if sr.service_id and not ServiceRequest.service.is_cached(sr)
+    }
+    if not missing_ids:
+        return
+    services = Service.objects.in_bulk(missing_ids)
+    for sr in service_requests:
+        if sr.service_id in services:
+            sr.service = services[sr.service_id]
+
+
+def get_or_create_service_for_request(service_request, assigned_admin):
+    """
+    Return the Service linked to a ServiceRequest, creating and linking it if needed.
+    
+    Args:
+        service_request (ServiceRequest): The approved service request
+        assigned_admin: Admin user the new Service is assigned to
+        
+    Returns:
+        tuple: (Service instance, created flag)
+    """
+    if service_request.service_id:
+        return service_request.service, False
+    
+    service = Service.objects.create(
+        name=service_request.title,
+        service_type=service_request.service_type,
+        description=service_request.description,
+        firm=service_request.firm,
+        status='in_progress',
+        assigned_admin=assigned_admin,
+    )
+    service_request.service = service
+    service_request.save(update_fields=['service', 'updated_at'])
+    return service, True
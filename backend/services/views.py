@@ -2,14 +2,20 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import JsonResponse
-from django.core.mail import send_mail
-from django.conf import settings
 from django.utils.dateparse import parse_date
+from django.db.models import Count
+from django.urls import reverse
 
 from .models import Service, ServiceRequest
 from .forms import ServiceRequestForm
-from .utils import enrich_service_requests_with_status
+from .utils import enrich_service_requests_with_status, PROCESSED_STATUSES
 from core.utils import is_admin, is_firm, check_firm_access
+from core.mail import admin_recipients, queue_mail
+from core.pagination import paginate_keyset
+from core.search import (
+    AUTOCOMPLETE_LIMIT, AUTOCOMPLETE_MIN_LENGTH, SEARCH_ORDERING, search_queryset, trigram_search,
+)
+from core.stats import get_service_stats
 
 
 def _validate_service_request_modification(request, service_request):
@@ -47,13 +53,17 @@ def service_list(request):
     q = request.GET.get('q')
     if service_type:
         qs = qs.filter(service_type=service_type)
+    ordering = ('-request_date',)
     if q:
-        qs = qs.filter(name__icontains=q)
+        qs = search_queryset(qs, q)
+        ordering = SEARCH_ORDERING + ordering
 
-    services = qs.order_by('-request_date')
+    qs = qs.annotate(documents_count=Count('documents'))
+    services = paginate_keyset(request, qs, ordering=ordering)
 
     context = {
         'services': services,
+        'page': services,
         'filters': {
             'service_type': service_type or '',
             'q': q or '',
@@ -83,20 +93,19 @@ def all_services(request):
     if service_type:
         services = services.filter(service_type=service_type)
     
+    ordering = ('-request_date',)
     if search_query:
-        services = services.filter(name__icontains=search_query)
+        services = search_queryset(services, search_query, related_vectors=('firm__search_vector',))
+        ordering = SEARCH_ORDERING + ordering
     
     if firm_id:
         services = services.filter(firm_id=firm_id)
     
-    services = services.order_by('-request_date')
+    services = services.annotate(documents_count=Count('documents'))
+    services = paginate_keyset(request, services, ordering=ordering)
     
-    # İstatistikler
-    total_services = Service.objects.count()
-    completed_count = Service.objects.filter(status='completed').count()
-    in_progress_count = Service.objects.filter(status='in_progress').count()
-    pending_count = Service.objects.filter(status='pending').count()
-    cancelled_count = Service.objects.filter(status='cancelled').count()
+    # İstatistikler - tek sorgu, önbellekli (core.stats)
+    stats = get_service_stats()
     
     # Firma listesi (filtre için)
     from firms.models import Firm
@@ -104,11 +113,8 @@ def all_services(request):
     
     context = {
         'services': services,
-        'total_services': total_services,
-        'completed_count': completed_count,
-        'in_progress_count': in_progress_count,
-        'pending_count': pending_count,
-        'cancelled_count': cancelled_count,
+        'page': services,
+        **stats,
         'firms': firms,
         'filters': {
             'status': status_filter or '',
@@ -182,17 +188,12 @@ def create_service_request(request):
             if is_edit_mode:
                 messages.success(request, 'Hizmet talebiniz başarıyla güncellendi.')
             else:
-                # Notify admin via email for new requests only
-                try:
-                    send_mail(
-                        subject=f"Yeni Hizmet Talebi: {service_request.title} ({service_request.tracking_code})",
-                        message=f"Firma: {service_request.firm.name}\nTür: {service_request.get_service_type_display()}\nTakip Kodu: {service_request.tracking_code}",
-                        from_email=settings.DEFAULT_FROM_EMAIL,
-                        recipient_list=[settings.EMAIL_HOST_USER or settings.DEFAULT_FROM_EMAIL],
-                        fail_silently=True,
-                    )
-                except Exception:
-                    pass
+                # Notify admin via email for new requests only (queued, sent by send_queued_mail)
+                queue_mail(
+                    subject=f"Yeni Hizmet Talebi: {service_request.title} ({service_request.tracking_code})",
+                    message=f"Firma: {service_request.firm.name}\nTür: {service_request.get_service_type_display()}\nTakip Kodu: {service_request.tracking_code}",
+                    recipient_list=admin_recipients(),
+                )
                 messages.success(request, 'Hizmet talebiniz başarıyla oluşturuldu.')
             
             return redirect('service_request_list')
@@ -209,7 +210,7 @@ def create_service_request(request):
 
 @login_required
 def service_request_detail(request, request_id):
-    service_request = get_object_or_404(ServiceRequest.objects.select_related('firm', 'responded_by'), id=request_id)
+    service_request = get_object_or_404(ServiceRequest.objects.select_related('firm', 'responded_by', 'service__assigned_admin'), id=request_id)
     
     # Access control - only related firm or admin can view
     if is_firm(request.user) and not check_firm_access(request.user, service_request.firm):
@@ -220,16 +221,12 @@ def service_request_detail(request, request_id):
     related_service = None
     documents = []
     
-    if service_request.status in ['approved', 'in_progress', 'completed']:
-        # Bu talebe karşılık gelen Service'i bul
-        related_service = Service.objects.filter(
-            firm=service_request.firm,
-            name__icontains=service_request.title
-        ).first()
+    if service_request.status in PROCESSED_STATUSES and service_request.service_id:
+        # Bu talebe bağlı Service
+        related_service = service_request.service
         
-        if related_service:
-            # Service'e ait firmaya görünür dokümanları getir
-            documents = related_service.documents.filter(is_visible_to_firm=True).order_by('-upload_date')
+        # Service'e ait firmaya görünür dokümanları getir
+        documents = related_service.documents.filter(is_visible_to_firm=True).order_by('-upload_date')
     
     context = {
         'service_request': service_request,
@@ -290,8 +287,10 @@ def completed_services(request):
     if service_type:
         services = services.filter(service_type=service_type)
     
+    ordering = ('-completion_date',)
     if search_query:
-        services = services.filter(name__icontains=search_query)
+        services = search_queryset(services, search_query)
+        ordering = SEARCH_ORDERING + ordering
     
     if start_date:
         services = services.filter(completion_date__gte=start_date)
@@ -299,10 +298,11 @@ def completed_services(request):
     if end_date:
         services = services.filter(completion_date__lte=end_date)
     
-    services = services.order_by('-completion_date')
+    services = paginate_keyset(request, services, ordering=ordering)
     
     context = {
         'services': services,
+        'page': services,
         'page_title': 'Tamamlanan Hizmetler',
         'filters': {
             'service_type': service_type or '',
@@ -326,18 +326,21 @@ def service_request_list(request):
         return redirect('custom_logout')
     
     # Firmaya ait tüm hizmet taleplerini al
-    service_requests = request.user.firm.service_requests.all().order_by('-request_date')
+    service_requests = request.user.firm.service_requests.select_related('service')
     
     # Filtreler
     status_filter = request.GET.get('status')
     if status_filter:
         service_requests = service_requests.filter(status=status_filter)
     
+    service_requests = paginate_keyset(request, service_requests, ordering=('-request_date',))
+    
     # ServiceRequest'leri gerçek Service durumları ile zenginleştir
     requests_with_services = enrich_service_requests_with_status(service_requests)
     
     context = {
         'service_requests': service_requests,
+        'page': service_requests,
         'requests_with_services': requests_with_services,
         'status_filter': status_filter or '',
         'page_title': 'Hizmet Taleplerim',
@@ -345,6 +348,34 @@ def service_request_list(request):
     return render(request, 'services/service_request_list.html', context)
 
 
+@login_required
+def service_request_autocomplete(request):
+    """Takip kodu otomatik tamamlama (JSON) - Admin only"""
+    if not is_admin(request.user):
+        return JsonResponse({'error': 'Yetkisiz erişim'}, status=403)
+    
+    query = request.GET.get('q', '').strip()
+    if len(query) < AUTOCOMPLETE_MIN_LENGTH:
+        return JsonResponse({'results': []})
+    
+    service_requests = trigram_search(
+        ServiceRequest.objects.select_related('firm').only('id', 'tracking_code', 'title', 'status', 'firm__name'),
+        'tracking_code', query,
+    )[:AUTOCOMPLETE_LIMIT]
+    return JsonResponse({'results': [
+        {
+            'id': service_request.id,
+            'text': service_request.tracking_code,
+            'title': service_request.title,
+            'firm': service_request.firm.name,
+            'status': service_request.get_status_display(),
+            'similarity': round(service_request.similarity, 3),
+            'url': reverse('service_request_detail', args=[service_request.id]),
+        }
+        for service_request in service_requests
+    ]})
+
+
 @login_required
 def update_service(request, service_id):
     """AJAX endpoint for updating service details - Admin only"""
@@ -0,0 +1,99 @@
+// BYF Mühendislik - Chunked, resumable upload for the document admin add form
+// The file is sent in CHUNK_SIZE pieces (documents.uploads, tus-like protocol);
+// after a dropped connection the upload continues from the offset the server reports.
+
+document.addEventListener('DOMContentLoaded', function() {
+    const CHUNK_SIZE = 5 * 1024 * 1024;
+    const MAX_RETRIES = 5;
+
+    const input = document.querySelector('input[type="file"][data-chunked-upload]');
+    if (!input || !input.form || !/\/add\/?$/.test(window.location.pathname)) {
+        return; // Only the add form; changes keep the normal admin flow
+    }
+    const form = input.form;
+
+    form.addEventListener('submit', async function(event) {
+        const file = input.files[0];
+        if (!file) {
+            return;
+        }
+        event.preventDefault();
+        const buttons = form.querySelectorAll('input[type="submit"]');
+        buttons.forEach(button => button.disabled = true);
+        const csrfToken = form.querySelector('input[name="csrfmiddlewaretoken"]').value;
+
+        try {
+            const fields = new FormData(form);
+            fields.delete(input.name);
+            fields.delete('csrfmiddlewaretoken');
+            fields.set('filename', file.name);
+            const metadata = Array.from(fields.entries())
+                .filter(([, value]) => typeof value === 'string')
+                .map(([key, value]) => key + ' ' + encodeBase64(value))
+                .join(',');
+
+            const created = await fetch(input.dataset.chunkedUpload, {
+                method: 'POST',
+                credentials: 'same-origin',
+                headers: {'X-CSRFToken': csrfToken, 'Upload-Length': file.size, 'Upload-Metadata': metadata},
+            });
+            if (created.status !== 201) {
+                throw new Error((await created.json()).error || 'Yükleme başlatılamadı.');
+            }
+            const uploadUrl = created.headers.get('Location');
+
+            let offset = 0;
+            let retries = 0;
+            while (true) {
+                let response;
+                try {
+                    response = await fetch(uploadUrl, {
+                        method: 'PATCH',
+                        credentials: 'same-origin',
+                        headers: {
+                            'X-CSRFToken': csrfToken,
+                            'Content-Type': 'application/offset+octet-stream',
+                            'Upload-Offset': offset,
+                        },
+                        body: file.slice(offset, offset + CHUNK_SIZE),
+                    });
+                } catch (networkError) {
+                    // Connection dropped: ask the server how much arrived and continue from there
+                    if (++retries > MAX_RETRIES) {
+                        throw networkError;
+                    }
+                    await new Promise(resolve => setTimeout(resolve, 1000 * retries));
+                    const head = await fetch(uploadUrl, {method: 'HEAD', credentials: 'same-origin'});
+                    offset = parseInt(head.headers.get('Upload-Offset'), 10);
+                    continue;
+                }
+                if (response.status !== 204) {
+                    throw new Error((await response.json()).error || 'Yükleme başarısız.');
+                }
+                retries = 0;
+                offset = parseInt(response.headers.get('Upload-Offset'), 10);
+                setProgress(offset / file.size);
+                if (response.headers.get('X-Document-Url')) {
+                    window.location.href = response.headers.get('X-Document-Url');
+                    return;
+                }
+            }
+        } catch (error) {
+            alert(error.message);
+            buttons.forEach(button => button.disabled = false);
+        }
+    });
+
+    function encodeBase64(text) {
+        const bytes = new TextEncoder().encode(text);
+        return btoa(String.fromCharCode(...bytes));
+    }
+
+    function setProgress(ratio) {
+        input.title = 'Yükleniyor: %' + Math.round(ratio * 100);
+        const label = form.querySelector('input[name="_save"]');
+        if (label) {
+            label.value = 'Yükleniyor… %' + Math.round(ratio * 100);
+        }
+    }
+});
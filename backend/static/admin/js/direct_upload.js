@@ -0,0 +1,62 @@
+// BYF Mühendislik - Presigned S3 upload for the document admin add form
+// The file goes from the browser straight to the bucket; Django only signs the
+// upload and creates the Document row afterwards (documents.views.direct_upload_*).
+
+document.addEventListener('DOMContentLoaded', function() {
+    const input = document.querySelector('input[type="file"][data-direct-upload-start]');
+    if (!input || !input.form || !input.form.querySelector('input[name="_save"]')) {
+        return;
+    }
+    if (!/\/add\/?$/.test(window.location.pathname)) {
+        return; // Only the add form; changes keep the normal admin flow
+    }
+    const form = input.form;
+
+    form.addEventListener('submit', async function(event) {
+        const file = input.files[0];
+        if (!file) {
+            return;
+        }
+        event.preventDefault();
+        const buttons = form.querySelectorAll('input[type="submit"]');
+        buttons.forEach(button => button.disabled = true);
+
+        try {
+            const metadata = new FormData(form);
+            metadata.delete(input.name);
+            metadata.set('filename', file.name);
+            metadata.set('size', file.size);
+            const signed = await postForm(input.dataset.directUploadStart, metadata);
+
+            // Signed POST policy fields first, file last
+            const upload = new FormData();
+            Object.entries(signed.fields).forEach(([key, value]) => upload.append(key, value));
+            upload.append('file', file);
+            const stored = await fetch(signed.url, {method: 'POST', body: upload});
+            if (!stored.ok) {
+                throw new Error('Dosya depolamaya yüklenemedi (' + stored.status + ').');
+            }
+
+            const done = new FormData();
+            done.set('csrfmiddlewaretoken', metadata.get('csrfmiddlewaretoken'));
+            done.set('token', signed.token);
+            const documentInfo = await postForm(input.dataset.directUploadComplete, done);
+            window.location.href = documentInfo.admin_url;
+        } catch (error) {
+            alert(error.message);
+            buttons.forEach(button => button.disabled = false);
+        }
+    });
+
+    async function postForm(url, body) {
+        const response = await fetch(url, {method: 'POST', body: body, credentials: 'same-origin'});
+        const data = await response.json();
+        if (!response.ok) {
+            const errors = data.errors
+                ? Object.entries(data.errors).map(([field, messages]) => field + ': ' + messages.join(' ')).join('\n')
+                : data.error;
+            throw new Error(errors || 'Yükleme başarısız.');
+        }
+        return data;
+    }
+});
@@ -34,6 +34,7 @@ CREATE INDEX IF NOT EXISTS idx_servicerequest_priority ON services_servicereques
 CREATE INDEX IF NOT EXISTS idx_servicerequest_type ON services_servicerequest(service_type);
 CREATE INDEX IF NOT EXISTS idx_servicerequest_tracking_code ON services_servicerequest(tracking_code);
 CREATE INDEX IF NOT EXISTS idx_servicerequest_responded_by ON services_servicerequest(responded_by_id);
+CREATE INDEX IF NOT EXISTS idx_servicerequest_service ON services_servicerequest(service_id);
 
 --
 -- Dokümanlar tablosu index'leri
@@ -55,8 +56,19 @@ CREATE INDEX IF NOT EXISTS idx_blog_slug ON blog_blogpost(slug);
 --
 -- Full-text search
 --
-CREATE INDEX IF NOT EXISTS idx_blog_content_search ON blog_blogpost USING gin(to_tsvector('turkish', content));
-CREATE INDEX IF NOT EXISTS idx_blog_title_search ON blog_blogpost USING gin(to_tsvector('turkish', title));
+-- search_vector kolonları triggers.sql içindeki trigger'lar ile güncellenir
+CREATE INDEX IF NOT EXISTS service_search_idx ON services_service USING gin(search_vector);
+CREATE INDEX IF NOT EXISTS svcreq_search_idx ON services_servicerequest USING gin(search_vector);
+CREATE INDEX IF NOT EXISTS doc_search_idx ON documents_document USING gin(search_vector);
+CREATE INDEX IF NOT EXISTS blog_search_idx ON blog_blogpost USING gin(search_vector);
+CREATE INDEX IF NOT EXISTS firm_search_idx ON firms_firm USING gin(search_vector);
+
+--
+-- Trigram (pg_trgm) - kısmi ad / takip kodu araması ve benzerlik
+-- Django icontains UPPER(kolon) LIKE ürettiği için index UPPER() üzerinde
+--
+CREATE INDEX IF NOT EXISTS firm_name_trgm_idx ON firms_firm USING gin(UPPER(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS svcreq_tracking_trgm_idx ON services_servicerequest USING gin(UPPER(tracking_code) gin_trgm_ops);
 
 --
 -- Partial indexes
@@ -44,7 +44,8 @@ CREATE TABLE IF NOT EXISTS firms_firm (
     status VARCHAR(10) DEFAULT 'active' CHECK (status IN ('active', 'inactive')),
     registration_date TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    unique_id UUID DEFAULT uuid_generate_v4() UNIQUE
+    unique_id UUID DEFAULT uuid_generate_v4() UNIQUE,
+    search_vector TSVECTOR
 );
 
 COMMENT ON TABLE firms_firm IS 'Firma bilgileri tablosu';
@@ -62,7 +63,8 @@ CREATE TABLE IF NOT EXISTS services_service (
     completion_date DATE,
     assigned_admin_id INTEGER REFERENCES accounts_customuser(id) ON DELETE SET NULL,
     unique_id UUID DEFAULT uuid_generate_v4() UNIQUE,
-    notes TEXT DEFAULT ''
+    notes TEXT DEFAULT '',
+    search_vector TSVECTOR
 );
 
 COMMENT ON TABLE services_service IS 'Hizmet kayıtları tablosu';
@@ -82,7 +84,9 @@ CREATE TABLE IF NOT EXISTS services_servicerequest (
     tracking_code VARCHAR(20) UNIQUE,
     requested_completion_date DATE,
     admin_response TEXT DEFAULT '',
-    responded_by_id INTEGER REFERENCES accounts_customuser(id) ON DELETE SET NULL
+    responded_by_id INTEGER REFERENCES accounts_customuser(id) ON DELETE SET NULL,
+    service_id INTEGER REFERENCES services_service(id) ON DELETE SET NULL,
+    search_vector TSVECTOR
 );
 
 COMMENT ON TABLE services_servicerequest IS 'Hizmet talepleri tablosu';
@@ -102,7 +106,8 @@ CREATE TABLE IF NOT EXISTS documents_document (
     is_visible_to_firm BOOLEAN DEFAULT TRUE,
     version INTEGER DEFAULT 1,
     parent_id INTEGER REFERENCES documents_document(id) ON DELETE SET NULL,
-    download_count INTEGER DEFAULT 0
+    download_count INTEGER DEFAULT 0,
+    search_vector TSVECTOR
 );
 
 COMMENT ON TABLE documents_document IS 'Doküman yönetimi tablosu';
@@ -122,7 +127,8 @@ CREATE TABLE IF NOT EXISTS blog_blogpost (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     published_at TIMESTAMP WITH TIME ZONE,
-    unique_id UUID DEFAULT uuid_generate_v4() UNIQUE
+    unique_id UUID DEFAULT uuid_generate_v4() UNIQUE,
+    search_vector TSVECTOR
 );
 
 COMMENT ON TABLE blog_blogpost IS 'Blog yazıları tablosu';
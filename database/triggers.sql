@@ -84,3 +84,104 @@ CREATE TRIGGER enforce_firm_user_type
     BEFORE INSERT OR UPDATE ON firms_firm 
     FOR EACH ROW WHEN (NEW.user_id IS NOT NULL)
     EXECUTE FUNCTION check_firm_user_type();
+
+
+--
+-- services_service arama vektörü (full-text search, turkish)
+--
+CREATE OR REPLACE FUNCTION services_service_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector =
+        setweight(to_tsvector('turkish', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.notes, '')), 'C');
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS services_service_search_vector ON services_service;
+CREATE TRIGGER services_service_search_vector
+    BEFORE INSERT OR UPDATE OF name, description, notes ON services_service
+    FOR EACH ROW EXECUTE FUNCTION services_service_search_vector_update();
+
+
+--
+-- services_servicerequest arama vektörü (full-text search, turkish)
+--
+CREATE OR REPLACE FUNCTION services_servicerequest_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector =
+        setweight(to_tsvector('turkish', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.tracking_code, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS services_servicerequest_search_vector ON services_servicerequest;
+CREATE TRIGGER services_servicerequest_search_vector
+    BEFORE INSERT OR UPDATE OF title, tracking_code, description ON services_servicerequest
+    FOR EACH ROW EXECUTE FUNCTION services_servicerequest_search_vector_update();
+
+
+--
+-- documents_document arama vektörü (full-text search, turkish)
+--
+CREATE OR REPLACE FUNCTION documents_document_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector =
+        setweight(to_tsvector('turkish', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS documents_document_search_vector ON documents_document;
+CREATE TRIGGER documents_document_search_vector
+    BEFORE INSERT OR UPDATE OF name, description ON documents_document
+    FOR EACH ROW EXECUTE FUNCTION documents_document_search_vector_update();
+
+
+--
+-- blog_blogpost arama vektörü (full-text search, turkish)
+--
+CREATE OR REPLACE FUNCTION blog_blogpost_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector =
+        setweight(to_tsvector('turkish', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.excerpt, '')), 'B') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.content, '')), 'C');
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS blog_blogpost_search_vector ON blog_blogpost;
+CREATE TRIGGER blog_blogpost_search_vector
+    BEFORE INSERT OR UPDATE OF title, excerpt, content ON blog_blogpost
+    FOR EACH ROW EXECUTE FUNCTION blog_blogpost_search_vector_update();
+
+
+--
+-- firms_firm arama vektörü (full-text search, turkish)
+--
+CREATE OR REPLACE FUNCTION firms_firm_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector =
+        setweight(to_tsvector('turkish', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.contact_person, '')), 'B') ||
+        setweight(to_tsvector('turkish', coalesce(NEW.city, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(NEW.email, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(NEW.tax_number, '')), 'C');
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS firms_firm_search_vector ON firms_firm;
+CREATE TRIGGER firms_firm_search_vector
+    BEFORE INSERT OR UPDATE OF name, contact_person, city, email, tax_number ON firms_firm
+    FOR EACH ROW EXECUTE FUNCTION firms_firm_search_vector_update();
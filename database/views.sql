@@ -2,39 +2,89 @@
 -- Raporlama ve dashboard verileri için
 
 --
--- Dashboard istatistikleri view'ı
+-- Dashboard istatistikleri (materialized view)
+-- Tek satırlık özet; `python manage.py refresh_dashboard_views` ile
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY kullanılarak yenilenir.
+-- CONCURRENTLY için benzersiz index gereklidir (id = 1 sabit satır).
 --
-CREATE OR REPLACE VIEW dashboard_stats AS
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_views WHERE viewname = 'dashboard_stats') THEN
+        DROP VIEW dashboard_stats;
+    END IF;
+END $$;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS dashboard_stats AS
 SELECT 
+    1 as id,
+    (SELECT COUNT(*) FROM firms_firm) as total_firms,
     (SELECT COUNT(*) FROM firms_firm WHERE status = 'active') as active_firms,
+    (SELECT COUNT(*) FROM services_service) as total_services,
     (SELECT COUNT(*) FROM services_service WHERE status = 'in_progress') as active_services,
     (SELECT COUNT(*) FROM services_servicerequest WHERE status = 'pending') as pending_requests,
+    (SELECT COUNT(*) FROM core_contactmessage WHERE status = 'new') as pending_messages,
     (SELECT COUNT(*) FROM services_service WHERE status = 'completed' 
      AND completion_date >= CURRENT_DATE - INTERVAL '30 days') as completed_this_month,
     (SELECT COUNT(*) FROM documents_document 
      WHERE upload_date >= CURRENT_DATE - INTERVAL '7 days') as documents_this_week,
-    (SELECT COUNT(*) FROM blog_blogpost WHERE status = 'published') as published_posts;
+    (SELECT COUNT(*) FROM blog_blogpost WHERE status = 'published') as published_posts,
+    now() as refreshed_at;
+
+CREATE UNIQUE INDEX IF NOT EXISTS dashboard_stats_id_idx ON dashboard_stats(id);
 
 --
--- Firma dashboard view'ı
+-- Firma dashboard verileri (materialized view)
+-- Her tablo firma bazında ayrı ayrı gruplanır ve sonra birleştirilir;
+-- hizmet x talep x doküman çarpımı ve COUNT(DISTINCT) oluşmaz.
 --
-CREATE OR REPLACE VIEW firm_dashboard_data AS
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_views WHERE viewname = 'firm_dashboard_data') THEN
+        DROP VIEW firm_dashboard_data;
+    END IF;
+END $$;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS firm_dashboard_data AS
 SELECT 
     f.id as firm_id,
     f.name as firm_name,
     f.contact_person,
-    COUNT(DISTINCT s.id) as total_services,
-    COUNT(DISTINCT sr.id) as total_requests,
-    COUNT(DISTINCT d.id) as total_documents,
-    COUNT(DISTINCT CASE WHEN s.status = 'completed' THEN s.id END) as completed_services,
-    COUNT(DISTINCT CASE WHEN s.status = 'in_progress' THEN s.id END) as in_progress_services,
-    MAX(s.completion_date) as last_service_date,
-    f.registration_date
+    COALESCE(s.total_services, 0) as total_services,
+    COALESCE(sr.total_requests, 0) as total_requests,
+    COALESCE(sr.active_requests, 0) as active_requests,
+    COALESCE(d.total_documents, 0) as total_documents,
+    COALESCE(s.completed_services, 0) as completed_services,
+    COALESCE(s.in_progress_services, 0) as in_progress_services,
+    s.last_service_date,
+    f.registration_date,
+    now() as refreshed_at
 FROM firms_firm f
-LEFT JOIN services_service s ON f.id = s.firm_id
-LEFT JOIN services_servicerequest sr ON f.id = sr.firm_id
-LEFT JOIN documents_document d ON f.id = d.firm_id AND d.is_visible_to_firm = true
-GROUP BY f.id, f.name, f.contact_person, f.registration_date;
+LEFT JOIN (
+    SELECT 
+        firm_id,
+        COUNT(*) as total_services,
+        COUNT(*) FILTER (WHERE status = 'completed') as completed_services,
+        COUNT(*) FILTER (WHERE status = 'in_progress') as in_progress_services,
+        MAX(completion_date) as last_service_date
+    FROM services_service
+    GROUP BY firm_id
+) s ON s.firm_id = f.id
+LEFT JOIN (
+    SELECT 
+        firm_id,
+        COUNT(*) as total_requests,
+        COUNT(*) FILTER (WHERE status IN ('pending', 'approved', 'in_progress')) as active_requests
+    FROM services_servicerequest
+    GROUP BY firm_id
+) sr ON sr.firm_id = f.id
+LEFT JOIN (
+    SELECT firm_id, COUNT(*) as total_documents
+    FROM documents_document
+    WHERE is_visible_to_firm = true
+    GROUP BY firm_id
+) d ON d.firm_id = f.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS firm_dashboard_data_firm_idx ON firm_dashboard_data(firm_id);
 
 --
 -- Hizmet raporlama view'ı
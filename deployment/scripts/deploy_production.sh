@@ -68,6 +68,8 @@ python manage.py migrate --check || {
     if [ "$APPLY_MIGRATIONS" = "y" ]; then
         python manage.py migrate --noinput
         echo -e "${GREEN}✅ Migration'lar uygulandı${NC}"
+        # Yeni görsel boyut alanları: eksik kayıtları doldur (idempotent)
+        python manage.py backfill_image_metadata
     fi
 }
 
@@ -97,6 +99,10 @@ else
     exit 1
 fi
 
+# Yeni şablonlar: cache'teki sayfalar, parçalar ve ETag'ler yenilensin
+# (yeniden başlatmadan sonra; eski worker'lar eski HTML'i tekrar cache'lemesin)
+python manage.py invalidate_cache
+
 # Nginx reload
 echo -e "\n${BLUE}🔄 Nginx reload...${NC}"
 nginx -t && systemctl reload nginx
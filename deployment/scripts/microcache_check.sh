@@ -0,0 +1,80 @@
+#!/bin/bash
+
+################################################################################
+# BYF Mühendislik - nginx Microcache Testi
+# Anonim sayfaların nginx önbelleğinden (X-Cache-Status) servis edildiğini,
+# oturum çerezinde önbelleğin atlandığını ve Django'nun yenileme isteğinin
+# (core.purge, X-Cache-Refresh) kopyayı güncellediğini kontrol eder.
+#
+# Kullanım:
+#   ./microcache_check.sh                          # http://localhost, 50 istek/sayfa
+#   BASE_URL=https://byfmuhendislik.com REQUESTS=200 ./microcache_check.sh
+################################################################################
+
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+YELLOW='\033[1;33m'
+BLUE='\033[0;34m'
+NC='\033[0m'
+
+BASE_URL="${BASE_URL:-http://localhost}"
+REQUESTS="${REQUESTS:-50}"
+MIN_HIT_RATIO="${MIN_HIT_RATIO:-90}"
+PATHS="${PATHS:-/ /hakkimizda/ /hizmetlerimiz/ /blog/}"
+CURL_OPTS=(-s -o /dev/null -D - -H "Accept-Encoding: gzip")
+
+cache_status() {
+    curl "${CURL_OPTS[@]}" "$@" | tr -d '\r' | awk -F': ' 'tolower($1) == "x-cache-status" {print $2}'
+}
+
+echo -e "${BLUE}========================================${NC}"
+echo -e "${BLUE}🧪 nginx Microcache Testi: $BASE_URL${NC}"
+echo -e "${BLUE}========================================${NC}"
+
+TOTAL=0
+HITS=0
+FAILED=0
+for path in $PATHS; do
+    cache_status "$BASE_URL$path" > /dev/null  # Isınma
+    declare -A COUNTS=()
+    for _ in $(seq "$REQUESTS"); do
+        status=$(cache_status "$BASE_URL$path")
+        COUNTS[${status:-NONE}]=$(( ${COUNTS[${status:-NONE}]:-0} + 1 ))
+    done
+    hits=$(( ${COUNTS[HIT]:-0} + ${COUNTS[UPDATING]:-0} + ${COUNTS[STALE]:-0} + ${COUNTS[REVALIDATED]:-0} ))
+    TOTAL=$(( TOTAL + REQUESTS ))
+    HITS=$(( HITS + hits ))
+    summary=""
+    for status in "${!COUNTS[@]}"; do summary+="$status=${COUNTS[$status]} "; done
+    echo -e "${path}\t${summary}"
+    unset COUNTS
+done
+
+RATIO=$(( HITS * 100 / TOTAL ))
+if [ "$RATIO" -ge "$MIN_HIT_RATIO" ]; then
+    echo -e "${GREEN}✅ Hit oranı: %$RATIO ($HITS/$TOTAL)${NC}"
+else
+    echo -e "${RED}❌ Hit oranı: %$RATIO ($HITS/$TOTAL), beklenen en az %$MIN_HIT_RATIO${NC}"
+    echo -e "${YELLOW}   Cache-Control s-maxage ve Set-Cookie başlıklarını kontrol edin: curl -I $BASE_URL/${NC}"
+    FAILED=1
+fi
+
+# Oturum çerezi: önbellek atlanmalı (giriş yapmış kullanıcıya anonim sayfa gitmez)
+status=$(cache_status -H "Cookie: sessionid=test" "$BASE_URL/")
+if [ "$status" = "BYPASS" ]; then
+    echo -e "${GREEN}✅ Oturum çerezi önbelleği atlıyor${NC}"
+else
+    echo -e "${RED}❌ Oturum çerezli istek: ${status:-X-Cache-Status yok} (BYPASS bekleniyordu)${NC}"
+    FAILED=1
+fi
+
+# Django'nun yenileme isteği (iç ağdan): kopyayı günceller, sonraki istek HIT
+status=$(cache_status -H "X-Cache-Refresh: 1" "$BASE_URL/")
+after=$(cache_status "$BASE_URL/")
+if [ "$status" = "BYPASS" ] && [ "$after" = "HIT" ]; then
+    echo -e "${GREEN}✅ Yenileme isteği kopyayı güncelliyor${NC}"
+else
+    echo -e "${YELLOW}⚠️  Yenileme: ${status:-?} → ${after:-?} (iç ağ dışından çalıştırıldıysa beklenen sonuç)${NC}"
+fi
+
+exit $FAILED
@@ -63,6 +63,7 @@ apt-get install -y \
     wget \
     htop \
     fail2ban \
+    poppler-utils \
     build-essential
 
 echo -e "\n${BLUE}🗃️  3/10: PostgreSQL yapılandırılıyor...${NC}"
@@ -152,6 +153,7 @@ DEFAULT_FROM_EMAIL=info@$DOMAIN_NAME
 PASSWORD_MIN_LENGTH=12
 SESSION_COOKIE_AGE=1209600
 USE_S3=False
+FILE_DOWNLOAD_BACKEND=nginx
 EOF
 
 chmod 600 /opt/byf_muhendislik/backend/.env
@@ -227,6 +229,13 @@ server {
         add_header Cache-Control "public";
     }
     
+    # Korumalı indirmeler: Django yetkiyi kontrol eder, dosyayı nginx gönderir (X-Accel-Redirect)
+    location /protected-media/ {
+        internal;
+        alias /opt/byf_muhendislik/backend/media/;
+        add_header Cache-Control "private, no-store";
+    }
+    
     location / {
         proxy_pass http://unix:/opt/byf_muhendislik/gunicorn.sock;
         proxy_set_header Host \$host;